@@ -0,0 +1,10 @@
+"""
+Offline benchmarks.
+
+벤치마크는 실제 AWS/Notion에 접속하지 않으므로 필수 설정값이 없어도
+config.Settings를 불러올 수 있도록 더미 값을 채웁니다.
+"""
+import os
+
+for _name in ("S3_BUCKET_NAME", "NOTION_API_KEY", "NOTION_DATABASE_ID"):
+    os.environ.setdefault(_name, "benchmark")
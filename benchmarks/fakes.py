@@ -0,0 +1,335 @@
+"""
+Local stand-ins for S3, Transcribe, Bedrock and Notion.
+
+각 가짜 서비스는 실제 서비스와 같은 메서드를 제공하고 FaultProfile로
+지연 시간과 오류율을 주입합니다. 트랜스크립트 파싱, LLM 청크 분할/병합,
+Notion 재시도/속도 제한 등 애플리케이션 코드는 실제 구현을 그대로 사용합니다.
+"""
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import uuid
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+from langchain_core.messages import AIMessage
+from benchmarks.synthetic import generate_transcript
+from services.chunking import estimate_tokens
+from services.notion import NotionService
+from services.stt import TranscriptionService
+
+
+class InjectedFault(Exception):
+    """Raised by a fake service when the fault profile decides to fail a call."""
+
+
+class FaultProfile:
+    """
+    Latency and error injection for a fake service.
+
+    Args:
+        latency: Mean latency in seconds
+        jitter: Standard deviation of the latency in seconds
+        error_rate: Probability (0.0-1.0) that a call fails
+        seed: Random seed
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        """Draw one latency value."""
+        with self._lock:
+            value = self._random.gauss(self.latency, self.jitter) if self.jitter else self.latency
+        return max(0.0, value)
+
+    def fails(self) -> bool:
+        """Whether the next call should fail."""
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def wait(self) -> None:
+        """Sleep for one sampled latency."""
+        delay = self.sample()
+        if delay:
+            time.sleep(delay)
+
+    async def await_latency(self) -> None:
+        """Async variant of wait."""
+        delay = self.sample()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class TranscriptServer:
+    """
+    HTTP server serving synthetic Transcribe output documents.
+
+    모든 작업이 같은 문서를 받으므로 생성 비용은 한 번만 듭니다.
+    실제 파서는 requests/ijson으로 이 서버에서 스트리밍해서 읽습니다.
+
+    Args:
+        speakers: Number of speakers in the synthetic meeting
+        minutes: Meeting length in minutes
+    """
+
+    def __init__(self, speakers: int = 3, minutes: float = 10):
+        self.document = json.dumps(generate_transcript(speakers=speakers, minutes=minutes)).encode()
+        document = self.document
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(document)))
+                self.end_headers()
+                self.wfile.write(document)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def uri(self, job_name: str) -> str:
+        """Transcript URI for a job."""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/transcripts/{job_name}.json"
+
+    def start(self) -> "TranscriptServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="transcript-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "TranscriptServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class FakeS3Service:
+    """S3Service stand-in that reads and discards uploaded bytes."""
+
+    def __init__(self, profile: Optional[FaultProfile] = None, bucket_name: str = "benchmark"):
+        self.profile = profile or FaultProfile()
+        self.bucket_name = bucket_name
+        self.uploaded_bytes = 0
+
+    def upload_file(self, file_path: str, object_name: str) -> str:
+        self.profile.wait()
+        if self.profile.fails():
+            raise Exception("Failed to upload to S3: injected fault")
+        return f"s3://{self.bucket_name}/{object_name}"
+
+    def delete_object(self, object_name: str) -> None:
+        self.profile.wait()
+
+    async def upload_stream(self, file, object_name: str, chunk_size: int = None) -> str:
+        chunk_size = chunk_size or 5 * 1024 * 1024
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            self.uploaded_bytes += len(chunk)
+
+        await self.profile.await_latency()
+        if self.profile.fails():
+            raise Exception("Failed to stream upload to S3: injected fault")
+        return f"s3://{self.bucket_name}/{object_name}"
+
+
+class _NullPoller:
+    """Poller stand-in; the fake transcription service never polls."""
+
+    def track(
+        self,
+        job_name: str,
+        expected_duration: Optional[float] = None,
+        check_now: bool = False,
+        on_done: Optional[Callable[[Dict], None]] = None
+    ) -> None:
+        pass
+
+    def notify(self, job_name: str, status: str) -> bool:
+        return False
+
+    def stop(self) -> None:
+        pass
+
+
+class FakeTranscriptionService(TranscriptionService):
+    """
+    TranscriptionService whose jobs complete after a sampled latency.
+
+    작업 시작/대기만 가짜이며 parse_transcript_with_speakers는 실제 구현이
+    TranscriptServer에서 합성 트랜스크립트를 내려받아 파싱합니다.
+    """
+
+    def __init__(self, server: TranscriptServer, profile: Optional[FaultProfile] = None):
+        self.server = server
+        self.profile = profile or FaultProfile()
+        self.client = None
+        self.s3_service = None
+        self.poller = _NullPoller()
+
+    def start_transcription_job(self, audio_file_path: str, job_name: str) -> bool:
+        return True
+
+    def start_transcription(
+        self,
+        audio_file_path: str,
+        job_name: str,
+        expected_duration: Optional[float] = None,
+        on_done: Optional[Callable[[Dict], None]] = None
+    ) -> None:
+        # 실제 폴러처럼 별도 스레드에서 지연 후 완료 콜백 호출
+        if on_done is not None:
+            timer = threading.Timer(self.profile.sample(), lambda: on_done(self._result(job_name)))
+            timer.daemon = True
+            timer.start()
+
+    def wait_for_transcription(self, job_name: str, timeout: Optional[float] = None) -> Dict:
+        self.profile.wait()
+        return self._result(job_name)
+
+    def _result(self, job_name: str) -> Dict:
+        if self.profile.fails():
+            return {'status': 'failed', 'error': 'Injected transcription failure'}
+        return {
+            'status': 'success',
+            'transcript_uri': self.server.uri(job_name),
+            'job_name': job_name
+        }
+
+
+class FakeChatBedrock:
+    """
+    ChatBedrock stand-in answering summary and action item prompts.
+
+    액션 아이템 프롬프트에는 트랜스크립트의 앞 발화들로 만든 JSON 배열을,
+    그 외 프롬프트에는 고정된 요약을 반환하며 토큰 사용량도 함께 보고합니다.
+
+    Args:
+        profile: Latency/error profile per call
+        items_per_call: Action items returned per extraction call
+    """
+
+    _LINE = re.compile(r"^\[(?P<speaker>[^\]]+)\]: (?P<text>.+)$", re.MULTILINE)
+
+    def __init__(self, profile: Optional[FaultProfile] = None, items_per_call: int = 5):
+        self.profile = profile or FaultProfile()
+        self.items_per_call = items_per_call
+
+    def invoke(self, messages: List) -> AIMessage:
+        self.profile.wait()
+        return self._respond(messages)
+
+    async def ainvoke(self, messages: List) -> AIMessage:
+        await self.profile.await_latency()
+        return self._respond(messages)
+
+    def _respond(self, messages: List) -> AIMessage:
+        if self.profile.fails():
+            raise InjectedFault("Injected Bedrock failure")
+
+        prompt = messages[-1].content
+        if "JSON 형식으로만" in prompt:
+            content = json.dumps([
+                {
+                    "assignee": match.group("speaker"),
+                    "task": " ".join(match.group("text").split()[:8]),
+                    "due_date": None,
+                    "confidence": 0.9
+                }
+                for match in self._LINE.finditer(prompt)
+            ][:self.items_per_call], ensure_ascii=False)
+        else:
+            content = "- 주요 논의 사항: 합성 회의\n- 결정된 사항: 없음\n- 기타 중요 포인트: 없음"
+
+        input_tokens = sum(estimate_tokens(message.content) for message in messages)
+        output_tokens = estimate_tokens(content)
+        return AIMessage(content=content, usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens
+        })
+
+
+class FakeBedrockService:
+    """BedrockService stand-in returning a FakeChatBedrock."""
+
+    def __init__(self, llm: FakeChatBedrock):
+        self.llm = llm
+
+    def get_llm(self) -> FakeChatBedrock:
+        return self.llm
+
+
+class _FakeResponse:
+    """Minimal requests.Response used by the fake Notion session."""
+
+    def __init__(self, status_code: int, body: Dict, headers: Optional[Dict] = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self.text = json.dumps(body)
+
+    def json(self) -> Dict:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeNotionSession:
+    """
+    requests.Session stand-in for the Notion API.
+
+    실패로 결정된 요청은 error_status(기본 429)와 Retry-After 헤더를 반환하므로
+    NotionService의 재시도와 속도 제한 로직이 그대로 동작합니다.
+    """
+
+    def __init__(self, profile: Optional[FaultProfile] = None, error_status: int = 429, retry_after: float = 0.5):
+        self.profile = profile or FaultProfile()
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.headers = {}
+
+    def request(self, method: str, url: str, timeout: float = None, **kwargs) -> _FakeResponse:
+        self.profile.wait()
+        if self.profile.fails():
+            return _FakeResponse(
+                self.error_status,
+                {"object": "error", "status": self.error_status, "message": "Injected fault"},
+                {"Retry-After": f"{self.retry_after:g}"}
+            )
+        if method == "GET":
+            return _FakeResponse(200, {"properties": {}})
+        return _FakeResponse(200, {"object": "page", "id": str(uuid.uuid4())})
+
+
+class FakeNotionService(NotionService):
+    """NotionService whose HTTP session is a FakeNotionSession."""
+
+    def __init__(self, profile: Optional[FaultProfile] = None, rate_limit: Optional[float] = None):
+        super().__init__()
+        self.session = FakeNotionSession(profile)
+        if rate_limit:
+            self.rate_limiter.rate = rate_limit
+            self.rate_limiter.capacity = rate_limit
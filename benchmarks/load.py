@@ -0,0 +1,296 @@
+"""
+Offline load benchmark of the API and pipeline with fake AWS/Notion services.
+
+Usage:
+    python -m benchmarks.load
+    python -m benchmarks.load --scenario workflow --jobs 50 --concurrency 10 --llm-latency 2
+    python -m benchmarks.load --scenario tasks --tasks 20000 --requests 2000
+    python -m benchmarks.load --scenario parse --minutes 90 --tracemalloc
+"""
+import argparse
+import logging
+import math
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# 벤치마크 전용 데이터베이스와 설정 (main/config import 전에 지정)
+_WORKDIR = tempfile.mkdtemp(prefix="action-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_WORKDIR}/bench.db")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("LLM_CACHE_PATH", f"{_WORKDIR}/llm_cache.db")
+os.environ.setdefault("SERVICE_WARMUP", "false")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+from benchmarks.fakes import (  # noqa: E402
+    FakeBedrockService, FakeChatBedrock, FakeNotionService, FakeS3Service,
+    FakeTranscriptionService, FaultProfile, TranscriptServer
+)
+
+TERMINAL_JOB_STATUSES = {"completed", "failed"}
+
+
+class Result:
+    """Latencies and errors of one measured operation."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.elapsed = 0.0
+        self.peak_mb: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+            if not ok:
+                self.errors += 1
+
+    def row(self) -> str:
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        p50 = _percentile(latencies, 50) * 1000
+        p99 = _percentile(latencies, 99) * 1000
+        mean = statistics.fmean(latencies) * 1000 if latencies else 0.0
+        throughput = count / self.elapsed if self.elapsed else 0.0
+        peak = f"{self.peak_mb:.1f}" if self.peak_mb is not None else "-"
+        return (f"{self.name:<24} {count:>7} {self.errors:>6} {p50:>10.1f} {p99:>10.1f} "
+                f"{mean:>10.1f} {throughput:>9.1f} {peak:>9}")
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB, macOS bytes)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def run_load(result: Result, operation: Callable[[int], bool], count: int, concurrency: int,
+             trace_memory: bool = False) -> Result:
+    """
+    Run operation(i) count times on a thread pool and record latencies.
+
+    Args:
+        result: Result to fill
+        operation: Callable returning True on success (exceptions count as errors)
+        count: Number of calls
+        concurrency: Worker threads
+        trace_memory: Report tracemalloc peak instead of process peak RSS
+    """
+    def timed(i: int) -> None:
+        started = time.perf_counter()
+        try:
+            ok = operation(i)
+        except Exception:
+            ok = False
+        result.record(time.perf_counter() - started, ok)
+
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(count)))
+    result.elapsed = time.perf_counter() - started
+    if trace_memory:
+        result.peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    else:
+        result.peak_mb = _peak_rss_mb()
+    return result
+
+
+def install_fakes(app_module, args, server: TranscriptServer) -> Dict:
+    """Replace the application's AWS/Notion services with fakes."""
+    fakes = {
+        "s3": FakeS3Service(FaultProfile(args.s3_latency, args.s3_latency / 4, args.error_rate, seed=1)),
+        "transcription": FakeTranscriptionService(
+            server, FaultProfile(args.transcribe_latency, args.transcribe_latency / 4, args.error_rate, seed=2)
+        ),
+        "bedrock": FakeBedrockService(FakeChatBedrock(
+            FaultProfile(args.llm_latency, args.llm_latency / 4, args.error_rate, seed=3)
+        )),
+        "notion": FakeNotionService(
+            FaultProfile(args.notion_latency, args.notion_latency / 4, args.error_rate, seed=4),
+            rate_limit=args.notion_rate
+        ),
+    }
+    # LLM 서비스는 실제 구현을 사용하고 Bedrock만 가짜로 교체
+    for name, fake in fakes.items():
+        app_module.services.register(name, lambda registry, fake=fake: fake)
+    return fakes
+
+
+def bench_parse(args, server: TranscriptServer) -> List[Result]:
+    """Time parse_transcript_with_speakers against the local transcript server."""
+    transcription = FakeTranscriptionService(server)
+    uri = server.uri("parse")
+    segments = len(transcription.parse_transcript_with_speakers(uri))
+
+    result = Result(f"parse ({args.minutes:g} min)")
+    run_load(
+        result,
+        lambda i: bool(transcription.parse_transcript_with_speakers(uri)),
+        args.requests,
+        args.concurrency,
+        args.tracemalloc
+    )
+    print(f"transcript: {len(server.document) / 1e6:.1f} MB JSON, {segments} segments")
+    return [result]
+
+
+def bench_workflow(args, client, app_module) -> List[Result]:
+    """Submit audio files to /process-full-workflow and wait for each job."""
+    audio = os.urandom(args.audio_kb * 1024)
+    upload = Result("upload")
+    end_to_end = Result(f"workflow ({args.destination})")
+
+    def run_job(i: int) -> bool:
+        started = time.perf_counter()
+        response = client.post(
+            "/process-full-workflow",
+            params={"destination": args.destination},
+            # 업로드 중복 제거에 걸리지 않도록 작업마다 내용을 다르게 함
+            files={"file": (f"meeting_{i}.mp3", audio + i.to_bytes(8, "little"), "audio/mpeg")}
+        )
+        upload.record(time.perf_counter() - started, response.status_code == 200)
+        if response.status_code != 200:
+            return False
+
+        job_id = response.json()["job_id"]
+        while True:
+            job = app_module.job_manager.get_job(job_id)
+            if job and job["status"] in TERMINAL_JOB_STATUSES:
+                return job["status"] == "completed"
+            time.sleep(args.poll_interval)
+
+    run_load(end_to_end, run_job, args.jobs, args.concurrency, args.tracemalloc)
+    upload.elapsed = end_to_end.elapsed
+    upload.peak_mb = end_to_end.peak_mb
+    return [upload, end_to_end]
+
+
+def bench_tasks(args, client) -> List[Result]:
+    """Seed tasks and load the /tasks read and write endpoints."""
+    import database
+
+    db = database.SessionLocal()
+    try:
+        items = [{"assignee": f"spk_{i % 5}", "task": f"benchmark task {i}"} for i in range(args.tasks)]
+        ids = [task["id"] for task in database.bulk_create_tasks(db, items, job_name="benchmark")]
+    finally:
+        db.close()
+
+    version = client.get("/tasks", params={"limit": 1}).json()["version"]
+    statuses = ["To Do", "In Progress", "Done"]
+
+    def list_page(i: int) -> bool:
+        return client.get("/tasks", params={"limit": args.page_size}).status_code == 200
+
+    def walk_pages(i: int) -> bool:
+        cursor = None
+        for _ in range(args.pages):
+            params = {"limit": args.page_size, **({"cursor": cursor} if cursor else {})}
+            response = client.get("/tasks", params=params)
+            if response.status_code != 200:
+                return False
+            cursor = response.json()["next_cursor"]
+            if not cursor:
+                break
+        return True
+
+    def delta(i: int) -> bool:
+        return client.get("/tasks", params={"since": version}).status_code == 200
+
+    def update_status(i: int) -> bool:
+        response = client.patch(f"/tasks/{ids[i % len(ids)]}/status", json={"status": statuses[i % 3]})
+        return response.status_code == 200
+
+    scenarios = [
+        ("GET /tasks", list_page),
+        (f"GET /tasks x{args.pages} pages", walk_pages),
+        ("GET /tasks?since", delta),
+        ("PATCH /tasks/{id}/status", update_status),
+    ]
+    results = []
+    for name, operation in scenarios:
+        results.append(run_load(Result(name), operation, args.requests, args.concurrency, args.tracemalloc))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--scenario', choices=['all', 'parse', 'workflow', 'tasks'], default='all')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200, help='Calls per parse/tasks scenario')
+    parser.add_argument('--tracemalloc', action='store_true', help='Report traced Python memory peak per scenario')
+    parser.add_argument('--log-level', default='WARNING', help='Application log level during the run')
+
+    meeting = parser.add_argument_group('synthetic meeting')
+    meeting.add_argument('--speakers', type=int, default=4)
+    meeting.add_argument('--minutes', type=float, default=30)
+
+    workflow = parser.add_argument_group('workflow')
+    workflow.add_argument('--jobs', type=int, default=20)
+    workflow.add_argument('--destination', choices=['internal', 'notion'], default='internal')
+    workflow.add_argument('--audio-kb', type=int, default=512)
+    workflow.add_argument('--poll-interval', type=float, default=0.02)
+
+    tasks = parser.add_argument_group('tasks')
+    tasks.add_argument('--tasks', type=int, default=5000, help='Tasks seeded before the /tasks scenarios')
+    tasks.add_argument('--page-size', type=int, default=100)
+    tasks.add_argument('--pages', type=int, default=5)
+
+    fakes = parser.add_argument_group('fake services (seconds / probability)')
+    fakes.add_argument('--s3-latency', type=float, default=0.05)
+    fakes.add_argument('--transcribe-latency', type=float, default=0.5)
+    fakes.add_argument('--llm-latency', type=float, default=0.3)
+    fakes.add_argument('--notion-latency', type=float, default=0.1)
+    fakes.add_argument('--notion-rate', type=float, default=None, help='Override the Notion requests/s limit')
+    fakes.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+    import main as app_module
+
+    # 애플리케이션의 INFO 로그가 결과 출력을 덮지 않도록 조정
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    print(f"database: {os.environ['DATABASE_URL']}")
+    results = []
+    with TranscriptServer(speakers=args.speakers, minutes=args.minutes) as server:
+        if args.scenario in ('all', 'parse'):
+            results += bench_parse(args, server)
+
+        if args.scenario in ('all', 'workflow', 'tasks'):
+            install_fakes(app_module, args, server)
+            with TestClient(app_module.app) as client:
+                if args.scenario in ('all', 'workflow'):
+                    results += bench_workflow(args, client, app_module)
+                if args.scenario in ('all', 'tasks'):
+                    results += bench_tasks(args, client)
+
+    peak_label = "traced MB" if args.tracemalloc else "RSS MB"
+    print(f"{'operation':<24} {'count':>7} {'errors':>6} {'p50 (ms)':>10} {'p99 (ms)':>10} "
+          f"{'mean (ms)':>10} {'ops/s':>9} {peak_label:>9}")
+    for result in results:
+        print(result.row())
+
+
+if __name__ == '__main__':
+    main()
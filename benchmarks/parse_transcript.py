@@ -0,0 +1,112 @@
+"""
+Benchmark transcript parsing against the previous O(segments x items) scan.
+
+Usage:
+    python -m benchmarks.parse_transcript --minutes 10 30 90
+    python -m benchmarks.parse_transcript --minutes 90 --memory
+"""
+import argparse
+import io
+import json
+import time
+import tracemalloc
+from typing import Dict, List
+from benchmarks.synthetic import generate_transcript
+from services.stt import TranscriptionService
+
+
+def legacy_parse(transcript_data: Dict) -> List[Dict]:
+    """Previous parser: linear scan of results.items for every segment word."""
+    results = transcript_data['results']
+    speaker_texts = []
+    for segment in results['speaker_labels']['segments']:
+        start_time = float(segment['start_time'])
+        end_time = float(segment['end_time'])
+        words = []
+        for item in segment.get('items', []):
+            item_index = item.get('start_time')
+            for result_item in results['items']:
+                if (result_item.get('type') == 'pronunciation' and
+                        result_item.get('start_time') == item_index):
+                    words.append(result_item['alternatives'][0]['content'])
+                    break
+        if not words:
+            for result_item in results['items']:
+                if result_item.get('type') == 'pronunciation':
+                    item_start = float(result_item.get('start_time', 0))
+                    if start_time <= item_start <= end_time:
+                        words.append(result_item['alternatives'][0]['content'])
+        text = ' '.join(words)
+        if text.strip():
+            speaker_texts.append({
+                'speaker': segment['speaker_label'],
+                'text': text.strip(),
+                'start_time': start_time,
+                'end_time': end_time
+            })
+    return speaker_texts
+
+
+def _time(func, data, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _peak_memory(func) -> float:
+    """Peak traced memory of func() in MB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def compare_memory(minutes: float, speakers: int) -> None:
+    """Compare peak memory of full JSON parsing and ijson streaming."""
+    import ijson
+
+    raw = json.dumps(generate_transcript(speakers=speakers, minutes=minutes)).encode()
+
+    full = _peak_memory(lambda: TranscriptionService.parse_transcript_data(json.loads(raw)))
+    streamed = _peak_memory(lambda: sum(
+        1 for _ in TranscriptionService.iter_transcript_events(ijson.parse(io.BytesIO(raw)))
+    ))
+    print(f"{minutes:g} min transcript ({len(raw) / 1e6:.1f} MB JSON): "
+          f"json.loads peak {full:.1f} MB, streaming peak {streamed:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--minutes', type=float, nargs='+', default=[10, 30, 90])
+    parser.add_argument('--speakers', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true', help='Only time the current parser')
+    parser.add_argument('--memory', action='store_true', help='Compare peak memory of streaming parsing')
+    args = parser.parse_args()
+
+    if args.memory:
+        for minutes in args.minutes:
+            compare_memory(minutes, args.speakers)
+        return
+
+    print(f"{'minutes':>8} {'items':>8} {'legacy (s)':>12} {'indexed (s)':>12} {'speedup':>9}")
+    for minutes in args.minutes:
+        data = generate_transcript(speakers=args.speakers, minutes=minutes)
+        items = len(data['results']['items'])
+
+        indexed = _time(TranscriptionService.parse_transcript_data, data, args.repeat)
+        if args.skip_legacy:
+            print(f"{minutes:>8g} {items:>8} {'-':>12} {indexed:>12.4f} {'-':>9}")
+            continue
+
+        legacy = _time(legacy_parse, data, 1)
+        print(f"{minutes:>8g} {items:>8} {legacy:>12.4f} {indexed:>12.4f} {legacy / indexed:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import random
+from typing import Dict
+
+# 합성 트랜스크립트에 사용할 단어 목록
+_WORDS = [
+    "회의", "자료", "조사", "보고서", "내일", "까지", "준비", "해주세요", "다음", "주",
+    "월요일", "발표", "디자인", "검토", "일정", "확인", "고객", "미팅", "정리", "공유",
+]
+
+
+def generate_transcript(
+    speakers: int = 3,
+    minutes: float = 10,
+    words_per_minute: int = 150,
+    seed: int = 0
+) -> Dict:
+    """
+    Generate a synthetic Amazon Transcribe output document.
+
+    Transcribe 화자 분리 결과와 같은 구조(results.items, results.speaker_labels)를
+    가지며 세그먼트 끝마다 구두점 아이템이 들어갑니다.
+
+    Args:
+        speakers: Number of speakers
+        minutes: Audio length in minutes
+        words_per_minute: Speaking rate
+        seed: Random seed
+
+    Returns:
+        Transcribe output JSON as a dict
+    """
+    rng = random.Random(seed)
+    total_words = int(minutes * words_per_minute)
+    word_duration = 60.0 / words_per_minute
+
+    items = []
+    segments = []
+    t = 0.0
+    written = 0
+    while written < total_words:
+        speaker = f"spk_{rng.randrange(speakers)}"
+        length = min(rng.randint(5, 30), total_words - written)
+        segment_start = t
+        segment_items = []
+
+        for _ in range(length):
+            start, end = f"{t:.3f}", f"{t + word_duration * 0.8:.3f}"
+            items.append({
+                "start_time": start,
+                "end_time": end,
+                "alternatives": [{"confidence": "0.99", "content": rng.choice(_WORDS)}],
+                "type": "pronunciation"
+            })
+            segment_items.append({"start_time": start, "end_time": end, "speaker_label": speaker})
+            t += word_duration
+        items.append({
+            "alternatives": [{"confidence": "0.0", "content": "."}],
+            "type": "punctuation"
+        })
+
+        segments.append({
+            "start_time": f"{segment_start:.3f}",
+            "end_time": f"{t:.3f}",
+            "speaker_label": speaker,
+            "items": segment_items
+        })
+        written += length
+        t += 0.5
+
+    return {
+        "jobName": "synthetic",
+        "results": {
+            "transcripts": [{"transcript": " ".join(i["alternatives"][0]["content"] for i in items)}],
+            "speaker_labels": {"speakers": speakers, "segments": segments},
+            "items": items
+        },
+        "status": "COMPLETED"
+    }
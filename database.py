@@ -1,17 +1,106 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Enum
+from sqlalchemy import (
+    create_engine, delete, event, func, insert, select, tuple_, update,
+    Column, Integer, String, Float, DateTime, Enum, Text, JSON, Index, LargeBinary
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker, Session
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import base64
 import enum
+import json
+import logging
+from config import settings
+from migrations import run_migrations
+from services.metrics import instrument_engine
 
-# SQLite 데이터베이스 설정
-SQLALCHEMY_DATABASE_URL = "sqlite:///./action.db"
+logger = logging.getLogger(__name__)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# 데이터베이스 설정 (DATABASE_URL로 SQLite 또는 PostgreSQL 선택)
+SQLALCHEMY_DATABASE_URL = settings.database_url
+
+
+def _engine_options(url: str) -> Dict:
+    """
+    Backend-specific engine options.
+    
+    SQLite는 WAL 모드로 읽기와 쓰기가 서로를 막지 않게 하고, busy_timeout 동안
+    쓰기 잠금을 기다리므로 동시 쓰기에서 "database is locked" 오류가 나지 않습니다.
+    (쓰기 자체는 여전히 한 번에 하나이므로 쓰기가 많으면 PostgreSQL을 사용하세요.)
+    PostgreSQL 등 서버 DB는 커넥션 풀 크기를 설정값으로 조정합니다.
+    """
+    if make_url(url).get_backend_name() == "sqlite":
+        return {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": settings.sqlite_busy_timeout_ms / 1000
+            }
+        }
+    
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True
+    }
+
+
+def _sync_url(url: str):
+    """Map the configured URL to a sync driver (SQLAlchemy 2.0 maps plain postgresql:// to psycopg2, which is not installed)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "sqlite" and parsed.get_driver_name() == "aiosqlite":
+        return parsed.set(drivername="sqlite")
+    # requirements.txt에는 psycopg 3만 있으므로 드라이버를 지정하지 않았거나 비동기 전용 드라이버면 psycopg 사용
+    if backend == "postgresql" and parsed.drivername in ("postgresql", "postgresql+asyncpg"):
+        return parsed.set(drivername="postgresql+psycopg")
+    return parsed
+
+
+def _async_url(url: str):
+    """Map the configured URL to an asyncio driver (aiosqlite / psycopg async)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite")
+    # psycopg 3는 같은 드라이버로 동기/비동기를 모두 지원
+    # (기본 드라이버는 SQLAlchemy 버전마다 다르므로 URL에 적힌 드라이버로 판단)
+    if backend == "postgresql" and parsed.drivername not in ("postgresql+psycopg", "postgresql+asyncpg"):
+        return parsed.set(drivername="postgresql+psycopg")
+    return parsed
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the SQLite tuning profile to every new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.close()
+
+
+# 동기 엔진: 마이그레이션, 백그라운드 작업 워커, 내보내기 스트림에서 사용
+engine = create_engine(_sync_url(SQLALCHEMY_DATABASE_URL), **_engine_options(SQLALCHEMY_DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진: API 엔드포인트에서 사용 (threadpool을 점유하지 않음)
+async_engine = create_async_engine(
+    _async_url(SQLALCHEMY_DATABASE_URL), **_engine_options(SQLALCHEMY_DATABASE_URL)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+# 쿼리 소요 시간 메트릭 (/metrics)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
 Base = declarative_base()
 
 
@@ -33,19 +122,484 @@ class Task(Base):
     confidence = Column(Float, nullable=True)
     status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False)
     job_name = Column(String, nullable=True)  # 원본 회의 식별용
+    version = Column(Integer, nullable=False, default=0)  # 마지막으로 변경된 보드 버전
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # 목록 조회는 (created_at, id) 역순 키셋 페이지네이션을 사용하므로
+    # 필터 컬럼 + (created_at, id) 복합 인덱스로 정렬까지 인덱스에서 처리
+    __table_args__ = (
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_tasks_assignee_created_at_id", "assignee", "created_at", "id"),
+        Index("ix_tasks_job_name_created_at_id", "job_name", "created_at", "id"),
+        Index("ix_tasks_due_date", "due_date"),
+        Index("ix_tasks_version", "version"),
+        Index("ix_tasks_updated_at", "updated_at"),
+    )
+
+
+class BoardState(Base):
+    """Single-row board version counter, bumped on every task mutation."""
+    __tablename__ = "board_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    # 보관 기간이 지나 삭제된 tombstone의 최대 버전/시각 (이보다 오래된 since는 전체 재조회 필요)
+    pruned_version = Column(Integer, nullable=False, default=0)
+    pruned_at = Column(DateTime)
+
+
+class TaskTombstone(Base):
+    """Deleted task marker returned by delta sync (GET /tasks?since=...)."""
+    __tablename__ = "task_tombstones"
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False, index=True)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class JobStatus(str, enum.Enum):
+    """Background pipeline job status enum."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class Job(Base):
+    """Background pipeline job (transcribe -> extract -> save)."""
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String, unique=True, nullable=False)  # Transcribe 작업 이름
+    filename = Column(String, nullable=True)
+    s3_uri = Column(String, nullable=False)
+    destination = Column(String, nullable=True)  # "notion", "internal" 또는 None (STT만 수행)
+    upload_date = Column(String, nullable=True)
+    audio_duration = Column(Float, nullable=True)  # 파일 크기로 추정한 오디오 길이 (초)
+    content_hash = Column(String(64), nullable=True, index=True)  # 업로드 파일 SHA-256 (중복 업로드 감지)
+    status = Column(Enum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    stage = Column(String, nullable=True)  # 현재 진행 중인 단계
+    progress = Column(Float, default=0.0, nullable=False)
+    # 단계별 중간 결과 (재시작 시 완료된 단계는 건너뜀)
+    transcript_uri = Column(String, nullable=True)
+    summary = Column(Text, nullable=True)
+    action_items = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    # 목적지 저장 결과 (값이 있으면 재시작 시 해당 단계를 다시 실행하지 않음)
+    notion_result = Column(JSON, nullable=True)  # 생성 중이면 {"status": "partial", "results": [...]}
+    saved_tasks = Column(JSON, nullable=True)  # 내부 DB에 저장한 작업 요약 (작업 INSERT와 같은 트랜잭션에서 기록)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class Meeting(Base):
+    """Parsed transcript, summary and metadata of a meeting, keyed by Transcribe job name."""
+    __tablename__ = "meetings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String, unique=True, nullable=False)  # Transcribe 작업 이름
+    filename = Column(String, nullable=True)
+    s3_uri = Column(String, nullable=True)
+    transcript_uri = Column(String, nullable=True)
+    upload_date = Column(String, nullable=True)
+    speaker_count = Column(Integer, nullable=True)
+    segment_count = Column(Integer, nullable=True)
+    duration = Column(Float, nullable=True)  # 마지막 발화 종료 시각 (초)
+    # 화자별 발화 세그먼트 (services.transcript.Transcript.to_bytes로 직렬화한 열 단위 데이터)
+    segments = Column(LargeBinary, nullable=True)
+    summary = Column(Text, nullable=True)
+    action_items = Column(JSON, nullable=True)
+    prompt_version = Column(Integer, nullable=True)  # 분석에 사용한 LLM 프롬프트 버전
+    # 업로드 전처리로 무음을 제거한 경우 [전처리 후 시작, 원본 시작] 구간 목록 (초)
+    time_map = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 def init_db():
-    """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
+    """Create missing tables and apply pending migrations."""
+    applied = run_migrations(engine, Base.metadata)
+    if applied:
+        logger.info(f"Applied database migrations: {applied}")
+
 
+def task_filters(
+    status: Optional[str] = None,
+    assignee: Optional[str] = None,
+    job_name: Optional[str] = None,
+    due_from: Optional[str] = None,
+    due_to: Optional[str] = None
+) -> List:
+    """
+    Build SQL conditions for task list filters.
+    
+    Args:
+        status: Task status ("To Do", "In Progress", "Done")
+        assignee: Assignee name
+        job_name: Source meeting job name
+        due_from: Earliest due date (YYYY-MM-DD, inclusive)
+        due_to: Latest due date (YYYY-MM-DD, inclusive)
+        
+    Returns:
+        List of SQLAlchemy filter expressions
+    """
+    conditions = []
+    if status:
+        conditions.append(Task.status == TaskStatus(status))
+    if assignee:
+        conditions.append(Task.assignee == assignee)
+    if job_name:
+        conditions.append(Task.job_name == job_name)
+    # due_date는 YYYY-MM-DD 문자열이므로 문자열 비교로 범위 검색 가능
+    if due_from:
+        conditions.append(Task.due_date >= due_from)
+    if due_to:
+        conditions.append(Task.due_date <= due_to)
+    return conditions
 
-def get_db():
-    """Get database session."""
+
+def encode_task_cursor(task: Task) -> str:
+    """Encode the (created_at, id) keyset position of a task."""
+    payload = json.dumps([task.created_at.isoformat(), task.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_task_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor from encode_task_cursor (raises ValueError if invalid)."""
+    try:
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(task_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def task_cursor_filter(cursor: str):
+    """Condition selecting tasks after a cursor in (created_at, id) descending order."""
+    created_at, task_id = decode_task_cursor(cursor)
+    return tuple_(Task.created_at, Task.id) < (created_at, task_id)
+
+
+def get_board_version(db: Session) -> int:
+    """Return the current board version."""
+    return db.execute(select(BoardState.version).where(BoardState.id == 1)).scalar() or 0
+
+
+def next_board_version(db: Session) -> int:
+    """
+    Increment the board version inside the caller's transaction.
+    
+    카운터 행에 쓰기 잠금이 걸리므로 동시에 실행되는 변경 트랜잭션은
+    버전 순서대로 커밋되고, since 이후 변경 조회에서 누락되지 않습니다.
+    
+    Args:
+        db: Database session (committed by the caller)
+        
+    Returns:
+        New board version
+    """
+    return db.execute(
+        update(BoardState)
+        .where(BoardState.id == 1)
+        .values(version=BoardState.version + 1)
+        .returning(BoardState.version)
+    ).scalar_one()
+
+
+def add_task_tombstones(db: Session, task_ids: List[int], version: int) -> None:
+    """
+    Record deleted tasks for delta sync and prune expired tombstones (committed by the caller).
+    
+    호출 전에 next_board_version으로 board_state 행을 잠그므로 보관 기간 정리도
+    같은 트랜잭션에서 순서대로 실행됩니다.
+    """
+    if task_ids:
+        now = datetime.utcnow()
+        db.execute(
+            insert(TaskTombstone),
+            [{"task_id": task_id, "version": version, "deleted_at": now} for task_id in task_ids]
+        )
+        prune_task_tombstones(db, now - timedelta(days=settings.task_tombstone_retention_days))
+
+
+def prune_task_tombstones(db: Session, older_than: datetime) -> int:
+    """
+    Delete tombstones recorded before a cutoff and raise the board's pruned floor.
+    
+    삭제한 tombstone의 최대 버전/시각을 board_state에 기록해 두므로, 그보다 오래된
+    since로 조회한 클라이언트에는 삭제 누락 대신 전체 재조회(reset)를 알립니다.
+    이전에 정리된 tombstone은 이미 없으므로 새 최댓값이 항상 이전 기록 이상입니다.
+    
+    Args:
+        db: Database session (committed by the caller)
+        older_than: Tombstones with deleted_at before this time are removed
+        
+    Returns:
+        Number of tombstones removed
+    """
+    pruned_version, pruned_at = db.execute(
+        select(func.max(TaskTombstone.version), func.max(TaskTombstone.deleted_at))
+        .where(TaskTombstone.deleted_at < older_than)
+    ).one()
+    if pruned_version is None:
+        return 0
+    
+    db.execute(
+        update(BoardState)
+        .where(BoardState.id == 1)
+        .values(pruned_version=pruned_version, pruned_at=pruned_at)
+    )
+    removed = db.execute(
+        delete(TaskTombstone)
+        .where(TaskTombstone.deleted_at < older_than)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    logger.info(f"Pruned {removed} task tombstones through version {pruned_version}")
+    return removed
+
+
+def parse_since(since: str):
+    """
+    Parse a delta sync position.
+    
+    Args:
+        since: Board version (integer) or ISO 8601 updated_at timestamp
+        
+    Returns:
+        int version or datetime (raises ValueError if invalid)
+    """
+    if since.isdigit():
+        return int(since)
+    try:
+        return datetime.fromisoformat(since)
+    except ValueError:
+        raise ValueError("Invalid since. Use a board version or an ISO 8601 timestamp")
+
+
+def task_changes_since(db: Session, since) -> Tuple[List[Task], List[int], bool]:
+    """
+    Load tasks changed and deleted after a delta sync position.
+    
+    since가 보관 기간이 지나 정리된 tombstone보다 오래되면 삭제 목록을 완전하게
+    만들 수 없으므로 변경 목록 대신 reset=True를 반환합니다 (클라이언트는 전체 목록을 다시 조회).
+    
+    Args:
+        db: Database session
+        since: Board version (int) or updated_at timestamp (datetime) from parse_since
+        
+    Returns:
+        Tuple of (changed tasks, deleted task ids, reset) in change order
+    """
+    pruned_version, pruned_at = db.execute(
+        select(BoardState.pruned_version, BoardState.pruned_at).where(BoardState.id == 1)
+    ).one_or_none() or (0, None)
+    if isinstance(since, int):
+        reset = since < (pruned_version or 0)
+    else:
+        reset = pruned_at is not None and since < pruned_at
+    if reset:
+        return [], [], True
+    
+    if isinstance(since, int):
+        task_condition = Task.version > since
+        tombstone_condition = TaskTombstone.version > since
+    else:
+        task_condition = Task.updated_at > since
+        tombstone_condition = TaskTombstone.deleted_at > since
+    
+    tasks = db.query(Task).filter(task_condition).order_by(Task.version, Task.id).all()
+    deleted_ids = [
+        task_id for (task_id,) in db.query(TaskTombstone.task_id)
+        .filter(tombstone_condition)
+        .order_by(TaskTombstone.version, TaskTombstone.id)
+    ]
+    return tasks, deleted_ids, False
+
+
+def batch_update_task_status(db: Session, conditions: List, status: TaskStatus) -> Tuple[int, List[Task]]:
+    """
+    Set the status of all matching tasks with one UPDATE ... RETURNING.
+    
+    Args:
+        db: Database session
+        conditions: Filter expressions selecting the tasks (must not be empty)
+        status: New task status
+        
+    Returns:
+        Tuple of (board version, updated tasks)
+    """
+    try:
+        version = next_board_version(db)
+        tasks = db.scalars(
+            update(Task)
+            .where(*conditions)
+            .values(status=status, updated_at=datetime.utcnow(), version=version)
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        ).all()
+        
+        # 변경된 작업이 없으면 버전을 올리지 않음
+        if not tasks:
+            db.rollback()
+            return get_board_version(db), []
+        
+        # commit 시 만료되어 작업마다 다시 SELECT 하지 않도록 세션에서 분리
+        for task in tasks:
+            db.expunge(task)
+        db.commit()
+        return version, tasks
+    except Exception:
+        db.rollback()
+        raise
+
+
+def batch_delete_tasks(db: Session, conditions: List) -> Tuple[int, List[int]]:
+    """
+    Delete all matching tasks with one DELETE ... RETURNING and record tombstones.
+    
+    Args:
+        db: Database session
+        conditions: Filter expressions selecting the tasks (must not be empty)
+        
+    Returns:
+        Tuple of (board version, deleted task ids)
+    """
+    try:
+        version = next_board_version(db)
+        task_ids = db.scalars(
+            delete(Task)
+            .where(*conditions)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        
+        if not task_ids:
+            db.rollback()
+            return get_board_version(db), []
+        
+        add_task_tombstones(db, task_ids, version)
+        db.commit()
+        return version, sorted(task_ids)
+    except Exception:
+        db.rollback()
+        raise
+
+
+def bulk_create_tasks(
+    db: Session,
+    action_items: List[Dict],
+    job_name: Optional[str] = None,
+    before_commit: Optional[Callable[[List[Dict]], None]] = None
+) -> List[Dict]:
+    """
+    Insert tasks for action items in a single transaction.
+    
+    한 번의 INSERT ... RETURNING으로 생성된 id를 입력 순서대로 받아오므로
+    행마다 commit/refresh 할 필요가 없습니다.
+    
+    Args:
+        db: Database session
+        action_items: List of action item dicts (assignee, task, due_date, confidence)
+        job_name: Source meeting job name
+        before_commit: Called with the saved task summaries before the commit, so changes it
+            makes in the same session (e.g. a job's saved marker) commit together with the tasks
+        
+    Returns:
+        List of saved task summaries (id, assignee, task, status)
+    """
+    if not action_items:
+        return []
+    
+    now = datetime.utcnow()
+    try:
+        version = next_board_version(db)
+        rows = [
+            {
+                "assignee": item['assignee'],
+                "task": item['task'],
+                "due_date": item.get('due_date'),
+                "confidence": item.get('confidence'),
+                "status": TaskStatus.TODO,
+                "job_name": job_name,
+                "version": version,
+                "created_at": now,
+                "updated_at": now
+            }
+            for item in action_items
+        ]
+        task_ids = db.scalars(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            rows
+        ).all()
+        saved_tasks = [
+            {
+                "id": task_id,
+                "assignee": row["assignee"],
+                "task": row["task"],
+                "status": TaskStatus.TODO.value
+            }
+            for task_id, row in zip(task_ids, rows)
+        ]
+        if before_commit:
+            before_commit(saved_tasks)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    
+    return saved_tasks
+
+
+# 내보내기(export)에 포함되는 컬럼 순서
+TASK_EXPORT_COLUMNS = (
+    "id", "assignee", "task", "due_date", "confidence",
+    "status", "job_name", "created_at", "updated_at"
+)
+
+
+def iter_tasks(conditions: Optional[List] = None, batch_size: int = 1000) -> Iterator[Dict]:
+    """
+    Stream tasks row by row with a server-side cursor.
+    
+    yield_per로 batch_size 행씩만 가져오고 ORM 객체 대신 컬럼 값만 조회하므로
+    테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+    스트리밍 응답이 끝날 때까지 살아 있어야 하므로 자체 세션을 사용합니다.
+    
+    Args:
+        conditions: Filter expressions from task_filters (optional)
+        batch_size: Rows fetched per round trip
+        
+    Yields:
+        Task dicts with TASK_EXPORT_COLUMNS keys
+    """
+    columns = [getattr(Task, name) for name in TASK_EXPORT_COLUMNS]
     db = SessionLocal()
     try:
-        yield db
+        result = db.execute(
+            select(*columns)
+            .filter(*(conditions or []))
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in result:
+            task = dict(zip(TASK_EXPORT_COLUMNS, row))
+            task["status"] = task["status"].value
+            task["created_at"] = task["created_at"].isoformat()
+            task["updated_at"] = task["updated_at"].isoformat()
+            yield task
     finally:
         db.close()
+
+
+async def get_db():
+    """
+    Get an async database session.
+    
+    동기 헬퍼(next_board_version, batch_update_task_status 등)는
+    await db.run_sync(...)로 같은 트랜잭션에서 호출할 수 있습니다.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
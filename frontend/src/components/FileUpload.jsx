@@ -2,6 +2,7 @@ import { useState } from 'react'
 import axios from 'axios'
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000'
+const JOB_POLL_INTERVAL_MS = 3000
 
 function FileUpload({ setStatus, setResult, setError }) {
   const [selectedFile, setSelectedFile] = useState(null)
@@ -53,8 +54,26 @@ function FileUpload({ setStatus, setResult, setError }) {
         }
       )
 
-      setStatus('completed')
-      setResult(response.data)
+      // 작업이 끝날 때까지 진행 상황 폴링
+      const jobId = response.data.job_id
+      while (true) {
+        await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS))
+        const { data: job } = await axios.get(`${API_URL}/jobs/${jobId}`)
+
+        if (job.status === 'completed') {
+          setStatus('completed')
+          setResult(job.result)
+          break
+        }
+        if (job.status === 'failed') {
+          setStatus('error')
+          setError(job.error)
+          break
+        }
+        if (job.stage) {
+          setStatus(job.stage)
+        }
+      }
     } catch (err) {
       setStatus('error')
       setError(err.response?.data?.detail || err.message)
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import axios from 'axios'
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000'
@@ -7,6 +7,8 @@ function KanbanBoard() {
   const [tasks, setTasks] = useState([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
+  // 마지막으로 동기화한 보드 버전 (since 변경분 조회용)
+  const versionRef = useRef(null)
 
   const columns = [
     { id: 'To Do', title: '📝 To Do', color: 'bg-blue-50 border-blue-200' },
@@ -17,8 +19,21 @@ function KanbanBoard() {
   const fetchTasks = async () => {
     try {
       setLoading(true)
-      const response = await axios.get(`${API_URL}/tasks`)
-      setTasks(response.data.tasks)
+      // next_cursor가 없을 때까지 페이지를 이어서 조회
+      const allTasks = []
+      let cursor = null
+      let version = null
+      do {
+        const response = await axios.get(`${API_URL}/tasks`, {
+          params: { limit: 500, ...(cursor ? { cursor } : {}) }
+        })
+        allTasks.push(...response.data.tasks)
+        cursor = response.data.next_cursor
+        // 첫 페이지의 버전을 기준으로 해야 조회 중 발생한 변경을 놓치지 않음
+        if (version === null) version = response.data.version
+      } while (cursor)
+      versionRef.current = version
+      setTasks(allTasks)
       setError(null)
     } catch (err) {
       setError(err.response?.data?.detail || err.message)
@@ -27,10 +42,60 @@ function KanbanBoard() {
     }
   }
 
+  // 마지막 버전 이후 변경분만 받아 반영 (삭제 먼저, 그다음 변경/생성)
+  const syncTasks = async () => {
+    if (versionRef.current === null) return fetchTasks()
+    try {
+      const { data } = await axios.get(`${API_URL}/tasks`, {
+        params: { since: versionRef.current }
+      })
+      setTasks(prev => {
+        const deleted = new Set(data.deleted_ids)
+        const changed = new Map(data.tasks.map(task => [task.id, task]))
+        const kept = prev.filter(task => !deleted.has(task.id) && !changed.has(task.id))
+        return [...data.tasks.slice().reverse(), ...kept]
+      })
+      versionRef.current = data.version
+    } catch (err) {
+      fetchTasks()
+    }
+  }
+
   useEffect(() => {
     fetchTasks()
   }, [])
 
+  // 서버 이벤트 스트림으로 변경분만 반영 (전체 목록 재조회 없이)
+  useEffect(() => {
+    const source = new EventSource(`${API_URL}/events`)
+    let connectedOnce = false
+
+    const upsertTask = (e) => {
+      const changed = JSON.parse(e.data)
+      setTasks(prev => {
+        const exists = prev.some(task => task.id === changed.id)
+        return exists
+          ? prev.map(task => (task.id === changed.id ? { ...task, ...changed } : task))
+          : [changed, ...prev]
+      })
+    }
+    const removeTask = (e) => {
+      const { id } = JSON.parse(e.data)
+      setTasks(prev => prev.filter(task => task.id !== id))
+    }
+
+    // 재접속 시에는 끊긴 동안의 변경을 놓쳤을 수 있으므로 변경분 재조회
+    source.onopen = () => {
+      if (connectedOnce) syncTasks()
+      connectedOnce = true
+    }
+    source.addEventListener('task.created', upsertTask)
+    source.addEventListener('task.updated', upsertTask)
+    source.addEventListener('task.deleted', removeTask)
+
+    return () => source.close()
+  }, [])
+
   const updateTaskStatus = async (taskId, newStatus) => {
     try {
       await axios.patch(`${API_URL}/tasks/${taskId}/status`, {
@@ -106,7 +171,7 @@ function KanbanBoard() {
           작업 관리 칸반보드
         </h2>
         <button
-          onClick={fetchTasks}
+          onClick={syncTasks}
           className="flex items-center gap-2 px-4 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 transition-colors"
         >
           <svg className="w-5 h-5" fill="none" viewBox="0 0 24 24" stroke="currentColor">
@@ -24,6 +24,12 @@ function ProcessingStatus({ status, error }) {
       bgColor: 'bg-green-50',
       icon: '📝'
     },
+    saving: {
+      text: '칸반보드에 작업 저장 중...',
+      color: 'text-green-600',
+      bgColor: 'bg-green-50',
+      icon: '📋'
+    },
     completed: {
       text: '완료! Notion에 작업이 생성되었습니다.',
       color: 'text-green-600',
@@ -1,16 +1,33 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Depends
+import time
+
+# 콜드 스타트 측정용 (main 모듈 import 시작 시각)
+_IMPORT_STARTED = time.perf_counter()
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from contextlib import asynccontextmanager
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
+import asyncio
+import io
+import tempfile
+import csv
+import hashlib
+import json
 import uuid
 import logging
-from pathlib import Path
 from datetime import datetime
-from services.stt import TranscriptionService
-from services.bedrock import BedrockService
-from services.s3 import S3Service
-from services.llm import LLMService
-from services.notion import NotionService
+from typing import Dict, Optional, Tuple
+from services.audio import estimate_audio_duration, preprocess_wav
+from services.registry import create_service_registry
+from services.pipeline import MeetingPipeline, STORED_TRANSCRIPT_SCHEME, TranscriptionNotReadyError
+from services.jobs import JobManager
+from services.meetings import MeetingStore
+from services.events import EventBroker
+from services.metrics import render_metrics
 from models import (
     UploadResponse, 
     TranscriptionResponse, 
@@ -21,10 +38,35 @@ from models import (
     SaveDestination,
     TaskResponse,
     TaskUpdateRequest,
-    TasksResponse
+    TasksResponse,
+    TaskBatchUpdateRequest,
+    TaskBatchDeleteRequest,
+    TaskBatchResponse,
+    TaskBatchResult,
+    JobResponse,
+    MeetingResponse,
+    TranscribeEvent
 )
 from config import settings
-from database import init_db, get_db, Task, TaskStatus
+from database import (
+    init_db,
+    get_db,
+    async_engine,
+    Task,
+    TaskStatus,
+    task_filters,
+    task_cursor_filter,
+    encode_task_cursor,
+    get_board_version,
+    next_board_version,
+    add_task_tombstones,
+    parse_since,
+    task_changes_since,
+    batch_update_task_status,
+    batch_delete_tasks,
+    iter_tasks,
+    TASK_EXPORT_COLUMNS
+)
 
 # 로깅 설정
 logging.basicConfig(
@@ -33,7 +75,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ActiOn API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Prepare the database and services on startup and stop workers on shutdown.
+    
+    서비스 클라이언트는 스레드에서 동시에 생성하며 (SERVICE_WARMUP=false면 첫 사용 시 생성),
+    import 시간과 준비 완료까지의 시간은 로그와 /health의 startup 항목으로 확인할 수 있습니다.
+    """
+    started = time.perf_counter()
+    await asyncio.to_thread(init_db)
+    if settings.service_warmup:
+        await services.warm_up()
+    startup_timings["ready_seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(
+        f"Startup: import {startup_timings['import_seconds']:.3f}s, "
+        f"ready {startup_timings['ready_seconds']:.3f}s, services {services.timings}"
+    )
+    
+    job_manager.resume_pending()
+    yield
+    # 열린 /events 스트림 종료 (uvicorn은 --timeout-graceful-shutdown이 지나야 이 단계로 넘어옴)
+    event_broker.close()
+    job_manager.shutdown()
+    if services.is_built("transcription"):
+        transcription_service.poller.stop()
+    await async_engine.dispose()
+
+
+app = FastAPI(title="ActiOn API", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -44,19 +115,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 업로드 디렉토리 생성
-UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
 
-# 서비스 초기화
-transcription_service = TranscriptionService()
-bedrock_service = BedrockService()
-s3_service = S3Service()
-llm_service = LLMService()
-notion_service = NotionService()
+# 서비스 등록 (클라이언트 생성과 LangChain import는 첫 사용 또는 warm-up 시점까지 지연)
+services = create_service_registry()
+transcription_service = services.lazy("transcription")
+bedrock_service = services.lazy("bedrock")
+s3_service = services.lazy("s3")
+llm_service = services.lazy("llm")
+notion_service = services.lazy("notion")
+event_broker = EventBroker(max_queue=settings.sse_max_queue)
+meeting_store = MeetingStore()
+pipeline = MeetingPipeline(
+    transcription_service, llm_service, notion_service, events=event_broker, meetings=meeting_store
+)
+job_manager = JobManager(pipeline, max_workers=settings.job_max_workers, events=event_broker)
+
+startup_timings = {"import_seconds": None, "ready_seconds": None}
 
-# 데이터베이스 초기화
-init_db()
+# 내용 해시별 업로드 잠금 ([asyncio.Lock, 대기 중인 요청 수])
+_content_locks: Dict[str, list] = {}
 
 
 @app.get("/")
@@ -65,20 +142,8 @@ def read_root():
     return {"status": "ok", "service": "ActiOn API"}
 
 
-@app.post("/upload-audio", response_model=UploadResponse)
-async def upload_audio(file: UploadFile = File(...)):
-    """
-    Upload audio file and start transcription process.
-    
-    Args:
-        file: Audio file (.mp3, .m4a, .wav)
-        
-    Returns:
-        UploadResponse with job information
-    """
-    logger.info(f"Received file upload: {file.filename}")
-    
-    # 파일 확장자 검증
+def _validate_audio_file(file: UploadFile) -> str:
+    """Validate the upload extension and return it."""
     allowed_extensions = ['.mp3', '.m4a', '.wav']
     file_ext = os.path.splitext(file.filename)[1].lower()
     
@@ -89,64 +154,255 @@ async def upload_audio(file: UploadFile = File(...)):
             detail=f"Invalid file format. Allowed: {', '.join(allowed_extensions)}"
         )
     
+    return file_ext
+
+
+def _file_sha256(file) -> str:
+    """SHA-256 of a local (spooled) upload file; the file position is reset afterwards."""
+    hasher = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(1024 * 1024), b""):
+        hasher.update(chunk)
+    file.seek(0)
+    return hasher.hexdigest()
+
+
+@asynccontextmanager
+async def _content_lock(content_hash: str):
+    """Serialize uploads with the same content hash within this process."""
+    entry = _content_locks.setdefault(content_hash, [asyncio.Lock(), 0])
+    entry[1] += 1
     try:
-        # 고유한 파일명 생성
-        job_name = f"transcription_{uuid.uuid4().hex[:8]}"
-        file_path = UPLOAD_DIR / f"{job_name}{file_ext}"
-        
-        logger.info(f"Saving file to: {file_path}")
-        
-        # 로컬에 파일 저장
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        
-        # S3에 업로드
-        s3_object_name = f"audio/{job_name}{file_ext}"
-        logger.info(f"Uploading to S3: {s3_object_name}")
-        s3_uri = s3_service.upload_file(str(file_path), s3_object_name)
+        async with entry[0]:
+            yield
+    finally:
+        # 기다리는 요청이 없으면 잠금 제거
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _content_locks[content_hash]
+
+
+async def _reuse_duplicate(
+    content_hash: str,
+    job_name: str,
+    destination: Optional[str],
+    filename: Optional[str],
+    upload_date: str
+) -> Optional[UploadResponse]:
+    """
+    Reuse the job of an identical, previously uploaded recording.
+    
+    목적지가 같으면 (또는 STT만 요청하면) 기존 작업을 그대로 반환하고, 목적지만 다르면
+    기존 S3 객체와 트랜스크립트, 추출 결과를 복사한 새 작업으로 남은 단계만 실행합니다.
+    기존 작업이 아직 변환 중이고 목적지가 다르면 재사용하지 않습니다.
+    
+    Args:
+        content_hash: SHA-256 of the uploaded file
+        job_name: Job name reserved for this upload
+        destination: "notion", "internal" or None
+        filename: Upload filename
+        upload_date: Upload date (YYYY-MM-DD)
         
-        # Amazon Transcribe 작업 시작
-        logger.info(f"Starting transcription job: {job_name}")
-        transcription_result = transcription_service.transcribe_audio(s3_uri, job_name)
+    Returns:
+        UploadResponse pointing at the reused or new job, or None if nothing can be reused
+    """
+    existing = await run_in_threadpool(job_manager.find_by_content_hash, content_hash)
+    if not existing:
+        return None
+    
+    if destination is None or existing["destination"] == destination:
+        logger.info(f"Duplicate upload of {existing['job_name']}, returning job {existing['id']}")
+        return UploadResponse(
+            message="Identical recording already uploaded. Returning the existing job.",
+            job_name=existing["job_name"],
+            status=existing["status"],
+            job_id=existing["id"],
+            duplicate_of=existing["job_name"]
+        )
+    
+    transcript_uri = existing["transcript_uri"]
+    if not transcript_uri:
+        return None
+    
+    copied = await run_in_threadpool(
+        meeting_store.copy_transcript, existing["job_name"], job_name, filename=filename, upload_date=upload_date
+    )
+    if not copied and not transcript_uri.startswith(STORED_TRANSCRIPT_SCHEME):
+        # Transcribe 결과 URI는 만료되는 presigned URL이므로 원래 작업에서 다시 조회
+        try:
+            transcript_uri = await run_in_threadpool(pipeline.get_transcript_uri, existing["job_name"])
+        except Exception as e:
+            logger.warning(f"Cannot reuse transcript of {existing['job_name']}: {str(e)}")
+            return None
+    
+    job_id = await run_in_threadpool(
+        job_manager.create_job,
+        job_name=job_name,
+        s3_uri=existing["s3_uri"],
+        destination=destination,
+        filename=filename,
+        upload_date=upload_date,
+        audio_duration=existing["audio_duration"],
+        content_hash=content_hash,
+        transcript_uri=transcript_uri,
+        summary=existing["summary"],
+        action_items=existing["action_items"]
+    )
+    job_manager.submit(job_id)
+    logger.info(f"Queued job {job_id}: {job_name} reusing results of {existing['job_name']}")
+    
+    return UploadResponse(
+        message="Identical recording already transcribed. Processing job queued with reused results.",
+        job_name=job_name,
+        status="queued",
+        job_id=job_id,
+        duplicate_of=existing["job_name"]
+    )
+
+
+async def _upload_preprocessed(file: UploadFile, job_name: str) -> Optional[Tuple[str, float]]:
+    """
+    Downmix, resample and trim silences of an uploaded WAV, then upload it to S3.
+    
+    무음을 제거한 경우 원본 기준 타임스탬프로 되돌릴 수 있도록 시간 매핑을 회의 저장소에 저장합니다.
+    전처리에 실패하면 None을 반환하며 호출한 쪽에서 원본을 그대로 업로드합니다.
+    
+    Args:
+        file: Uploaded WAV file
+        job_name: Transcription job name
         
-        # 로컬 파일 삭제
+    Returns:
+        Tuple of (S3 URI, processed duration in seconds), or None if preprocessing failed
+    """
+    with tempfile.TemporaryDirectory(prefix="upload-") as workdir:
         try:
-            file_path.unlink()
-            logger.info(f"Deleted local file: {file_path}")
-        except Exception:
-            pass
-        
-        if transcription_result['status'] == 'success':
-            logger.info(f"Transcription completed: {job_name}")
-            return UploadResponse(
-                message="File uploaded and transcription completed.",
-                job_name=job_name,
-                status="transcribed"
+            await file.seek(0)
+            processed = await run_in_threadpool(
+                preprocess_wav,
+                file.file,
+                os.path.join(workdir, f"{job_name}.wav"),
+                settings.audio_preprocess_sample_rate,
+                settings.audio_vad_frame_ms,
+                settings.audio_vad_threshold_db,
+                settings.audio_vad_min_silence_seconds,
+                settings.audio_vad_padding_seconds
             )
-        else:
-            logger.error(f"Transcription failed: {transcription_result.get('error')}")
-            raise HTTPException(
-                status_code=500,
-                detail=transcription_result.get('error', 'Transcription failed')
+        except Exception as e:
+            logger.warning(f"Audio preprocessing failed, uploading original: {str(e)}")
+            await file.seek(0)
+            return None
+        
+        logger.info(
+            f"Preprocessed {file.filename}: {processed.original_duration:.1f}s -> {processed.duration:.1f}s "
+            f"({len(processed.time_map)} kept spans)"
+        )
+        s3_uri = await run_in_threadpool(s3_service.upload_file, processed.path, f"audio/{job_name}.wav")
+    
+    # 앞부분만 잘린 경우도 시간 이동이 필요하므로 원본과 시간이 같을 때만 생략
+    if processed.time_map != [[0.0, 0.0]]:
+        await run_in_threadpool(
+            meeting_store.save_time_map, job_name, processed.time_map, filename=file.filename, s3_uri=s3_uri
+        )
+    return s3_uri, processed.duration
+
+
+async def _submit_audio_job(file: UploadFile, destination: str = None, force: bool = False) -> UploadResponse:
+    """
+    Stream the audio file to S3 and queue a background pipeline job.
+    
+    업로드 내용의 SHA-256으로 같은 녹음을 이미 처리했는지 S3에 올리기 전에 확인하고,
+    그렇다면 S3 객체와 Transcribe/Bedrock 결과를 재사용합니다 (force=True면 항상 새로 처리).
+    같은 내용의 업로드가 동시에 들어오면 먼저 온 요청이 작업을 등록할 때까지 나머지는
+    기다렸다가 그 작업을 재사용합니다. 이 보호는 프로세스 단위이므로 여러 워커 프로세스로
+    띄우면 동시에 들어온 동일 업로드가 각각 처리될 수 있습니다.
+    
+    Args:
+        file: Audio file
+        destination: "notion", "internal" or None to stop after transcription
+        force: Process the file even if an identical recording was uploaded before
+        
+    Returns:
+        UploadResponse with the queued (or reused) job information
+    """
+    file_ext = _validate_audio_file(file)
+    
+    try:
+        # 고유한 파일명 생성
+        job_name = f"transcription_{uuid.uuid4().hex[:8]}"
+        upload_date = datetime.now().strftime("%Y-%m-%d")
+        
+        # 업로드 전에 원본 해시로 중복을 확인해서 중복이면 변환과 업로드를 모두 생략
+        content_hash = await run_in_threadpool(_file_sha256, file.file)
+        async with _content_lock(content_hash):
+            if not force:
+                reused = await _reuse_duplicate(content_hash, job_name, destination, file.filename, upload_date)
+                if reused:
+                    return reused
+            
+            # WAV는 설정에 따라 모노/16kHz 변환과 무음 제거 후 업로드
+            uploaded = None
+            if file_ext == '.wav' and settings.audio_preprocess_enabled:
+                uploaded = await _upload_preprocessed(file, job_name)
+            
+            if uploaded:
+                s3_uri, audio_duration = uploaded
+            else:
+                # Starlette가 받아 둔 임시 파일을 청크 단위로 S3에 스트리밍 업로드 (추가 복사 없음)
+                s3_object_name = f"audio/{job_name}{file_ext}"
+                logger.info(f"Streaming upload to S3: {s3_object_name}")
+                s3_uri = await s3_service.upload_stream(file, s3_object_name)
+                audio_duration = estimate_audio_duration(file.size, file_ext)
+            
+            # 백그라운드 작업 등록 (Transcribe 이후 단계는 워커 풀에서 실행)
+            job_id = await run_in_threadpool(
+                job_manager.create_job,
+                job_name=job_name,
+                s3_uri=s3_uri,
+                destination=destination,
+                filename=file.filename,
+                upload_date=upload_date,
+                audio_duration=audio_duration,
+                content_hash=content_hash
             )
+        job_manager.submit(job_id)
+        logger.info(f"Queued job {job_id}: {job_name}")
+        
+        return UploadResponse(
+            message="File uploaded. Processing job queued.",
+            job_name=job_name,
+            status="queued",
+            job_id=job_id
+        )
         
     except Exception as e:
-        logger.error(f"Error in upload_audio: {str(e)}", exc_info=True)
-        # 에러 발생시에도 파일 정리
-        if 'file_path' in locals():
-            try:
-                file_path.unlink()
-            except Exception:
-                pass
+        logger.error(f"Error submitting audio job: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/upload-audio", response_model=UploadResponse)
+async def upload_audio(file: UploadFile = File(...), force: bool = False):
+    """
+    Upload audio file and queue a transcription job.
+    
+    Args:
+        file: Audio file (.mp3, .m4a, .wav)
+        force: Transcribe again even if the same file was uploaded before
+        
+    Returns:
+        UploadResponse with job information (poll GET /jobs/{job_id})
+    """
+    logger.info(f"Received file upload: {file.filename}")
+    return await _submit_audio_job(file, force=force)
+
+
 @app.post("/process-transcript", response_model=ProcessTranscriptResponse)
 async def process_transcript(request: ProcessTranscriptRequest):
     """
     Process transcription result to extract action items.
     
+    파싱된 트랜스크립트는 회의 저장소에 보관되므로 같은 job_name을 다시 처리하면
+    Transcribe 결과를 내려받지 않고 로컬에서 읽습니다.
+    
     Args:
         request: ProcessTranscriptRequest with job_name
         
@@ -156,40 +412,10 @@ async def process_transcript(request: ProcessTranscriptRequest):
     logger.info(f"Processing transcript for job: {request.job_name}")
     
     try:
-        # Transcription 결과 가져오기
-        status = transcription_service.client.get_transcription_job(
-            TranscriptionJobName=request.job_name
-        )
-        
-        if status['TranscriptionJob']['TranscriptionJobStatus'] != 'COMPLETED':
-            logger.warning(f"Transcription not completed: {request.job_name}")
-            raise HTTPException(
-                status_code=400,
-                detail="Transcription not completed yet"
-            )
-        
-        transcript_uri = status['TranscriptionJob']['Transcript']['TranscriptFileUri']
-        logger.info(f"Parsing transcript from: {transcript_uri}")
-        
-        # 화자별 텍스트 파싱
-        speaker_texts = transcription_service.parse_transcript_with_speakers(transcript_uri)
-        logger.info(f"Parsed {len(speaker_texts)} speaker segments")
-        
-        # 전체 텍스트 생성 (요약용)
-        full_transcript = "\n".join([
-            f"{item['speaker']}: {item['text']}"
-            for item in speaker_texts
-        ])
-        
-        # 회의록 요약
-        logger.info("Generating meeting summary")
-        summary = llm_service.summarize_meeting(full_transcript)
-        
-        # 액션 아이템 추출
         upload_date = request.upload_date or datetime.now().strftime("%Y-%m-%d")
-        logger.info(f"Extracting action items with base date: {upload_date}")
-        action_items = llm_service.extract_action_items(speaker_texts, upload_date)
-        logger.info(f"Extracted {len(action_items)} action items")
+        summary, action_items = await pipeline.aanalyze(
+            None, upload_date, job_name=request.job_name, metadata={"upload_date": upload_date}
+        )
         
         return ProcessTranscriptResponse(
             status="success",
@@ -197,6 +423,9 @@ async def process_transcript(request: ProcessTranscriptRequest):
             action_items=action_items
         )
         
+    except TranscriptionNotReadyError as e:
+        logger.warning(f"Transcription not completed: {request.job_name}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error in process_transcript: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -208,116 +437,123 @@ async def push_to_notion(request: PushToNotionRequest):
     Push extracted action items to Notion database.
     
     Args:
-        request: PushToNotionRequest with action items
+        request: PushToNotionRequest with action items, or job_name to re-push a stored meeting
         
     Returns:
         PushToNotionResponse with results
     """
-    logger.info(f"Pushing {len(request.action_items)} items to Notion")
+    action_items = request.action_items
+    if not action_items and request.job_name:
+        meeting = await run_in_threadpool(meeting_store.get, request.job_name)
+        if not meeting or not meeting["action_items"]:
+            raise HTTPException(status_code=404, detail="No stored action items for this meeting")
+        action_items = meeting["action_items"]
+    
+    logger.info(f"Pushing {len(action_items)} items to Notion")
     
     try:
-        results = notion_service.create_multiple_tasks(request.action_items)
-        
-        success_count = sum(1 for r in results if r['result']['status'] == 'success')
-        logger.info(f"Successfully created {success_count}/{len(results)} tasks in Notion")
-        
-        return PushToNotionResponse(
-            status="success",
-            message=f"Successfully created {success_count}/{len(results)} tasks in Notion",
-            results=results
-        )
+        result = await run_in_threadpool(pipeline.push_to_notion, action_items)
+        return PushToNotionResponse(**result)
         
     except Exception as e:
         logger.error(f"Error in push_to_notion: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/process-full-workflow")
+@app.post("/process-full-workflow", response_model=UploadResponse)
 async def process_full_workflow(
     file: UploadFile = File(...),
     destination: str = "notion",
-    db: Session = Depends(get_db)
+    force: bool = False
 ):
     """
     Complete workflow: Upload -> Transcribe -> Extract -> Save (Notion or Internal).
     
+    업로드가 끝나면 즉시 job_id를 반환하고, 나머지 단계는 백그라운드 워커에서 실행됩니다.
+    진행 상황과 최종 결과는 GET /jobs/{job_id}로 확인합니다.
+    같은 파일을 이미 처리했다면 기존 작업(또는 결과를 재사용한 새 작업)을 반환합니다.
+    
     Args:
         file: Audio file
         destination: "notion" or "internal" (default: "notion")
+        force: Process again even if the same file was uploaded before
         
     Returns:
-        Complete workflow result
+        UploadResponse with the queued job information
     """
     logger.info(f"Starting full workflow for file: {file.filename} with destination: {destination}")
     
-    # 1. 파일 업로드 및 STT
-    upload_result = await upload_audio(file)
+    destination = "notion" if destination == "notion" else "internal"
+    return await _submit_audio_job(file, destination, force)
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: int):
+    """
+    Get background job progress and result.
     
-    if upload_result.status != "transcribed":
-        logger.error("Transcription failed in full workflow")
-        raise HTTPException(status_code=500, detail="Transcription failed")
+    Args:
+        job_id: Job ID
+        
+    Returns:
+        JobResponse with status, current stage and result when completed
+    """
+    job = job_manager.get_job(job_id)
     
-    # 2. 액션 아이템 추출
-    process_request = ProcessTranscriptRequest(
-        job_name=upload_result.job_name,
-        upload_date=datetime.now().strftime("%Y-%m-%d")
-    )
-    process_result = await process_transcript(process_request)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
     
-    if process_result.status != "success":
-        logger.error("Action item extraction failed in full workflow")
-        raise HTTPException(status_code=500, detail="Action item extraction failed")
+    return JobResponse(**job)
+
+
+@app.get("/meetings/{job_name}", response_model=MeetingResponse)
+def get_meeting(job_name: str, include_segments: bool = False):
+    """
+    Get a stored meeting (metadata, summary, action items and optionally transcript).
     
-    # 3. 선택한 목적지에 저장
-    if destination == "notion":
-        # Notion에 푸시
-        notion_request = PushToNotionRequest(
-            action_items=[item.dict() for item in process_result.action_items]
-        )
-        notion_result = await push_to_notion(notion_request)
-        
-        logger.info(f"Full workflow completed for job: {upload_result.job_name}")
+    Args:
+        job_name: Transcription job name
+        include_segments: Include speaker segments
         
-        return {
-            "status": "success",
-            "job_name": upload_result.job_name,
-            "summary": process_result.summary,
-            "action_items_count": len(process_result.action_items),
-            "destination": "notion",
-            "notion_result": notion_result
-        }
-    else:
-        # 내부 DB에 저장
-        saved_tasks = []
-        for item in process_result.action_items:
-            task = Task(
-                assignee=item.assignee,
-                task=item.task,
-                due_date=item.due_date,
-                confidence=item.confidence,
-                status=TaskStatus.TODO,
-                job_name=upload_result.job_name
-            )
-            db.add(task)
-            db.commit()
-            db.refresh(task)
-            saved_tasks.append({
-                "id": task.id,
-                "assignee": task.assignee,
-                "task": task.task,
-                "status": task.status.value
-            })
-        
-        logger.info(f"Saved {len(saved_tasks)} tasks to internal DB")
+    Returns:
+        MeetingResponse
+    """
+    meeting = meeting_store.get(job_name, include_segments=include_segments)
+    
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    return MeetingResponse(**meeting)
+
+
+@app.post("/transcribe/events")
+def receive_transcribe_event(event: TranscribeEvent):
+    """
+    Receive a Transcribe job state change event (EventBridge format).
+    
+    완료 이벤트를 받으면 공유 폴러가 폴링 주기를 기다리지 않고
+    바로 결과를 확인해 대기 중인 파이프라인 단계를 깨웁니다.
+    
+    Args:
+        event: Event with detail.TranscriptionJobName and detail.TranscriptionJobStatus
         
-        return {
-            "status": "success",
-            "job_name": upload_result.job_name,
-            "summary": process_result.summary,
-            "action_items_count": len(process_result.action_items),
-            "destination": "internal",
-            "saved_tasks": saved_tasks
-        }
+    Returns:
+        Whether the job is tracked by this server
+    """
+    job_name = event.detail.get('TranscriptionJobName')
+    job_status = event.detail.get('TranscriptionJobStatus')
+    
+    if not job_name or not job_status:
+        raise HTTPException(status_code=400, detail="Missing TranscriptionJobName or TranscriptionJobStatus")
+    
+    tracked = transcription_service.poller.notify(job_name, job_status)
+    logger.info(f"Transcribe event: {job_name} -> {job_status} (tracked: {tracked})")
+    
+    return {
+        "status": "accepted",
+        "job_name": job_name,
+        "tracked": tracked
+    }
 
 
 @app.get("/health")
@@ -328,7 +564,9 @@ def health_check():
         return {
             "status": "healthy",
             "bedrock": "connected",
-            "model": "amazon.nova-pro-v1:0"
+            "model": "amazon.nova-pro-v1:0",
+            "llm_cache": llm_service.cache_stats(),
+            "startup": {**startup_timings, "services": services.timings}
         }
     except Exception as e:
         return {
@@ -337,6 +575,13 @@ def health_check():
         }
 
 
+@app.get("/metrics")
+def metrics():
+    """Expose Prometheus metrics (stage latency, Bedrock, Notion, jobs, DB)."""
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
+
+
 @app.get("/notion/database-info")
 def get_notion_database_info():
     """Get Notion database properties for debugging."""
@@ -353,58 +598,247 @@ def get_notion_database_info():
         }
 
 
+@app.get("/events")
+async def stream_events(request: Request):
+    """
+    Server-Sent Events feed of task and job changes.
+    
+    이벤트 종류:
+        task.created / task.updated: 작업 전체 필드
+        task.deleted: {"id": task_id}
+        job.updated: GET /jobs/{job_id}와 같은 작업 상태
+    
+    클라이언트는 전체 목록을 한 번 조회한 뒤 이 스트림으로 변경분만 반영하면 됩니다.
+    연결이 끊기면 재접속 후 전체 목록을 다시 조회해야 합니다.
+    서버 종료 시 lifespan 종료 단계에서 스트림을 닫습니다.
+    
+    Args:
+        request: Incoming request (checked for client disconnects)
+    
+    Returns:
+        text/event-stream response
+    """
+    return StreamingResponse(
+        event_broker.subscribe(settings.sse_heartbeat_seconds, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _task_response(task: Task) -> TaskResponse:
+    """Convert a Task row to a TaskResponse."""
+    return TaskResponse(
+        id=task.id,
+        assignee=task.assignee,
+        task=task.task,
+        due_date=task.due_date,
+        confidence=task.confidence,
+        status=task.status.value,
+        job_name=task.job_name,
+        version=task.version,
+        created_at=task.created_at.isoformat(),
+        updated_at=task.updated_at.isoformat()
+    )
+
+
 @app.get("/tasks", response_model=TasksResponse)
-def get_tasks(
+async def get_tasks(
+    request: Request,
     status: str = None,
-    db: Session = Depends(get_db)
+    assignee: str = None,
+    job_name: str = None,
+    due_from: str = None,
+    due_to: str = None,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: str = None,
+    since: str = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Get all tasks from internal database.
+    Get tasks from internal database, newest first.
+    
+    (created_at, id) 기준 키셋 페이지네이션을 사용하므로 테이블 크기와 관계없이
+    페이지당 조회 비용이 일정합니다. 다음 페이지는 응답의 next_cursor로 조회합니다.
+    
+    응답의 ETag는 보드 버전이므로 If-None-Match가 일치하면 304를 반환합니다.
+    since를 지정하면 그 이후 변경된 작업과 삭제된 작업 id(deleted_ids)만 반환합니다.
+    since가 tombstone 보관 기간보다 오래되었으면 reset=true만 반환하므로 전체 목록을 다시 조회합니다.
     
     Args:
         status: Filter by status (optional)
+        assignee: Filter by assignee (optional)
+        job_name: Filter by source meeting job name (optional)
+        due_from: Earliest due date, YYYY-MM-DD (optional)
+        due_to: Latest due date, YYYY-MM-DD (optional)
+        limit: Page size (max 500)
+        cursor: next_cursor from the previous page (optional)
+        since: Board version or ISO 8601 updated_at for delta sync (optional)
         
     Returns:
-        List of tasks
+        One page of tasks, or the changes since the given version
     """
+    # 버전을 목록보다 먼저 읽으므로 응답 내용이 버전보다 최신일 수는 있어도 누락되지는 않음
+    version = await db.run_sync(get_board_version)
+    etag = f'W/"{version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
     try:
-        query = db.query(Task)
-        
-        if status:
-            query = query.filter(Task.status == status)
-        
-        tasks = query.order_by(Task.created_at.desc()).all()
-        
-        task_list = [
-            TaskResponse(
-                id=task.id,
-                assignee=task.assignee,
-                task=task.task,
-                due_date=task.due_date,
-                confidence=task.confidence,
-                status=task.status.value,
-                job_name=task.job_name,
-                created_at=task.created_at.isoformat(),
-                updated_at=task.updated_at.isoformat()
-            )
-            for task in tasks
-        ]
+        if since is not None:
+            if cursor or any((status, assignee, job_name, due_from, due_to)):
+                raise ValueError("since cannot be combined with filters or cursor")
+            since = parse_since(since)
+        
+        else:
+            conditions = task_filters(status, assignee, job_name, due_from, due_to)
+            if cursor:
+                conditions.append(task_cursor_filter(cursor))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if since is not None:
+        return await _task_delta(db, since, version, etag)
+    
+    try:
+        tasks = (await db.scalars(
+            select(Task)
+            .where(*conditions)
+            .order_by(Task.created_at.desc(), Task.id.desc())
+            .limit(limit + 1)
+        )).all()
         
-        return TasksResponse(
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_task_cursor(tasks[-1])
+        
+        task_list = [_task_response(task) for task in tasks]
+        
+        return _with_etag(TasksResponse(
             status="success",
             tasks=task_list,
-            total=len(task_list)
-        )
+            total=len(task_list),
+            next_cursor=next_cursor,
+            version=version
+        ), etag)
     except Exception as e:
         logger.error(f"Error fetching tasks: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _task_delta(db: AsyncSession, since, version: int, etag: str) -> Response:
+    """Build a delta sync response (changed tasks plus tombstones, or reset if since is too old)."""
+    tasks, deleted_ids, reset = await db.run_sync(task_changes_since, since)
+    task_list = [_task_response(task) for task in tasks]
+    return _with_etag(TasksResponse(
+        status="success",
+        tasks=task_list,
+        total=len(task_list),
+        version=version,
+        deleted_ids=deleted_ids,
+        reset=reset
+    ), etag)
+
+
+def _with_etag(body: TasksResponse, etag: str) -> Response:
+    """Serialize a task list response with its ETag header."""
+    return Response(
+        content=body.json(),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
+# 내보내기 스트림에서 한 번에 전송하는 행 수
+EXPORT_FLUSH_ROWS = 500
+
+
+def _ndjson_export(rows):
+    """Serialize task dicts as NDJSON; the first row is sent immediately, then every EXPORT_FLUSH_ROWS rows."""
+    rows = iter(rows)
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+        break
+    
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps(row, ensure_ascii=False))
+        if len(buffer) >= EXPORT_FLUSH_ROWS:
+            yield "\n".join(buffer) + "\n"
+            buffer = []
+    if buffer:
+        yield "\n".join(buffer) + "\n"
+
+
+def _csv_export(rows):
+    """Serialize task dicts as CSV; the header is sent immediately."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=TASK_EXPORT_COLUMNS)
+    writer.writeheader()
+    yield buffer.getvalue()
+    
+    buffer.seek(0)
+    buffer.truncate()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count % EXPORT_FLUSH_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@app.get("/tasks/export")
+def export_tasks(
+    format: str = "ndjson",
+    status: str = None,
+    assignee: str = None,
+    job_name: str = None,
+    due_from: str = None,
+    due_to: str = None
+):
+    """
+    Stream all matching tasks as NDJSON or CSV.
+    
+    서버 측 커서로 행을 나눠 읽으면서 바로 전송하므로 테이블 크기와 관계없이
+    메모리 사용량이 일정하고, 첫 바이트가 즉시 전송됩니다.
+    
+    Args:
+        format: "ndjson" (default) or "csv"
+        status: Filter by status (optional)
+        assignee: Filter by assignee (optional)
+        job_name: Filter by source meeting job name (optional)
+        due_from: Earliest due date, YYYY-MM-DD (optional)
+        due_to: Latest due date, YYYY-MM-DD (optional)
+        
+    Returns:
+        Streaming response ordered by task id
+    """
+    if format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="Invalid format. Allowed: ndjson, csv")
+    
+    try:
+        conditions = task_filters(status, assignee, job_name, due_from, due_to)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    rows = iter_tasks(conditions)
+    filename = f"tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    
+    if format == "csv":
+        return StreamingResponse(_csv_export(rows), media_type="text/csv", headers=headers)
+    return StreamingResponse(_ndjson_export(rows), media_type="application/x-ndjson", headers=headers)
+
+
 @app.patch("/tasks/{task_id}/status")
-def update_task_status(
+async def update_task_status(
     task_id: int,
     request: TaskUpdateRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update task status.
@@ -417,27 +851,19 @@ def update_task_status(
         Updated task
     """
     try:
-        task = db.query(Task).filter(Task.id == task_id).first()
+        task = await db.get(Task, task_id)
         
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
         task.status = TaskStatus(request.status)
         task.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(task)
-        
-        return TaskResponse(
-            id=task.id,
-            assignee=task.assignee,
-            task=task.task,
-            due_date=task.due_date,
-            confidence=task.confidence,
-            status=task.status.value,
-            job_name=task.job_name,
-            created_at=task.created_at.isoformat(),
-            updated_at=task.updated_at.isoformat()
-        )
+        task.version = await db.run_sync(next_board_version)
+        await db.commit()
+        
+        response = _task_response(task)
+        event_broker.publish("task.updated", response.dict())
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -446,9 +872,9 @@ def update_task_status(
 
 
 @app.delete("/tasks/{task_id}")
-def delete_task(
+async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a task.
@@ -460,13 +886,16 @@ def delete_task(
         Success message
     """
     try:
-        task = db.query(Task).filter(Task.id == task_id).first()
+        task = await db.get(Task, task_id)
         
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
-        db.delete(task)
-        db.commit()
+        await db.delete(task)
+        version = await db.run_sync(next_board_version)
+        await db.run_sync(add_task_tombstones, [task_id], version)
+        await db.commit()
+        event_broker.publish("task.deleted", {"id": task_id})
         
         return {
             "status": "success",
@@ -479,6 +908,111 @@ def delete_task(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _batch_conditions(ids, task_filter) -> list:
+    """Build conditions for a batch request (raises ValueError if nothing is selected)."""
+    conditions = task_filters(**task_filter.dict()) if task_filter else []
+    if ids is not None:
+        conditions.append(Task.id.in_(ids))
+    if not conditions:
+        raise ValueError("ids or a non-empty filter is required")
+    return conditions
+
+
+def _batch_results(ids, affected_ids, outcome: str) -> list:
+    """Per-id outcomes: requested ids in order, or every affected id for filter-only batches."""
+    if ids is None:
+        return [TaskBatchResult(id=task_id, result=outcome) for task_id in affected_ids]
+    
+    affected = set(affected_ids)
+    return [
+        TaskBatchResult(id=task_id, result=outcome if task_id in affected else "not_found")
+        for task_id in dict.fromkeys(ids)
+    ]
+
+
+@app.patch("/tasks", response_model=TaskBatchResponse)
+async def batch_update_tasks(
+    request: TaskBatchUpdateRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Update the status of many tasks at once.
+    
+    선택된 모든 작업을 한 번의 UPDATE 문과 하나의 트랜잭션으로 변경합니다.
+    
+    Args:
+        request: Task ids and/or filter, and the new status
+        
+    Returns:
+        Per-id outcomes and the new board version
+    """
+    try:
+        conditions = _batch_conditions(request.ids, request.filter)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        version, tasks = await db.run_sync(
+            batch_update_task_status, conditions, TaskStatus(request.status)
+        )
+        
+        for task in tasks:
+            event_broker.publish("task.updated", _task_response(task).dict())
+        logger.info(f"Batch updated {len(tasks)} tasks to {request.status}")
+        
+        return TaskBatchResponse(
+            status="success",
+            affected=len(tasks),
+            version=version,
+            results=_batch_results(request.ids, sorted(task.id for task in tasks), "updated")
+        )
+    except Exception as e:
+        logger.error(f"Error batch updating tasks: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.delete("/tasks", response_model=TaskBatchResponse)
+async def batch_delete_tasks_endpoint(
+    request: TaskBatchDeleteRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Delete many tasks at once.
+    
+    선택된 모든 작업을 한 번의 DELETE 문과 하나의 트랜잭션으로 삭제합니다.
+    
+    Args:
+        request: Task ids and/or filter
+        
+    Returns:
+        Per-id outcomes and the new board version
+    """
+    try:
+        conditions = _batch_conditions(request.ids, request.filter)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        version, task_ids = await db.run_sync(batch_delete_tasks, conditions)
+        
+        for task_id in task_ids:
+            event_broker.publish("task.deleted", {"id": task_id})
+        logger.info(f"Batch deleted {len(task_ids)} tasks")
+        
+        return TaskBatchResponse(
+            status="success",
+            affected=len(task_ids),
+            version=version,
+            results=_batch_results(request.ids, task_ids, "deleted")
+        )
+    except Exception as e:
+        logger.error(f"Error batch deleting tasks: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+startup_timings["import_seconds"] = round(time.perf_counter() - _IMPORT_STARTED, 3)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,136 @@
+import logging
+from datetime import datetime
+from typing import Callable, List, Tuple
+from sqlalchemy import (
+    inspect, select, text, Column, DateTime, Integer, MetaData, String, Table
+)
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+# 적용된 마이그레이션 기록
+_migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+# PostgreSQL에서 여러 워커 프로세스가 동시에 마이그레이션하지 않도록 잡는 advisory lock 키
+MIGRATION_LOCK_KEY = 7_263_514
+
+
+def _add_task_version(conn: Connection, metadata: MetaData) -> None:
+    """Add tasks.version to databases created before delta sync."""
+    columns = {column["name"] for column in inspect(conn).get_columns("tasks")}
+    if "version" not in columns:
+        conn.execute(text("ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 0"))
+
+
+# 마이그레이션 2 작성 당시의 tasks 인덱스 (이후 모델에 추가되는 인덱스와 무관하게 고정)
+_TASK_INDEXES = [
+    ("ix_tasks_created_at_id", ("created_at", "id")),
+    ("ix_tasks_status_created_at_id", ("status", "created_at", "id")),
+    ("ix_tasks_assignee_created_at_id", ("assignee", "created_at", "id")),
+    ("ix_tasks_job_name_created_at_id", ("job_name", "created_at", "id")),
+    ("ix_tasks_due_date", ("due_date",)),
+    ("ix_tasks_version", ("version",)),
+    ("ix_tasks_updated_at", ("updated_at",)),
+]
+
+
+def _create_task_indexes(conn: Connection, metadata: MetaData) -> None:
+    """Create the task list indexes on tasks tables created before they were declared."""
+    for name, columns in _TASK_INDEXES:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON tasks ({', '.join(columns)})"))
+
+
+def _seed_board_state(conn: Connection, metadata: MetaData) -> None:
+    """Insert the single board version counter row."""
+    board_state = metadata.tables["board_state"]
+    if conn.execute(select(board_state.c.id).where(board_state.c.id == 1)).first() is None:
+        conn.execute(board_state.insert().values(id=1, version=0))
+
+
+def _add_meeting_time_map(conn: Connection, metadata: MetaData) -> None:
+    """Add meetings.time_map to databases created before upload preprocessing."""
+    columns = {column["name"] for column in inspect(conn).get_columns("meetings")}
+    if "time_map" not in columns:
+        conn.execute(text("ALTER TABLE meetings ADD COLUMN time_map JSON"))
+
+
+def _add_job_content_hash(conn: Connection, metadata: MetaData) -> None:
+    """Add jobs.content_hash and its index to databases created before upload deduplication."""
+    columns = {column["name"] for column in inspect(conn).get_columns("jobs")}
+    if "content_hash" not in columns:
+        conn.execute(text("ALTER TABLE jobs ADD COLUMN content_hash VARCHAR(64)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_jobs_content_hash ON jobs (content_hash)"))
+
+
+def _add_job_stage_results(conn: Connection, metadata: MetaData) -> None:
+    """Add jobs.notion_result and jobs.saved_tasks (per-stage markers for idempotent resume)."""
+    columns = {column["name"] for column in inspect(conn).get_columns("jobs")}
+    for name in ("notion_result", "saved_tasks"):
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE jobs ADD COLUMN {name} JSON"))
+
+
+def _add_board_pruned_floor(conn: Connection, metadata: MetaData) -> None:
+    """Add board_state.pruned_version and pruned_at (tombstone retention floor)."""
+    columns = {column["name"] for column in inspect(conn).get_columns("board_state")}
+    if "pruned_version" not in columns:
+        conn.execute(text("ALTER TABLE board_state ADD COLUMN pruned_version INTEGER NOT NULL DEFAULT 0"))
+    if "pruned_at" not in columns:
+        conn.execute(text("ALTER TABLE board_state ADD COLUMN pruned_at TIMESTAMP"))
+
+
+# (버전, 이름, 함수) - 새 마이그레이션은 항상 끝에 추가
+# create_all로 이미 최신 스키마가 만들어진 새 데이터베이스에서도 안전하도록 모두 멱등적으로 작성
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection, MetaData], None]]] = [
+    (1, "add_task_version", _add_task_version),
+    (2, "create_missing_indexes", _create_task_indexes),
+    (3, "seed_board_state", _seed_board_state),
+    (4, "add_meeting_time_map", _add_meeting_time_map),
+    (5, "add_job_content_hash", _add_job_content_hash),
+    (6, "add_job_stage_results", _add_job_stage_results),
+    (7, "add_board_pruned_floor", _add_board_pruned_floor),
+]
+
+
+def run_migrations(engine: Engine, metadata: MetaData) -> List[int]:
+    """
+    Create missing tables and apply pending schema migrations.
+
+    Args:
+        engine: Database engine
+        metadata: Declarative metadata of the application models
+
+    Returns:
+        Versions applied by this call
+    """
+    applied_now = []
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+        _migration_metadata.create_all(bind=conn)
+        metadata.create_all(bind=conn)
+
+        applied = set(conn.execute(select(schema_migrations.c.version)).scalars())
+        for version, name, migrate in MIGRATIONS:
+            if version in applied:
+                continue
+
+            logger.info(f"Applying migration {version}: {name}")
+            migrate(conn, metadata)
+            conn.execute(schema_migrations.insert().values(
+                version=version,
+                name=name,
+                applied_at=datetime.utcnow()
+            ))
+            applied_now.append(version)
+
+    return applied_now
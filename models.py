@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any, Literal
 
 
@@ -15,6 +15,8 @@ class UploadResponse(BaseModel):
     message: str
     job_name: str
     status: str
+    job_id: Optional[int] = None
+    duplicate_of: Optional[str] = None  # 같은 녹음을 이미 처리한 작업의 job_name
 
 
 class ActionItem(BaseModel):
@@ -41,7 +43,8 @@ class ProcessTranscriptResponse(BaseModel):
 
 class PushToNotionRequest(BaseModel):
     """Request model for pushing to Notion."""
-    action_items: List[Dict[str, Any]]
+    action_items: List[Dict[str, Any]] = []
+    job_name: Optional[str] = None  # action_items가 비어 있으면 저장된 회의의 액션 아이템을 전송
 
 
 class PushToNotionResponse(BaseModel):
@@ -65,6 +68,7 @@ class TaskResponse(BaseModel):
     confidence: Optional[float] = None
     status: str
     job_name: Optional[str] = None
+    version: int = 0  # 마지막으로 변경된 보드 버전
     created_at: str
     updated_at: str
 
@@ -74,8 +78,99 @@ class TaskUpdateRequest(BaseModel):
     status: Literal["To Do", "In Progress", "Done"]
 
 
+# 배치 요청 한 번에 지정할 수 있는 최대 id 수
+MAX_BATCH_IDS = 1000
+
+
+class TaskFilter(BaseModel):
+    """Task selection filter for batch operations (same fields as GET /tasks)."""
+    status: Optional[Literal["To Do", "In Progress", "Done"]] = None
+    assignee: Optional[str] = None
+    job_name: Optional[str] = None
+    due_from: Optional[str] = None
+    due_to: Optional[str] = None
+
+
+class TaskBatchUpdateRequest(BaseModel):
+    """Request model for updating the status of many tasks."""
+    ids: Optional[List[int]] = Field(default=None, max_length=MAX_BATCH_IDS)
+    filter: Optional[TaskFilter] = None  # ids와 함께 지정하면 두 조건을 모두 만족하는 작업만 변경
+    status: Literal["To Do", "In Progress", "Done"]
+
+
+class TaskBatchDeleteRequest(BaseModel):
+    """Request model for deleting many tasks."""
+    ids: Optional[List[int]] = Field(default=None, max_length=MAX_BATCH_IDS)
+    filter: Optional[TaskFilter] = None
+
+
+class TaskBatchResult(BaseModel):
+    """Outcome for one task of a batch operation."""
+    id: int
+    result: Literal["updated", "deleted", "not_found"]
+
+
+class TaskBatchResponse(BaseModel):
+    """Response model for batch task operations."""
+    status: str
+    affected: int
+    version: int  # 배치 적용 후 보드 버전
+    results: List[TaskBatchResult]
+
+
 class TasksResponse(BaseModel):
-    """Response model for task list."""
+    """Response model for task list (one keyset page or a since delta)."""
     status: str
     tasks: List[TaskResponse]
-    total: int
+    total: int  # 이 페이지의 작업 수
+    next_cursor: Optional[str] = None  # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+    version: int = 0  # 응답 시점의 보드 버전 (다음 since 값으로 사용)
+    deleted_ids: List[int] = []  # since 이후 삭제된 작업 id (삭제 후 tasks를 적용)
+    reset: bool = False  # since가 tombstone 보관 기간보다 오래됨 (since 없이 전체 목록을 다시 조회)
+
+
+class JobResponse(BaseModel):
+    """Response model for background job progress."""
+    id: int
+    job_name: str
+    status: str
+    stage: Optional[str] = None
+    progress: float
+    destination: Optional[str] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: str
+    updated_at: str
+
+
+class SpeakerSegment(BaseModel):
+    """Speaker-labeled transcript segment."""
+    speaker: str
+    text: str
+    start_time: float
+    end_time: float
+
+
+class MeetingResponse(BaseModel):
+    """Response model for a stored meeting."""
+    job_name: str
+    filename: Optional[str] = None
+    s3_uri: Optional[str] = None
+    transcript_uri: Optional[str] = None
+    upload_date: Optional[str] = None
+    speaker_count: Optional[int] = None
+    segment_count: Optional[int] = None
+    duration: Optional[float] = None
+    summary: Optional[str] = None
+    action_items: Optional[List[ActionItem]] = None
+    prompt_version: Optional[int] = None
+    speaker_texts: Optional[List[SpeakerSegment]] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+
+class TranscribeEvent(BaseModel):
+    """Transcribe job state change event (EventBridge format)."""
+    source: Optional[str] = None
+    detail_type: Optional[str] = Field(default=None, alias="detail-type")
+    detail: Dict[str, Any]
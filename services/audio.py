@@ -0,0 +1,377 @@
+import os
+import sys
+import wave
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import BinaryIO, Callable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from services.metrics import timed_stage
+
+try:
+    import numpy as np
+except ImportError:  # 업로드 전처리(다운믹스/리샘플/무음 제거)는 numpy가 설치된 경우에만 사용
+    np = None
+
+# 포맷별 대략적인 초당 바이트 수 (폴링 간격 추정용)
+_BYTES_PER_SECOND = {
+    '.mp3': 16_000,    # 128 kbps
+    '.m4a': 16_000,    # 128 kbps AAC
+    '.wav': 176_400,   # 44.1 kHz, 16-bit, stereo
+}
+
+# PCM 샘플 크기(bytes)별 array 타입 코드
+_PCM_TYPECODES = {1: 'B', 2: 'h', 4: 'i'}
+
+
+def estimate_audio_duration(size_bytes: Optional[int], file_ext: str) -> Optional[float]:
+    """
+    Roughly estimate audio duration from file size.
+    
+    Args:
+        size_bytes: File size in bytes
+        file_ext: File extension including the dot (e.g. '.mp3')
+        
+    Returns:
+        Estimated duration in seconds, or None if unknown
+    """
+    if not size_bytes or file_ext not in _BYTES_PER_SECOND:
+        return None
+    return size_bytes / _BYTES_PER_SECOND[file_ext]
+
+
+class AudioPiece(NamedTuple):
+    """One piece of a split recording (times in seconds of the original)."""
+    path: str
+    start: float       # 조각 시작 (앞 조각과 겹치는 구간 포함)
+    end: float         # 조각 끝 (뒤 조각과 겹치는 구간 포함)
+    keep_start: float  # 이 조각의 결과를 사용할 구간 (분할 지점 사이)
+    keep_end: float
+
+
+def wav_duration(path: Union[str, BinaryIO]) -> float:
+    """
+    Duration of a WAV file in seconds.
+
+    wave 모듈은 data 청크 헤더까지만 읽으므로 파일 앞부분(헤더)만 담은 객체로도 길이를 구할 수 있습니다.
+
+    Args:
+        path: WAV file path or binary file object positioned at the start of the file
+
+    Returns:
+        Duration in seconds
+    """
+    with wave.open(path, 'rb') as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+def find_quietest_point(path: str, around: float, search_seconds: float, frame_ms: int = 20) -> float:
+    """
+    Find the lowest-energy frame near a target time.
+
+    around ± search_seconds 범위만 읽어서 frame_ms 단위 프레임의 제곱 에너지 합이
+    가장 작은 (가장 조용한) 프레임의 중앙 시각을 반환합니다.
+    8/16/32비트 PCM만 분석하며 그 외 형식은 around를 그대로 반환합니다.
+
+    Args:
+        path: WAV file path
+        around: Target time in seconds
+        search_seconds: Search radius in seconds
+        frame_ms: Analysis frame length in milliseconds
+
+    Returns:
+        Time in seconds of the quietest frame
+    """
+    with wave.open(path, 'rb') as wav:
+        channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        rate = wav.getframerate()
+        total = wav.getnframes()
+
+        if sample_width not in _PCM_TYPECODES:
+            return around
+
+        first = max(0, int((around - search_seconds) * rate))
+        last = min(total, int((around + search_seconds) * rate))
+        wav.setpos(first)
+        samples = array(_PCM_TYPECODES[sample_width], wav.readframes(last - first))
+
+    if sys.byteorder == 'big' and sample_width > 1:
+        samples.byteswap()
+    # 8비트 PCM은 부호 없는 값(무음 = 128)
+    bias = 128 if sample_width == 1 else 0
+
+    frame_samples = max(1, rate * frame_ms // 1000) * channels
+    # 프레임당 최대 약 200개 샘플만 보고 에너지를 추정 (순수 파이썬 연산량 제한)
+    step = max(1, frame_samples // 200)
+    best_time, best_key = around, None
+    for offset in range(0, len(samples) - frame_samples + 1, frame_samples):
+        frame = samples[offset:offset + frame_samples:step]
+        energy = sum((value - bias) * (value - bias) for value in frame)
+        center = (first + (offset + frame_samples // 2) // channels) / rate
+        # 에너지가 같으면 목표 시각에 더 가까운 프레임 선택
+        key = (energy, abs(center - around))
+        if best_key is None or key < best_key:
+            best_key = key
+            best_time = center
+    return best_time
+
+
+def split_wav(
+    path: str,
+    output_dir: str,
+    piece_seconds: float,
+    overlap_seconds: float,
+    search_seconds: float
+) -> List[AudioPiece]:
+    """
+    Split a WAV recording at quiet points into overlapping pieces.
+
+    목표 길이(piece_seconds)마다 전후 search_seconds 안에서 가장 조용한 지점을 찾아
+    분할 지점으로 삼고, 각 조각은 분할 지점 양쪽으로 overlap_seconds / 2 만큼 겹칩니다.
+    겹친 구간은 조각 간 화자 라벨을 맞추는 데 사용됩니다.
+
+    Args:
+        path: Source WAV file path
+        output_dir: Directory for the piece files
+        piece_seconds: Target piece length
+        overlap_seconds: Overlap between neighbouring pieces
+        search_seconds: Search radius for quiet split points
+
+    Returns:
+        Pieces in time order (a single piece if the file is short)
+    """
+    duration = wav_duration(path)
+    cuts = [0.0]
+    while duration - cuts[-1] > piece_seconds * 1.5:
+        target = cuts[-1] + piece_seconds
+        radius = min(search_seconds, piece_seconds / 2)
+        cuts.append(find_quietest_point(path, target, radius))
+    cuts.append(duration)
+
+    half_overlap = overlap_seconds / 2
+    pieces = []
+    with wave.open(path, 'rb') as source:
+        params = source.getparams()
+        rate = source.getframerate()
+        for index, (keep_start, keep_end) in enumerate(zip(cuts, cuts[1:])):
+            start = max(0.0, keep_start - half_overlap)
+            end = min(duration, keep_end + half_overlap)
+            piece_path = os.path.join(output_dir, f"part{index:03d}.wav")
+
+            source.setpos(int(start * rate))
+            remaining = int(end * rate) - int(start * rate)
+            with wave.open(piece_path, 'wb') as piece:
+                piece.setparams(params)
+                # 큰 조각도 메모리에 한 번에 올리지 않도록 나누어 복사
+                while remaining > 0:
+                    frames = source.readframes(min(remaining, rate * 10))
+                    if not frames:
+                        break
+                    piece.writeframes(frames)
+                    remaining -= len(frames) // (params.sampwidth * params.nchannels)
+
+            pieces.append(AudioPiece(piece_path, start, end, keep_start, keep_end))
+    return pieces
+
+
+class PreprocessedAudio(NamedTuple):
+    """Result of preprocess_wav."""
+    path: str
+    duration: float           # 전처리 후 길이 (초)
+    original_duration: float  # 원본 길이 (초)
+    # 남긴 구간별 [전처리 후 시작, 원본 시작] (초), 시간순
+    time_map: List[List[float]]
+
+
+@timed_stage("audio_preprocess")
+def preprocess_wav(
+    source: Union[str, BinaryIO],
+    output_path: str,
+    sample_rate: int = 16000,
+    frame_ms: int = 30,
+    threshold_db: float = 12.0,
+    min_silence_seconds: float = 2.0,
+    padding_seconds: float = 0.3
+) -> PreprocessedAudio:
+    """
+    Downmix, resample and trim long silences from a WAV recording.
+
+    원본을 블록 단위로 읽어 모노로 합치고 sample_rate로 리샘플한 16비트 PCM을 임시 파일에 쓴 뒤,
+    frame_ms 프레임의 에너지(dB)가 잡음 바닥(하위 10% 프레임)보다 threshold_db 이상 큰 프레임을
+    음성으로 보고 min_silence_seconds보다 긴 무음 구간을 제거합니다. 음성 앞뒤로는
+    padding_seconds만큼 남깁니다. 에너지 계산과 구간 판정은 NumPy 배열 연산으로 처리합니다.
+
+    Args:
+        source: WAV file path or binary file object
+        output_path: Path of the 16-bit mono WAV to write
+        sample_rate: Output sample rate (recordings with a lower rate keep their rate)
+        frame_ms: Voice activity frame length in milliseconds
+        threshold_db: Frame energy above the noise floor counted as speech
+        min_silence_seconds: Shortest silence that is removed
+        padding_seconds: Audio kept before and after speech
+
+    Returns:
+        PreprocessedAudio with the time map back to the original recording
+    """
+    if np is None:
+        raise Exception("Audio preprocessing requires the numpy package")
+
+    pcm_path = output_path + ".pcm"
+    try:
+        with wave.open(source, 'rb') as wav:
+            rate = wav.getframerate()
+            original_duration = wav.getnframes() / rate
+            output_rate = min(rate, sample_rate)
+            with open(pcm_path, 'wb') as pcm:
+                for block in _mono_blocks(wav, output_rate):
+                    np.clip(np.round(block), -32768, 32767).astype('<i2').tofile(pcm)
+
+        if os.path.getsize(pcm_path):
+            samples = np.memmap(pcm_path, dtype='<i2', mode='r')
+        else:
+            samples = np.zeros(0, dtype='<i2')
+        spans = _voiced_spans(samples, output_rate, frame_ms, threshold_db, min_silence_seconds, padding_seconds)
+
+        time_map = []
+        written = 0
+        with wave.open(output_path, 'wb') as output:
+            output.setnchannels(1)
+            output.setsampwidth(2)
+            output.setframerate(output_rate)
+            for start, end in spans:
+                time_map.append([round(written / output_rate, 3), round(start / output_rate, 3)])
+                # 큰 구간도 메모리에 한 번에 올리지 않도록 1분 단위로 복사
+                for offset in range(start, end, output_rate * 60):
+                    output.writeframes(samples[offset:min(end, offset + output_rate * 60)].tobytes())
+                written += end - start
+        del samples
+    finally:
+        if os.path.exists(pcm_path):
+            os.remove(pcm_path)
+
+    return PreprocessedAudio(output_path, written / output_rate, original_duration, time_map)
+
+
+def original_time_mapper(time_map: List[List[float]]) -> Callable[[float, bool], float]:
+    """
+    Build a function translating preprocessed-audio times to original recording times.
+
+    Args:
+        time_map: Time map returned in PreprocessedAudio
+
+    Returns:
+        Callable (seconds, is_end) -> seconds in the original recording
+    """
+    processed_starts = [span[0] for span in time_map]
+
+    def to_original(seconds: float, is_end: bool = False) -> float:
+        # 구간 경계와 같은 종료 시각은 다음 구간 시작이 아니라 앞 구간 끝으로 변환
+        search = bisect_left if is_end else bisect_right
+        index = max(0, search(processed_starts, seconds) - 1)
+        processed_start, original_start = time_map[index]
+        return round(original_start + seconds - processed_start, 3)
+
+    return to_original
+
+
+def _mono_blocks(wav: wave.Wave_read, output_rate: int, block_seconds: int = 30) -> Iterator["np.ndarray"]:
+    """
+    Read a WAV as mono float blocks resampled to output_rate (int16 scale).
+
+    다운샘플링 전에 비율 길이의 이동 평균으로 간단히 저역 통과시킨 뒤 선형 보간하며,
+    블록 경계가 이어지도록 이전 블록의 끝 샘플을 보관합니다.
+    """
+    channels = wav.getnchannels()
+    sample_width = wav.getsampwidth()
+    rate = wav.getframerate()
+    if sample_width not in _PCM_TYPECODES:
+        raise Exception(f"Unsupported WAV sample width: {sample_width * 8} bits")
+
+    dtype = {1: 'u1', 2: '<i2', 4: '<i4'}[sample_width]
+    scale = 32768 / (1 << (8 * sample_width - 1))
+    ratio = rate / output_rate
+    taps = max(1, int(round(ratio)))
+
+    # buffer[0]의 원본 샘플 인덱스가 buffer_start (처음에는 필터용 0 패딩)
+    buffer = np.zeros(taps - 1)
+    buffer_start = -(taps - 1)
+    next_output = 0
+    total = 0
+
+    def resample(last_position: float) -> "np.ndarray":
+        nonlocal buffer, buffer_start, next_output
+        cumulative = np.concatenate(([0.0], np.cumsum(buffer)))
+        smoothed = (cumulative[taps:] - cumulative[:-taps]) / taps
+        smoothed_start = buffer_start + taps - 1
+        last_output = int(np.floor(last_position / ratio))
+        if last_output < next_output or not len(smoothed):
+            return np.zeros(0)
+        positions = np.arange(next_output, last_output + 1) * ratio - smoothed_start
+        block = np.interp(positions, np.arange(len(smoothed)), smoothed)
+        next_output = last_output + 1
+        keep_from = max(0, int(next_output * ratio) - (taps - 1) - buffer_start)
+        buffer = buffer[keep_from:]
+        buffer_start += keep_from
+        return block
+
+    while True:
+        frames = wav.readframes(rate * block_seconds)
+        if not frames:
+            break
+        block = np.frombuffer(frames, dtype=dtype).astype(np.float64)
+        if sample_width == 1:
+            block -= 128  # 8비트 PCM은 부호 없는 값
+        mono = block.reshape(-1, channels).mean(axis=1) * scale
+        buffer = np.concatenate((buffer, mono))
+        total += len(mono)
+        # 보간에 필요한 다음 샘플이 들어온 위치까지만 출력
+        yield resample(buffer_start + len(buffer) - 2)
+
+    if total:
+        yield resample(total - 1)
+
+
+def _voiced_spans(
+    samples: "np.ndarray",
+    rate: int,
+    frame_ms: int,
+    threshold_db: float,
+    min_silence_seconds: float,
+    padding_seconds: float
+) -> List[Tuple[int, int]]:
+    """Sample ranges to keep after dropping silences longer than min_silence_seconds."""
+    frame = max(1, rate * frame_ms // 1000)
+    count = len(samples) // frame
+    if count == 0:
+        return [(0, len(samples))] if len(samples) else []
+
+    # 프레임별 평균 제곱 에너지 (메모리 사용을 줄이기 위해 약 1분씩 계산)
+    energies = np.empty(count)
+    chunk = max(1, rate * 60 // frame)
+    for first in range(0, count, chunk):
+        last = min(count, first + chunk)
+        block = samples[first * frame:last * frame].astype(np.float32).reshape(-1, frame)
+        energies[first:last] = np.mean(block * block, axis=1)
+    levels = 10 * np.log10(energies + 1e-10)
+
+    speech = levels > np.percentile(levels, 10) + threshold_db
+    pad = int(round(padding_seconds * 1000 / frame_ms))
+    if pad:
+        speech = np.convolve(speech.astype(np.int32), np.ones(2 * pad + 1, dtype=np.int32), 'same') > 0
+
+    # 무음 구간 = 음성 경계 사이; 양 끝은 음성으로 간주해서 (시작, 끝) 쌍으로 추출
+    edges = np.flatnonzero(np.diff(np.concatenate(([True], speech, [True])).astype(np.int8)))
+    silence_starts, silence_ends = edges[0::2], edges[1::2]
+    long_silences = (silence_ends - silence_starts) * frame_ms / 1000 >= min_silence_seconds
+
+    spans = []
+    position = 0
+    for start, end in zip(silence_starts[long_silences], silence_ends[long_silences]):
+        start_sample = int(start) * frame
+        end_sample = len(samples) if end == count else int(end) * frame
+        if start_sample > position:
+            spans.append((position, start_sample))
+        position = end_sample
+    if position < len(samples):
+        spans.append((position, len(samples)))
+    # 전체가 무음이면 원본 길이를 그대로 유지 (빈 파일은 Transcribe가 처리하지 못함)
+    return spans or [(0, len(samples))]
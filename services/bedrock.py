@@ -1,4 +1,5 @@
 import boto3
+from botocore.config import Config
 from langchain_aws import ChatBedrock
 from config import settings
 
@@ -7,7 +8,17 @@ class BedrockService:
     """Service for AWS Bedrock client connection."""
     
     def __init__(self):
-        self.bedrock_runtime = boto3.client(**settings.get_aws_client_kwargs('bedrock-runtime'))
+        # boto3 기본 세션은 스레드 안전하지 않으므로 서비스별 세션에서 클라이언트 생성
+        # ainvoke의 asyncio.wait_for는 기다리는 코루틴만 취소하고 실행기 스레드의 요청은 계속되므로
+        # 소켓 제한 시간과 재시도 횟수를 제한해서 시간 초과된 요청이 실제로 끝나도록 함
+        self.bedrock_runtime = boto3.session.Session().client(
+            config=Config(
+                connect_timeout=settings.bedrock_connect_timeout_seconds,
+                read_timeout=settings.llm_timeout_seconds,
+                retries={"mode": "standard", "total_max_attempts": settings.bedrock_max_attempts}
+            ),
+            **settings.get_aws_client_kwargs('bedrock-runtime')
+        )
         
         self.llm = ChatBedrock(
             client=self.bedrock_runtime,
@@ -0,0 +1,184 @@
+import math
+import re
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+from services.transcript import Transcript
+
+# 토큰 수 추정용 평균 글자 수 (한국어는 영어보다 글자당 토큰이 많으므로 보수적으로 설정)
+CHARS_PER_TOKEN = 1.5
+
+# 같은 담당자의 작업 설명이 이 비율 이상 비슷하면 같은 액션 아이템으로 간주
+DUPLICATE_TASK_RATIO = 0.85
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def segment_tokens(segment: Dict) -> int:
+    """Estimate tokens of one formatted speaker turn ("[spk_0]: text")."""
+    return estimate_tokens(f"[{segment['speaker']}]: {segment['text']}\n")
+
+
+def chunk_speaker_texts(
+    speaker_texts: Union[Transcript, Iterable[Dict]],
+    max_tokens: int,
+    overlap_tokens: int = 0
+) -> Iterator[Union[Transcript, List[Dict]]]:
+    """
+    Split speaker segments into chunks that fit a token budget.
+
+    화자 발화 단위로만 자르므로 한 발화가 두 청크로 나뉘지 않습니다.
+    새 청크는 이전 청크의 마지막 발화들(overlap_tokens 이내)로 시작해서
+    청크 경계에 걸친 맥락이 사라지지 않도록 합니다.
+    max_tokens보다 긴 발화 하나는 그 자체로 하나의 청크가 됩니다.
+
+    Transcript를 받으면 같은 규칙으로 인덱스 범위를 계산해서 Transcript 슬라이스를 돌려줍니다.
+
+    Args:
+        speaker_texts: Speaker segments (Transcript, list or generator)
+        max_tokens: Token budget per chunk
+        overlap_tokens: Tokens of trailing context repeated in the next chunk
+
+    Yields:
+        Transcript slices (for Transcript input) or lists of speaker segments
+    """
+    if isinstance(speaker_texts, Transcript):
+        # segment_tokens와 같은 "[화자]: 텍스트\n" 길이 기준
+        sizes = [
+            math.ceil((len(speaker) + 5 + length) / CHARS_PER_TOKEN)
+            for speaker, length in zip(speaker_texts.speaker_labels(), speaker_texts.text_lengths())
+        ]
+        for start, stop in chunk_ranges(sizes, max_tokens, overlap_tokens):
+            yield speaker_texts[start:stop]
+        return
+
+    chunk: List[Dict] = []
+    chunk_tokens = 0
+    has_new = False  # 오버랩이 아닌 새 발화가 청크에 들어있는지
+
+    for segment in speaker_texts:
+        tokens = segment_tokens(segment)
+
+        if has_new and chunk_tokens + tokens > max_tokens:
+            yield chunk
+
+            # 다음 청크를 이전 청크의 꼬리 발화로 시작
+            overlap: List[Dict] = []
+            overlap_size = 0
+            for previous in reversed(chunk):
+                size = segment_tokens(previous)
+                if overlap_size + size > overlap_tokens or overlap_size + size + tokens > max_tokens:
+                    break
+                overlap.insert(0, previous)
+                overlap_size += size
+
+            chunk, chunk_tokens, has_new = overlap, overlap_size, False
+
+        chunk.append(segment)
+        chunk_tokens += tokens
+        has_new = True
+
+    if has_new:
+        yield chunk
+
+
+def chunk_ranges(
+    sizes: Sequence[int],
+    max_tokens: int,
+    overlap_tokens: int = 0
+) -> Iterator[Tuple[int, int]]:
+    """
+    Index ranges of the chunks chunk_speaker_texts would produce.
+
+    Args:
+        sizes: Token size of each segment
+        max_tokens: Token budget per chunk
+        overlap_tokens: Tokens of trailing context repeated in the next chunk
+
+    Yields:
+        (start, stop) index ranges
+    """
+    start = 0
+    chunk_tokens = 0
+    has_new = False
+
+    for index, tokens in enumerate(sizes):
+        if has_new and chunk_tokens + tokens > max_tokens:
+            yield start, index
+
+            # 다음 청크를 이전 청크의 꼬리 발화로 시작
+            overlap_start = index
+            overlap_size = 0
+            while overlap_start > start:
+                size = sizes[overlap_start - 1]
+                if overlap_size + size > overlap_tokens or overlap_size + size + tokens > max_tokens:
+                    break
+                overlap_start -= 1
+                overlap_size += size
+
+            start, chunk_tokens, has_new = overlap_start, overlap_size, False
+
+        chunk_tokens += tokens
+        has_new = True
+
+    if has_new:
+        yield start, len(sizes)
+
+
+def _normalize_task(text: str) -> str:
+    """Normalize task text for duplicate detection."""
+    return re.sub(r'[\W_]+', '', text or '').lower()
+
+
+def _same_assignee(a: str, b: str) -> bool:
+    """Assignees match if equal or one of them is unknown."""
+    a = (a or 'Unassigned').strip()
+    b = (b or 'Unassigned').strip()
+    return a == b or 'Unassigned' in (a, b)
+
+
+def merge_action_items(item_lists: Iterable[List[Dict]]) -> List[Dict]:
+    """
+    Merge action items extracted from overlapping chunks.
+
+    같은 담당자(또는 담당자 불명)의 비슷한 작업은 하나로 합치며,
+    확신도가 높은 쪽의 설명을 사용하고 담당자와 기한은 알려진 값을 우선합니다.
+
+    Args:
+        item_lists: Action item lists in chunk order
+
+    Returns:
+        Deduplicated action items in first-seen order
+    """
+    merged: List[Dict] = []
+    keys: List[str] = []
+
+    for items in item_lists:
+        for item in items:
+            key = _normalize_task(item.get('task'))
+            duplicate = None
+            for index, existing in enumerate(merged):
+                if not _same_assignee(existing.get('assignee'), item.get('assignee')):
+                    continue
+                if key == keys[index] or SequenceMatcher(None, key, keys[index]).ratio() >= DUPLICATE_TASK_RATIO:
+                    duplicate = index
+                    break
+
+            if duplicate is None:
+                merged.append(dict(item))
+                keys.append(key)
+                continue
+
+            existing = merged[duplicate]
+            if (item.get('confidence') or 0) > (existing.get('confidence') or 0):
+                existing['task'] = item.get('task')
+                existing['confidence'] = item.get('confidence')
+                keys[duplicate] = key
+            if existing.get('assignee') in (None, 'Unassigned') and item.get('assignee'):
+                existing['assignee'] = item['assignee']
+            if not existing.get('due_date') and item.get('due_date'):
+                existing['due_date'] = item['due_date']
+
+    return merged
@@ -0,0 +1,133 @@
+import asyncio
+import itertools
+import json
+import logging
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Subscriber:
+    """Event queue of one connected client, bound to its event loop."""
+
+    __slots__ = ('loop', 'queue', 'closed')
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.closed = False
+
+    def put(self, event: Optional[Dict]) -> None:
+        """Enqueue an event (runs on the subscriber's loop)."""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 따라오지 못하는 클라이언트는 연결을 끊어 재접속 후 전체 조회하도록 함
+            logger.warning("Event subscriber queue full, disconnecting slow client")
+            self.closed = True
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class EventBroker:
+    """
+    In-process pub/sub for task and job change events.
+
+    publish()는 워커 스레드, threadpool 엔드포인트, 이벤트 루프 어디서든 호출할 수 있으며
+    각 구독자의 이벤트 루프로 call_soon_threadsafe를 통해 전달합니다.
+    단일 프로세스 안에서만 전달되므로 여러 워커 프로세스로 실행하면
+    각 프로세스에 연결된 클라이언트만 해당 프로세스의 이벤트를 받습니다.
+    """
+
+    def __init__(self, max_queue: int = 1000):
+        self.max_queue = max_queue
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def publish(self, event_type: str, data: Any) -> None:
+        """
+        Send an event to all connected subscribers.
+
+        Args:
+            event_type: Event name (e.g. "task.updated", "job.updated")
+            data: JSON-serializable payload
+        """
+        event = {"id": next(self._ids), "type": event_type, "data": data}
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.put, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독자
+                self._remove(subscriber)
+
+    async def subscribe(
+        self,
+        heartbeat_seconds: float = 15.0,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Yield Server-Sent Events frames until the broker closes or the client disconnects.
+
+        Args:
+            heartbeat_seconds: Idle time before a keep-alive comment is sent
+            is_disconnected: Async callable (e.g. Request.is_disconnected) checked on every heartbeat
+
+        Yields:
+            SSE-formatted strings
+        """
+        subscriber = _Subscriber(asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            self._subscribers.add(subscriber)
+
+        try:
+            # 연결 직후 바로 응답 헤더와 첫 바이트가 전송되도록 함
+            yield ": connected\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    # 끊긴 클라이언트의 구독은 다음 하트비트에서 정리
+                    if is_disconnected is not None and await is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event is None:
+                    return
+                yield self._format(event)
+        finally:
+            self._remove(subscriber)
+
+    def close(self) -> None:
+        """End all subscriber streams (e.g. on shutdown)."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.put, None)
+            except RuntimeError:
+                pass
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def _remove(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    @staticmethod
+    def _format(event: Dict) -> str:
+        """Format an event as an SSE frame."""
+        data = json.dumps(event["data"], ensure_ascii=False)
+        return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
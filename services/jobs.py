@@ -0,0 +1,337 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Optional
+from database import SessionLocal, Job, JobStatus
+from services.metrics import JOBS_FINISHED, JOBS_IN_PROGRESS
+
+logger = logging.getLogger(__name__)
+
+
+class JobManager:
+    """
+    Background job engine for the transcribe -> extract -> save pipeline.
+
+    작업 상태는 jobs 테이블에 저장되므로 서버가 재시작되어도
+    resume_pending()으로 마지막으로 완료된 단계 이후부터 이어서 실행합니다.
+    워커는 Transcribe 작업을 시작만 하고 반환되며, 공유 폴러의 완료 콜백이 남은 단계를
+    다시 워커 풀에 제출하므로 변환을 기다리는 작업 수는 워커 수에 묶이지 않습니다.
+    """
+
+    # 단계별 진행률 (단계 시작 시점 기준)
+    STAGE_PROGRESS = {
+        "transcribing": 0.1,
+        "analyzing": 0.5,
+        "pushing": 0.8,
+        "saving": 0.8,
+    }
+
+    def __init__(self, pipeline, max_workers: int = 4, session_factory=SessionLocal, events=None):
+        self.pipeline = pipeline
+        self.session_factory = session_factory
+        self.events = events
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="job-worker"
+        )
+        self._stopping = False
+
+    def create_job(
+        self,
+        job_name: str,
+        s3_uri: str,
+        destination: Optional[str] = None,
+        filename: Optional[str] = None,
+        upload_date: Optional[str] = None,
+        audio_duration: Optional[float] = None,
+        content_hash: Optional[str] = None,
+        transcript_uri: Optional[str] = None,
+        summary: Optional[str] = None,
+        action_items: Optional[List[Dict]] = None
+    ) -> int:
+        """
+        Persist a new queued job.
+
+        이미 처리한 녹음의 결과(transcript_uri, summary, action_items)를 넘기면
+        해당 단계는 건너뛰고 남은 단계만 실행합니다.
+
+        Args:
+            job_name: Transcription job name
+            s3_uri: S3 URI of the uploaded audio file
+            destination: "notion", "internal" or None to stop after transcription
+            filename: Original upload filename
+            upload_date: Base date for relative due dates (YYYY-MM-DD)
+            audio_duration: Estimated audio duration in seconds
+            content_hash: SHA-256 of the uploaded file
+            transcript_uri: Transcript URI reused from an earlier job
+            summary: Summary reused from an earlier job
+            action_items: Action items reused from an earlier job
+
+        Returns:
+            Job ID
+        """
+        db = self.session_factory()
+        try:
+            job = Job(
+                job_name=job_name,
+                filename=filename,
+                s3_uri=s3_uri,
+                destination=destination,
+                upload_date=upload_date or datetime.now().strftime("%Y-%m-%d"),
+                audio_duration=audio_duration,
+                content_hash=content_hash,
+                transcript_uri=transcript_uri,
+                summary=summary,
+                action_items=action_items,
+                status=JobStatus.QUEUED
+            )
+            db.add(job)
+            db.commit()
+            self._publish(job)
+            return job.id
+        finally:
+            db.close()
+
+    def submit(self, job_id: int) -> None:
+        """Queue a job for execution on the worker pool."""
+        self.executor.submit(self._run, job_id)
+
+    def get_job(self, job_id: int) -> Optional[Dict]:
+        """
+        Get job state.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Dict with job state or None if the job does not exist
+        """
+        db = self.session_factory()
+        try:
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if not job:
+                return None
+            return self._to_dict(job)
+        finally:
+            db.close()
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[Dict]:
+        """
+        Find the latest job that did not fail for an uploaded file hash.
+
+        Args:
+            content_hash: SHA-256 of the uploaded file
+
+        Returns:
+            Job state dict including the reusable s3_uri, transcript_uri, audio_duration,
+            summary and action_items, or None
+        """
+        db = self.session_factory()
+        try:
+            job = db.query(Job).filter(
+                Job.content_hash == content_hash,
+                Job.status != JobStatus.FAILED
+            ).order_by(Job.id.desc()).first()
+            if not job:
+                return None
+            return {
+                **self._to_dict(job),
+                "s3_uri": job.s3_uri,
+                "transcript_uri": job.transcript_uri,
+                "audio_duration": job.audio_duration,
+                "summary": job.summary,
+                "action_items": job.action_items
+            }
+        finally:
+            db.close()
+
+    def resume_pending(self) -> int:
+        """
+        Re-queue jobs left unfinished by a previous process.
+
+        Returns:
+            Number of resumed jobs
+        """
+        db = self.session_factory()
+        try:
+            job_ids = [
+                job_id for (job_id,) in db.query(Job.id).filter(
+                    Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])
+                ).order_by(Job.id).all()
+            ]
+        finally:
+            db.close()
+
+        for job_id in job_ids:
+            self.submit(job_id)
+
+        if job_ids:
+            logger.info(f"Resumed {len(job_ids)} unfinished jobs")
+        return len(job_ids)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting jobs; unfinished jobs are resumed on next startup."""
+        self._stopping = True
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _transcribed(self, job_id: int, result: Dict) -> None:
+        """Transcription completion callback (poller thread): queue the remaining stages."""
+        if self._stopping:
+            return
+        try:
+            self.executor.submit(self._run, job_id, result)
+        except RuntimeError:
+            # 종료 중인 워커 풀이면 다음 시작 시 resume_pending이 이어서 실행
+            logger.warning(f"Job {job_id} transcribed during shutdown, resuming on next start")
+
+    def _run(self, job_id: int, transcription: Optional[Dict] = None) -> None:
+        """
+        Run the remaining stages of a job.
+
+        Args:
+            job_id: Job ID
+            transcription: Result passed by the transcription callback (None starts transcription)
+        """
+        db = self.session_factory()
+        running = False
+        try:
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if not job or job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                return
+
+            job.status = JobStatus.RUNNING
+            db.commit()
+            JOBS_IN_PROGRESS.inc()
+            running = True
+
+            # 1. 음성 -> 텍스트 변환 (작업만 시작하고 워커 반환, 완료 콜백이 이 메서드를 다시 제출)
+            if not job.transcript_uri:
+                if transcription is None:
+                    self._set_stage(db, job, "transcribing")
+                    self.pipeline.start_transcription(
+                        job.s3_uri, job.job_name, partial(self._transcribed, job_id), job.audio_duration
+                    )
+                    return
+                if transcription['status'] != 'success':
+                    raise Exception(transcription.get('error', 'Transcription failed'))
+                job.transcript_uri = transcription['transcript_uri']
+                db.commit()
+
+            if job.destination is None:
+                self._complete(db, job, {
+                    "status": "success",
+                    "job_name": job.job_name,
+                    "transcript_uri": job.transcript_uri
+                })
+                return
+
+            # 2. 요약 및 액션 아이템 추출
+            if job.action_items is None:
+                self._set_stage(db, job, "analyzing")
+                summary, action_items = self.pipeline.analyze(
+                    job.transcript_uri,
+                    job.upload_date,
+                    job_name=job.job_name,
+                    metadata={"filename": job.filename, "s3_uri": job.s3_uri, "upload_date": job.upload_date}
+                )
+                job.summary = summary
+                job.action_items = action_items
+                db.commit()
+
+            # 3. 선택한 목적지에 저장
+            result = {
+                "status": "success",
+                "job_name": job.job_name,
+                "summary": job.summary,
+                "action_items_count": len(job.action_items),
+                "destination": job.destination
+            }
+            # 저장 결과는 단계마다 바로 기록하고, 재시작 시 기록이 있으면 다시 실행하지 않음
+            if job.destination == "notion":
+                if job.notion_result is None or job.notion_result.get("status") == "partial":
+                    self._set_stage(db, job, "pushing")
+
+                    def record_batch(results: List[Dict]) -> None:
+                        job.notion_result = {"status": "partial", "results": list(results)}
+                        db.commit()
+
+                    done_results = job.notion_result["results"] if job.notion_result else None
+                    job.notion_result = self.pipeline.push_to_notion(job.action_items, done_results, record_batch)
+                    db.commit()
+                result["notion_result"] = job.notion_result
+            else:
+                if job.saved_tasks is None:
+                    self._set_stage(db, job, "saving")
+
+                    def mark_saved(saved_tasks: List[Dict]) -> None:
+                        job.saved_tasks = saved_tasks
+
+                    saved_tasks = self.pipeline.save_internal(db, job.job_name, job.action_items, mark_saved)
+                    if job.saved_tasks is None:
+                        # 저장할 항목이 없으면 INSERT 트랜잭션도 없으므로 따로 기록
+                        job.saved_tasks = saved_tasks
+                        db.commit()
+                result["saved_tasks"] = job.saved_tasks
+
+            self._complete(db, job, result)
+
+        except Exception as e:
+            db.rollback()
+            if self._stopping:
+                # 종료 중 중단된 작업은 실패 처리하지 않고 다음 시작 시 재개
+                logger.warning(f"Job {job_id} interrupted by shutdown: {str(e)}")
+                JOBS_FINISHED.labels(status="interrupted").inc()
+                return
+            logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if job:
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+                db.commit()
+                self._publish(job)
+            JOBS_FINISHED.labels(status="failed").inc()
+        finally:
+            if running:
+                JOBS_IN_PROGRESS.dec()
+            db.close()
+
+    def _set_stage(self, db, job: Job, stage: str) -> None:
+        """Persist the stage a job is entering."""
+        logger.info(f"Job {job.id} ({job.job_name}) stage: {stage}")
+        job.stage = stage
+        job.progress = self.STAGE_PROGRESS.get(stage, job.progress)
+        db.commit()
+        self._publish(job)
+
+    def _complete(self, db, job: Job, result: Dict) -> None:
+        """Mark a job as completed."""
+        job.status = JobStatus.COMPLETED
+        job.stage = None
+        job.progress = 1.0
+        job.result = result
+        db.commit()
+        self._publish(job)
+        JOBS_FINISHED.labels(status="completed").inc()
+        logger.info(f"Job {job.id} ({job.job_name}) completed")
+
+    def _publish(self, job: Job) -> None:
+        """Broadcast the current job state to event subscribers."""
+        if self.events:
+            self.events.publish("job.updated", self._to_dict(job))
+
+    @staticmethod
+    def _to_dict(job: Job) -> Dict:
+        """Convert a Job row to a response dict."""
+        return {
+            "id": job.id,
+            "job_name": job.job_name,
+            "status": job.status.value,
+            "stage": job.stage,
+            "progress": job.progress,
+            "destination": job.destination,
+            "error": job.error,
+            "result": job.result,
+            "created_at": job.created_at.isoformat(),
+            "updated_at": job.updated_at.isoformat()
+        }
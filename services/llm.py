@@ -1,11 +1,19 @@
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.output_parsers import JsonOutputParser
-from typing import List, Dict
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple, Union
 from datetime import datetime, timedelta
+from functools import partial
+import asyncio
 import json
 import re
 import logging
+import time
 from services.bedrock import BedrockService
+from services.chunking import CHARS_PER_TOKEN, chunk_speaker_texts, estimate_tokens, merge_action_items
+from services.llm_cache import LLMResultCache
+from services.metrics import LLM_CACHE_REQUESTS, record_bedrock_call, timed_stage
+from services.transcript import Transcript
+from config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -13,9 +21,21 @@ logger = logging.getLogger(__name__)
 class LLMService:
     """Service for LLM-based text processing using AWS Bedrock."""
     
-    def __init__(self):
-        self.bedrock_service = BedrockService()
+    # 프롬프트 템플릿을 바꾸면 올려서 이전 캐시 결과를 무효화
+    PROMPT_VERSION = 1
+    
+    # 부분 요약 통합 단계 수 상한 (단계마다 요약 수가 절반 이하로 줄어듦)
+    MAX_REDUCE_DEPTH = 8
+    
+    def __init__(self, bedrock_service: Optional[BedrockService] = None):
+        # 같은 Bedrock 클라이언트를 공유하도록 외부에서 주입 가능
+        self.bedrock_service = bedrock_service or BedrockService()
         self.llm = self.bedrock_service.get_llm()
+        self.cache = LLMResultCache(
+            settings.llm_cache_path,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_bytes=settings.llm_cache_max_bytes
+        ) if settings.llm_cache_enabled else None
     
     def summarize_meeting(self, transcript: str) -> str:
         """
@@ -27,6 +47,120 @@ class LLMService:
         Returns:
             Summary text
         """
+        key = self._cache_key('summary', transcript)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        response = self._invoke(self._summary_messages(transcript))
+        self._cache_set(key, response.content)
+        return response.content
+    
+    async def asummarize_meeting(self, transcript: str, timeout: Optional[float] = None) -> str:
+        """
+        Async variant of summarize_meeting.
+        
+        Args:
+            transcript: Full meeting transcript
+            timeout: Seconds before the call is cancelled (default: settings.llm_timeout_seconds)
+            
+        Returns:
+            Summary text
+        """
+        key = self._cache_key('summary', transcript)
+        cached = await self._acache_get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self._ainvoke(self._summary_messages(transcript), timeout)
+        await self._acache_set(key, response.content)
+        return response.content
+    
+    def cache_stats(self) -> Optional[Dict]:
+        """Return LLM cache hit/miss counters, or None if caching is disabled."""
+        return self.cache.stats() if self.cache else None
+    
+    def _cache_key(self, kind: str, content, upload_date: str = None) -> str:
+        """Hash of model, prompt version, chunking settings, transcript and base date."""
+        if not isinstance(content, str):
+            content = self._format_transcript(content)
+        return LLMResultCache.make_key(
+            getattr(self.llm, 'model_id', None),
+            self.PROMPT_VERSION,
+            settings.llm_chunk_max_tokens,
+            settings.llm_chunk_overlap_tokens,
+            kind,
+            content,
+            upload_date
+        )
+    
+    def _cache_get(self, key: str):
+        """Return a cached result or None."""
+        if self.cache is None:
+            return None
+        try:
+            value = self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+        LLM_CACHE_REQUESTS.labels(result="miss" if value is None else "hit").inc()
+        return value
+    
+    def _cache_set(self, key: str, value) -> None:
+        """Store a result in the cache."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, value)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+    
+    async def _acache_get(self, key: str):
+        """Async _cache_get; the SQLite lookup runs in a worker thread so the event loop is not blocked."""
+        if self.cache is None:
+            return None
+        return await asyncio.to_thread(self._cache_get, key)
+    
+    async def _acache_set(self, key: str, value) -> None:
+        """Async _cache_set; the SQLite write runs in a worker thread."""
+        if self.cache is None:
+            return
+        await asyncio.to_thread(self._cache_set, key, value)
+    
+    def _invoke(self, messages: List):
+        """Invoke the LLM and record call metrics."""
+        started = time.perf_counter()
+        try:
+            response = self.llm.invoke(messages)
+        except Exception:
+            record_bedrock_call(time.perf_counter() - started, outcome="error")
+            raise
+        record_bedrock_call(time.perf_counter() - started, response)
+        return response
+    
+    async def _ainvoke(self, messages: List, timeout: Optional[float] = None):
+        """
+        Invoke the LLM asynchronously with a timeout and record call metrics.
+        
+        wait_for는 이 코루틴만 취소하므로, 실행기 스레드의 Bedrock 요청은 BedrockService 클라이언트의
+        read_timeout(settings.llm_timeout_seconds)에서 끝납니다. 따라서 그보다 긴 timeout은 효과가 없습니다.
+        """
+        if timeout is None:
+            timeout = settings.llm_timeout_seconds
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(self.llm.ainvoke(messages), timeout)
+        except asyncio.TimeoutError:
+            record_bedrock_call(time.perf_counter() - started, outcome="timeout")
+            raise Exception(f"Bedrock call timed out after {timeout:g}s")
+        except Exception:
+            record_bedrock_call(time.perf_counter() - started, outcome="error")
+            raise
+        record_bedrock_call(time.perf_counter() - started, response)
+        return response
+    
+    def _summary_messages(self, transcript: str) -> List:
+        """Build prompt messages for meeting summary."""
         system_prompt = SystemMessage(content="""당신은 효율적인 프로젝트 관리 어시스턴트입니다.
 회의록을 간결하고 명확하게 요약하는 것이 당신의 역할입니다.
 주요 논의 사항, 결정 사항, 중요한 포인트를 중심으로 요약하세요.""")
@@ -40,30 +174,276 @@ class LLMService:
 - 결정된 사항
 - 기타 중요 포인트""")
         
-        response = self.llm.invoke([system_prompt, human_prompt])
-        return response.content
+        return [system_prompt, human_prompt]
+    
+    def _reduce_messages(self, summaries: List[str]) -> List:
+        """Build prompt messages for combining partial summaries."""
+        system_prompt = SystemMessage(content="""당신은 효율적인 프로젝트 관리 어시스턴트입니다.
+긴 회의를 여러 부분으로 나누어 작성한 부분 요약들을 하나의 회의 요약으로 통합하는 것이 당신의 역할입니다.
+중복된 내용은 합치고, 주요 논의 사항, 결정 사항, 중요한 포인트를 중심으로 요약하세요.""")
+        
+        partial_summaries = "\n\n".join([
+            f"[부분 {index}]\n{summary}"
+            for index, summary in enumerate(summaries, start=1)
+        ])
+        
+        human_prompt = HumanMessage(content=f"""다음 부분 요약들을 하나의 회의 요약으로 통합해주세요:
+
+{partial_summaries}
+
+요약 형식:
+- 주요 논의 사항
+- 결정된 사항
+- 기타 중요 포인트""")
+        
+        return [system_prompt, human_prompt]
     
-    def extract_action_items(self, speaker_texts: List[Dict], upload_date: str = None) -> List[Dict]:
+    def extract_action_items(self, speaker_texts: Union[Transcript, List[Dict]], upload_date: str = None) -> List[Dict]:
         """
         Extract action items from speaker-labeled transcript.
         
         Args:
-            speaker_texts: List of dicts with speaker and text
+            speaker_texts: Transcript or list of dicts with speaker and text
             upload_date: Upload date for relative date conversion (YYYY-MM-DD)
             
         Returns:
             List of action items in JSON format
         """
+        key = self._cache_key('action_items', speaker_texts, upload_date)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        response = self._invoke(self._action_item_messages(speaker_texts, upload_date))
+        action_items = self._parse_action_items(response.content)
+        # 빈 결과는 JSON 파싱 실패일 수 있으므로 캐시하지 않음
+        if action_items:
+            self._cache_set(key, action_items)
+        return action_items
+    
+    async def aextract_action_items(
+        self,
+        speaker_texts: Union[Transcript, List[Dict]],
+        upload_date: str = None,
+        timeout: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Async variant of extract_action_items.
+        
+        Args:
+            speaker_texts: Transcript or list of dicts with speaker and text
+            upload_date: Upload date for relative date conversion (YYYY-MM-DD)
+            timeout: Seconds before the call is cancelled (default: settings.llm_timeout_seconds)
+            
+        Returns:
+            List of action items in JSON format
+        """
+        key = self._cache_key('action_items', speaker_texts, upload_date)
+        cached = await self._acache_get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self._ainvoke(self._action_item_messages(speaker_texts, upload_date), timeout)
+        action_items = self._parse_action_items(response.content)
+        # 빈 결과는 JSON 파싱 실패일 수 있으므로 캐시하지 않음
+        if action_items:
+            await self._acache_set(key, action_items)
+        return action_items
+    
+    @timed_stage("llm_analyze")
+    async def analyze_meeting(
+        self,
+        speaker_texts: Union[Transcript, List[Dict]],
+        upload_date: str = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[str, List[Dict]]:
+        """
+        Run meeting summary and action item extraction concurrently.
+        
+        요약과 추출은 서로 독립적이므로 동시에 실행합니다.
+        트랜스크립트가 settings.llm_chunk_max_tokens를 넘으면 화자 발화 단위로
+        청크를 나누어 병렬로 처리(map)한 뒤, 부분 요약은 한 번 더 요약하고
+        액션 아이템은 중복을 제거해 합칩니다(reduce).
+        한 호출이라도 실패하거나 시간 초과되면 나머지 호출도 취소합니다.
+        
+        Args:
+            speaker_texts: Transcript or list of dicts with speaker and text
+            upload_date: Upload date for relative date conversion (YYYY-MM-DD)
+            timeout: Per-call timeout in seconds (default: settings.llm_timeout_seconds)
+            
+        Returns:
+            Tuple of (summary, action_items)
+        """
+        key = self._cache_key('analysis', speaker_texts, upload_date)
+        cached = await self._acache_get(key)
+        if cached is not None:
+            return cached[0], cached[1]
+        
+        summary, action_items = await self._analyze_meeting(speaker_texts, upload_date, timeout)
+        if action_items:
+            await self._acache_set(key, [summary, action_items])
+        return summary, action_items
+    
+    async def _analyze_meeting(
+        self,
+        speaker_texts: Union[Transcript, List[Dict]],
+        upload_date: str = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[str, List[Dict]]:
+        """Uncached map-reduce implementation of analyze_meeting."""
+        chunks = list(chunk_speaker_texts(
+            speaker_texts,
+            settings.llm_chunk_max_tokens,
+            settings.llm_chunk_overlap_tokens
+        ))
+        
+        if len(chunks) <= 1:
+            chunk = chunks[0] if chunks else []
+            summary, action_items = await self._gather([
+                partial(self.asummarize_meeting, self._format_transcript(chunk), timeout),
+                partial(self.aextract_action_items, chunk, upload_date, timeout)
+            ])
+            return summary, action_items
+        
+        logger.info(f"Transcript split into {len(chunks)} chunks")
+        
+        # map/reduce 전체에서 동시 Bedrock 호출 수를 하나의 세마포어로 제한
+        semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+        
+        # map: 청크별 요약과 액션 아이템 추출
+        results = await self._gather(
+            [partial(self.asummarize_meeting, self._format_transcript(chunk), timeout) for chunk in chunks] +
+            [partial(self.aextract_action_items, chunk, upload_date, timeout) for chunk in chunks],
+            semaphore=semaphore
+        )
+        partial_summaries = results[:len(chunks)]
+        item_lists = results[len(chunks):]
+        
+        # reduce: 부분 요약 통합 및 액션 아이템 병합
+        summary = await self._areduce_summaries(partial_summaries, timeout, semaphore)
+        action_items = merge_action_items(item_lists)
+        logger.info(f"Merged {sum(len(items) for items in item_lists)} chunk action items into {len(action_items)}")
+        
+        return summary, action_items
+    
+    async def _areduce_summaries(
+        self,
+        summaries: List[str],
+        timeout: Optional[float] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> str:
+        """
+        Combine partial summaries, in several passes if they exceed the chunk budget.
+        
+        각 단계에서는 예산 안에 들어가도록 묶되 한 묶음에 최소 두 개의 요약을 넣으므로
+        단계마다 요약 수가 절반 이하로 줄어듭니다. MAX_REDUCE_DEPTH 단계 후에도 남으면
+        예산에 맞게 잘라서 한 번에 통합합니다.
+        
+        Args:
+            summaries: Partial summaries in transcript order
+            timeout: Per-call timeout in seconds
+            semaphore: Concurrency limit shared with the map stage
+            
+        Returns:
+            Combined summary
+        """
+        semaphore = semaphore or asyncio.Semaphore(settings.llm_max_concurrency)
+        
+        for _ in range(self.MAX_REDUCE_DEPTH):
+            if len(summaries) <= 1:
+                return summaries[0] if summaries else ""
+            
+            groups = self._group_summaries(summaries, settings.llm_chunk_max_tokens)
+            summaries = await self._gather(
+                [partial(self._areduce_group, group, timeout) for group in groups],
+                semaphore=semaphore
+            )
+        
+        if len(summaries) == 1:
+            return summaries[0]
+        async with semaphore:
+            return await self._areduce_group(summaries, timeout)
+    
+    async def _areduce_group(self, summaries: List[str], timeout: Optional[float] = None) -> str:
+        """Combine one group of summaries with a single LLM call."""
+        if len(summaries) == 1:
+            return summaries[0]
+        
+        # 묶음이 예산을 넘으면 요약마다 같은 몫만큼만 남기고 자름
+        budget_chars = int(settings.llm_chunk_max_tokens * CHARS_PER_TOKEN / len(summaries))
+        if sum(estimate_tokens(summary) for summary in summaries) > settings.llm_chunk_max_tokens:
+            summaries = [summary[:budget_chars] for summary in summaries]
+        
+        response = await self._ainvoke(self._reduce_messages(summaries), timeout)
+        return response.content
+    
+    @staticmethod
+    def _group_summaries(summaries: List[str], max_tokens: int) -> List[List[str]]:
+        """Split summaries into budget-sized groups of at least two (unless only one is given)."""
+        groups = [[]]
+        group_tokens = 0
+        for summary in summaries:
+            tokens = estimate_tokens(summary)
+            if len(groups[-1]) >= 2 and group_tokens + tokens > max_tokens:
+                groups.append([])
+                group_tokens = 0
+            groups[-1].append(summary)
+            group_tokens += tokens
+        
+        # 마지막 묶음이 하나뿐이면 앞 묶음에 합쳐서 매 단계 입력이 줄어들도록 함
+        if len(groups) > 1 and len(groups[-1]) == 1:
+            groups[-2].extend(groups.pop())
+        return groups
+    
+    @staticmethod
+    async def _gather(
+        factories: List[Callable[[], Awaitable]],
+        limit: Optional[int] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List:
+        """Await coroutine factories concurrently; cancel all if one fails."""
+        if semaphore is None and limit:
+            semaphore = asyncio.Semaphore(limit)
+        
+        async def run(factory):
+            if semaphore is None:
+                return await factory()
+            async with semaphore:
+                return await factory()
+        
+        tasks = [asyncio.ensure_future(run(factory)) for factory in factories]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    @staticmethod
+    def _format_transcript(speaker_texts: Union[Transcript, List[Dict]]) -> str:
+        """Format speaker segments as plain text for summarization."""
+        if isinstance(speaker_texts, Transcript):
+            return speaker_texts.format_lines("{speaker}: {text}")
+        return "\n".join([
+            f"{item['speaker']}: {item['text']}"
+            for item in speaker_texts
+        ])
+    
+    def _action_item_messages(self, speaker_texts: Union[Transcript, List[Dict]], upload_date: str = None) -> List:
+        """Build prompt messages for action item extraction."""
         if upload_date is None:
             upload_date = datetime.now().strftime("%Y-%m-%d")
         
         base_date = datetime.strptime(upload_date, "%Y-%m-%d")
         
         # 화자별 텍스트를 포맷팅
-        formatted_transcript = "\n".join([
-            f"[{item['speaker']}]: {item['text']}"
-            for item in speaker_texts
-        ])
+        if isinstance(speaker_texts, Transcript):
+            formatted_transcript = speaker_texts.format_lines("[{speaker}]: {text}")
+        else:
+            formatted_transcript = "\n".join([
+                f"[{item['speaker']}]: {item['text']}"
+                for item in speaker_texts
+            ])
         
         system_prompt = SystemMessage(content=f"""당신은 회의록에서 액션 아이템을 추출하는 전문가입니다.
 
@@ -100,12 +480,13 @@ JSON 형식으로만 응답:
 
 JSON 형식으로만 응답하세요.""")
         
-        response = self.llm.invoke([system_prompt, human_prompt])
-        
+        return [system_prompt, human_prompt]
+    
+    def _parse_action_items(self, content: str) -> List[Dict]:
+        """Extract the JSON action item list from an LLM response."""
         # JSON 파싱
         try:
             # 응답에서 JSON 부분만 추출
-            content = response.content
             json_match = re.search(r'\[.*\]', content, re.DOTALL)
             if json_match:
                 action_items = json.loads(json_match.group())
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResultCache:
+    """
+    Persistent content-addressed cache for LLM results (SQLite).
+
+    키는 모델 ID, 프롬프트 템플릿 버전, 트랜스크립트 내용, 기준 날짜의 해시이므로
+    같은 회의를 다시 처리하면 Bedrock을 호출하지 않고 저장된 결과를 반환합니다.
+    TTL이 지난 항목은 조회 시 무시되고, 전체 크기가 max_bytes를 넘으면
+    가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_llm_cache_accessed_at ON llm_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from JSON-serializable parts."""
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key from make_key
+            default: Returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return default
+
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value and evict old entries if the cache is too large."""
+        data = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current cache size."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": size
+        }
+
+    def _evict(self, now: float) -> None:
+        """Delete expired entries, then least recently used ones over max_bytes."""
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        stale_keys = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY accessed_at"
+        ):
+            stale_keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", stale_keys)
+        logger.info(f"Evicted {len(stale_keys)} LLM cache entries")
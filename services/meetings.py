@@ -0,0 +1,205 @@
+from typing import Dict, Iterable, List, Optional, Union
+from sqlalchemy.exc import IntegrityError
+from database import SessionLocal, Meeting
+from services.transcript import Transcript
+
+
+class MeetingStore:
+    """
+    Local store of parsed transcripts and analysis results.
+
+    한 번 파싱한 트랜스크립트와 요약/액션 아이템을 job_name 기준으로 저장해서
+    재처리, 프롬프트 변경 후 재추출, Notion 재전송 시 AWS에서 다시 받지 않고 읽습니다.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+
+    def get(self, job_name: str, include_segments: bool = False) -> Optional[Dict]:
+        """
+        Get a stored meeting.
+
+        Args:
+            job_name: Transcribe job name
+            include_segments: Decode and include speaker segments
+
+        Returns:
+            Dict with meeting metadata, summary and action items, or None
+        """
+        db = self.session_factory()
+        try:
+            meeting = db.query(Meeting).filter(Meeting.job_name == job_name).first()
+            if not meeting:
+                return None
+            return self._to_dict(meeting, include_segments)
+        finally:
+            db.close()
+
+    def get_segments(self, job_name: str) -> Optional[Transcript]:
+        """
+        Get stored speaker segments.
+
+        Args:
+            job_name: Transcribe job name
+
+        Returns:
+            Transcript or None if the transcript has not been stored
+        """
+        db = self.session_factory()
+        try:
+            data = db.query(Meeting.segments).filter(Meeting.job_name == job_name).scalar()
+        finally:
+            db.close()
+        return Transcript.from_bytes(data) if data is not None else None
+
+    def get_time_map(self, job_name: str) -> Optional[List[List[float]]]:
+        """
+        Get the preprocessing time map of a meeting.
+
+        Args:
+            job_name: Transcribe job name
+
+        Returns:
+            List of [processed start, original start] pairs, or None if the audio was not trimmed
+        """
+        db = self.session_factory()
+        try:
+            return db.query(Meeting.time_map).filter(Meeting.job_name == job_name).scalar()
+        finally:
+            db.close()
+
+    def save_time_map(self, job_name: str, time_map: List[List[float]], **metadata) -> None:
+        """
+        Store the time map of preprocessed (silence-trimmed) audio.
+
+        Args:
+            job_name: Transcribe job name
+            time_map: List of [processed start, original start] pairs in seconds
+            **metadata: Meeting columns to set (filename, s3_uri, upload_date)
+        """
+        self._upsert(
+            job_name,
+            time_map=time_map,
+            **{key: value for key, value in metadata.items() if value is not None}
+        )
+
+    def save_transcript(
+        self,
+        job_name: str,
+        speaker_texts: Union[Transcript, Iterable[Dict]],
+        **metadata
+    ) -> None:
+        """
+        Store parsed speaker segments.
+
+        Args:
+            job_name: Transcribe job name
+            speaker_texts: Parsed speaker segments
+            **metadata: Meeting columns to set (filename, s3_uri, transcript_uri, upload_date)
+        """
+        transcript = Transcript.from_segments(speaker_texts)
+        self._upsert(
+            job_name,
+            segments=transcript.to_bytes(),
+            segment_count=len(transcript),
+            speaker_count=len(set(transcript.speaker_labels())),
+            duration=transcript.duration,
+            **{key: value for key, value in metadata.items() if value is not None}
+        )
+
+    def copy_transcript(self, source_job_name: str, job_name: str, **metadata) -> bool:
+        """
+        Copy the stored transcript and time map of one meeting to another.
+
+        같은 녹음을 다시 업로드한 경우 새 작업이 Transcribe 결과를 다시 파싱하지 않도록 사용합니다.
+
+        Args:
+            source_job_name: Job name of the meeting to copy from
+            job_name: Job name of the new meeting
+            **metadata: Meeting columns to set (filename, upload_date)
+
+        Returns:
+            True if stored speaker segments were copied
+        """
+        db = self.session_factory()
+        try:
+            source = db.query(Meeting).filter(Meeting.job_name == source_job_name).first()
+            if source is None:
+                return False
+            values = {
+                column: getattr(source, column)
+                for column in ("s3_uri", "transcript_uri", "speaker_count", "segment_count",
+                               "duration", "segments", "time_map")
+            }
+        finally:
+            db.close()
+
+        values.update(metadata)
+        self._upsert(job_name, **{key: value for key, value in values.items() if value is not None})
+        return values["segments"] is not None
+
+    def save_analysis(
+        self,
+        job_name: str,
+        summary: str,
+        action_items: List[Dict],
+        prompt_version: Optional[int] = None
+    ) -> None:
+        """
+        Store the meeting summary and extracted action items.
+
+        Args:
+            job_name: Transcribe job name
+            summary: Meeting summary
+            action_items: Extracted action items
+            prompt_version: LLM prompt version used for the analysis
+        """
+        self._upsert(job_name, summary=summary, action_items=action_items, prompt_version=prompt_version)
+
+    def _upsert(self, job_name: str, **values) -> None:
+        """Update the meeting row, creating it on first write."""
+        for attempt in range(2):
+            db = self.session_factory()
+            try:
+                meeting = db.query(Meeting).filter(Meeting.job_name == job_name).first()
+                if meeting is None:
+                    meeting = Meeting(job_name=job_name)
+                    db.add(meeting)
+                for key, value in values.items():
+                    setattr(meeting, key, value)
+                db.commit()
+                return
+            except IntegrityError:
+                db.rollback()
+                # 다른 요청이 같은 회의를 먼저 만든 경우 한 번 더 시도해서 갱신
+                if attempt:
+                    raise
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+    @staticmethod
+    def _to_dict(meeting: Meeting, include_segments: bool = False) -> Dict:
+        """Convert a Meeting row to a response dict."""
+        result = {
+            "job_name": meeting.job_name,
+            "filename": meeting.filename,
+            "s3_uri": meeting.s3_uri,
+            "transcript_uri": meeting.transcript_uri,
+            "upload_date": meeting.upload_date,
+            "speaker_count": meeting.speaker_count,
+            "segment_count": meeting.segment_count,
+            "duration": meeting.duration,
+            "summary": meeting.summary,
+            "action_items": meeting.action_items,
+            "prompt_version": meeting.prompt_version,
+            "created_at": meeting.created_at.isoformat() if meeting.created_at else None,
+            "updated_at": meeting.updated_at.isoformat() if meeting.updated_at else None
+        }
+        if include_segments:
+            result["speaker_texts"] = (
+                Transcript.from_bytes(meeting.segments).to_list() if meeting.segments is not None else None
+            )
+        return result
@@ -0,0 +1,181 @@
+"""
+Prometheus metrics for the meeting pipeline.
+
+각 서비스는 timed_stage 데코레이터나 stage_timer 컨텍스트 매니저로 단계별 소요 시간을 기록하고,
+/metrics 엔드포인트가 render_metrics()의 결과를 그대로 반환합니다.
+메트릭은 프로세스별로 집계되므로 여러 워커 프로세스로 실행하면 워커마다 따로 수집됩니다.
+"""
+import asyncio
+import functools
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional, Tuple
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from sqlalchemy import event
+
+# 회의 처리 단계는 수십 ms(파싱)부터 수십 분(Transcribe 대기)까지 걸림
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+STAGE_SECONDS = Histogram(
+    "action_stage_duration_seconds",
+    "Latency of pipeline stages",
+    ["stage"],
+    buckets=STAGE_BUCKETS
+)
+STAGE_ERRORS = Counter(
+    "action_stage_errors_total",
+    "Pipeline stages that raised an exception",
+    ["stage"]
+)
+
+BEDROCK_CALLS = Counter(
+    "action_bedrock_calls_total",
+    "Bedrock model invocations",
+    ["outcome"]
+)
+BEDROCK_CALL_SECONDS = Histogram(
+    "action_bedrock_call_duration_seconds",
+    "Latency of single Bedrock model invocations",
+    buckets=STAGE_BUCKETS
+)
+BEDROCK_TOKENS = Counter(
+    "action_bedrock_tokens_total",
+    "Bedrock tokens reported by the model",
+    ["type"]
+)
+LLM_CACHE_REQUESTS = Counter(
+    "action_llm_cache_requests_total",
+    "LLM result cache lookups",
+    ["result"]
+)
+
+NOTION_REQUESTS = Counter(
+    "action_notion_requests_total",
+    "Notion API requests by response status (including retries)",
+    ["method", "status"]
+)
+NOTION_RATE_LIMITED = Counter(
+    "action_notion_rate_limited_total",
+    "Notion API responses with status 429"
+)
+
+JOBS_IN_PROGRESS = Gauge(
+    "action_jobs_in_progress",
+    "Pipeline jobs currently running on the worker pool"
+)
+JOBS_FINISHED = Counter(
+    "action_jobs_finished_total",
+    "Pipeline jobs that finished",
+    ["status"]
+)
+
+DB_QUERY_SECONDS = Histogram(
+    "action_db_query_duration_seconds",
+    "Latency of database statements",
+    ["operation"],
+    buckets=DB_BUCKETS
+)
+
+_DB_OPERATIONS = {"select", "insert", "update", "delete"}
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """Record the duration (and failure) of a block as a pipeline stage."""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.labels(stage=stage).inc()
+        raise
+    finally:
+        STAGE_SECONDS.labels(stage=stage).observe(time.perf_counter() - started)
+
+
+def timed_stage(stage: str) -> Callable:
+    """
+    Decorator recording each call of a sync or async function as a pipeline stage.
+
+    Args:
+        stage: Stage label (e.g. "s3_upload", "transcript_parse")
+    """
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with stage_timer(stage):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def record_bedrock_call(seconds: float, response=None, outcome: str = "success") -> None:
+    """
+    Record one Bedrock invocation.
+
+    Args:
+        seconds: Call latency
+        response: LangChain AIMessage (token usage is read from it if present)
+        outcome: "success", "error" or "timeout"
+    """
+    BEDROCK_CALLS.labels(outcome=outcome).inc()
+    BEDROCK_CALL_SECONDS.observe(seconds)
+
+    input_tokens, output_tokens = _token_usage(response)
+    if input_tokens:
+        BEDROCK_TOKENS.labels(type="input").inc(input_tokens)
+    if output_tokens:
+        BEDROCK_TOKENS.labels(type="output").inc(output_tokens)
+
+
+def _token_usage(response) -> Tuple[Optional[int], Optional[int]]:
+    """Extract (input, output) token counts from a LangChain response."""
+    if response is None:
+        return None, None
+
+    usage = getattr(response, "usage_metadata", None)
+    if usage:
+        return usage.get("input_tokens"), usage.get("output_tokens")
+
+    # 구버전 langchain-aws는 response_metadata.usage에만 기록
+    usage = (getattr(response, "response_metadata", None) or {}).get("usage") or {}
+    return usage.get("prompt_tokens"), usage.get("completion_tokens")
+
+
+def instrument_engine(engine) -> None:
+    """
+    Time every statement executed on a (sync) SQLAlchemy engine.
+
+    비동기 엔진은 async_engine.sync_engine을 전달합니다.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        operation = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else "other"
+        if operation not in _DB_OPERATIONS:
+            operation = "other"
+        DB_QUERY_SECONDS.labels(operation=operation).observe(time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+        stack = context.connection.info.get("query_started") if context.connection else None
+        if stack:
+            stack.pop()
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Return (payload, content type) for the /metrics endpoint."""
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -1,14 +1,61 @@
 import requests
 import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 from typing import Dict, List, Optional
 from config import settings
+from services.metrics import NOTION_RATE_LIMITED, NOTION_REQUESTS, timed_stage
 
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._paused_until:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                    self._updated_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._paused_until - now
+            time.sleep(wait)
+    
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given time (e.g. after HTTP 429)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._updated_at = self._paused_until
+
+
 class NotionService:
     """Service for Notion API integration."""
     
+    # 재시도할 HTTP 상태 코드 (429 Rate Limit, 일시적인 서버 오류)
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    # 다시 보내도 결과가 같은 메서드 (POST 페이지 생성은 서버에서 이미 처리됐을 수 있음)
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    
     def __init__(self):
         self.api_key = settings.notion_api_key
         self.database_id = settings.notion_database_id
@@ -18,6 +65,18 @@ class NotionService:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28"
         }
+        
+        # keep-alive 연결을 재사용하는 공유 세션
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.notion_max_concurrency
+        )
+        self.session.mount("https://", adapter)
+        
+        # Notion API 평균 요청 제한 (약 3 req/s)
+        self.rate_limiter = TokenBucket(settings.notion_rate_limit)
     
     def create_task_page(self, action_item: Dict) -> Dict:
         """
@@ -83,7 +142,7 @@ class NotionService:
         }
         
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = self._request("POST", url, json=payload)
             response.raise_for_status()
             return {
                 "status": "success",
@@ -101,30 +160,40 @@ class NotionService:
                 "error": error_detail
             }
     
+    @timed_stage("notion_push")
     def create_multiple_tasks(self, action_items: List[Dict]) -> List[Dict]:
         """
         Create multiple task pages in Notion.
         
+        페이지는 공유 세션으로 동시에 생성하며, 전체 요청 속도는
+        토큰 버킷으로 Notion 제한 이하로 유지합니다. 결과 순서는 입력 순서와 같습니다.
+        
         Args:
             action_items: List of action item dicts
             
         Returns:
             List of results for each task creation
         """
-        results = []
-        for item in action_items:
-            logger.info(f"Creating Notion task: {item.get('task', 'Unknown')}")
-            result = self.create_task_page(item)
-            if result['status'] == 'success':
-                logger.info(f"Successfully created task: {item.get('task')}")
-            else:
-                logger.error(f"Failed to create task: {item.get('task')} - {result.get('error')}")
-            results.append({
-                "task": item['task'],
-                "assignee": item.get('assignee', 'Unassigned'),
-                "result": result
-            })
-        return results
+        if not action_items:
+            return []
+        
+        workers = min(settings.notion_max_concurrency, len(action_items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notion") as executor:
+            return list(executor.map(self._create_task_with_result, action_items))
+    
+    def _create_task_with_result(self, item: Dict) -> Dict:
+        """Create one page and wrap the result with task and assignee."""
+        logger.info(f"Creating Notion task: {item.get('task', 'Unknown')}")
+        result = self.create_task_page(item)
+        if result['status'] == 'success':
+            logger.info(f"Successfully created task: {item.get('task')}")
+        else:
+            logger.error(f"Failed to create task: {item.get('task')} - {result.get('error')}")
+        return {
+            "task": item['task'],
+            "assignee": item.get('assignee', 'Unassigned'),
+            "result": result
+        }
     
     def get_database_properties(self) -> Dict:
         """
@@ -136,7 +205,7 @@ class NotionService:
         url = f"{self.base_url}/databases/{self.database_id}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._request("GET", url)
             response.raise_for_status()
             return response.json().get('properties', {})
         except requests.exceptions.RequestException as e:
@@ -144,3 +213,79 @@ class NotionService:
                 "status": "error",
                 "error": str(e)
             }
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a rate-limited request with bounded retries.
+        
+        429 응답은 Retry-After 헤더만큼 모든 요청을 멈추고, 일시적인 오류는
+        지수 백오프에 지터를 더해 재시도합니다. 마지막 응답은 그대로 반환합니다.
+        POST처럼 멱등이 아닌 요청은 서버가 처리하지 않은 것이 확실한 경우
+        (429, 연결 수립 실패)에만 재시도하고, 응답 대기 시간 초과나 5xx는 중복 생성을
+        막기 위해 그대로 호출한 쪽에 돌려줍니다.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            
+        Returns:
+            Response of the last attempt
+        """
+        max_retries = settings.notion_max_retries
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire()
+            
+            try:
+                response = self.session.request(method, url, timeout=30, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                NOTION_REQUESTS.labels(method=method, status="connection_error").inc()
+                if attempt == max_retries or not (idempotent or self._not_sent(e)):
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+            
+            NOTION_REQUESTS.labels(method=method, status=str(response.status_code)).inc()
+            if response.status_code == 429:
+                NOTION_RATE_LIMITED.inc()
+            
+            retryable = response.status_code == 429 or (
+                idempotent and response.status_code in self.RETRY_STATUS_CODES
+            )
+            if not retryable or attempt == max_retries:
+                return response
+            
+            if response.status_code == 429:
+                delay = self._retry_after(response) or self._backoff(attempt)
+                logger.warning(f"Notion rate limited, retrying in {delay:.1f}s")
+                self.rate_limiter.pause(delay)
+            else:
+                delay = self._backoff(attempt)
+                logger.warning(f"Notion returned {response.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+        
+        return response
+    
+    @staticmethod
+    def _not_sent(error: requests.exceptions.RequestException) -> bool:
+        """Whether a request failed before it reached Notion (connection never established)."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+            # urllib3는 연결 수립 실패를 MaxRetryError(reason=NewConnectionError)로 전달
+            return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+        return False
+    
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        return random.uniform(0, min(30.0, 0.5 * (2 ** attempt)))
+    
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Parse the Retry-After header (seconds)."""
+        try:
+            return float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return None
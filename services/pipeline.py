@@ -0,0 +1,288 @@
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from config import settings
+from database import bulk_create_tasks
+from models import ActionItem
+from services.audio import original_time_mapper
+from services.metrics import timed_stage
+from services.transcript import Transcript
+
+logger = logging.getLogger(__name__)
+
+# 분할 변환처럼 트랜스크립트가 회의 저장소에만 있는 경우의 transcript_uri 접두사
+STORED_TRANSCRIPT_SCHEME = "meeting://"
+
+
+class TranscriptionNotReadyError(Exception):
+    """Raised when a transcription job has not completed yet."""
+
+
+class MeetingPipeline:
+    """
+    Stages of the meeting processing pipeline.
+
+    각 단계는 HTTP 엔드포인트와 백그라운드 작업 워커가 함께 사용합니다.
+    모든 메서드는 블로킹 호출이므로 워커 스레드나 threadpool에서 실행해야 합니다.
+    """
+
+    def __init__(self, transcription_service, llm_service, notion_service, events=None, meetings=None):
+        self.transcription_service = transcription_service
+        self.llm_service = llm_service
+        self.notion_service = notion_service
+        self.events = events
+        self.meetings = meetings
+
+    def start_transcription(
+        self,
+        s3_uri: str,
+        job_name: str,
+        on_done: Callable[[Dict], None],
+        expected_duration: Optional[float] = None
+    ) -> None:
+        """
+        Start Amazon Transcribe for an uploaded audio file without waiting for it.
+
+        작업을 시작해 공유 폴러에 등록한 뒤 바로 반환하며, 작업이 끝나면 폴러 스레드에서
+        on_done({'status', 'transcript_uri' 또는 'error'})이 호출됩니다.
+        긴 WAV 녹음은 조각으로 나누어 변환한 결과를 합쳐서 회의 저장소에 저장하고,
+        이 스레드에서 meeting://{job_name} 형식의 URI로 on_done을 호출합니다 (load_transcript가 저장소에서 읽음).
+
+        Args:
+            s3_uri: S3 URI of the audio file
+            job_name: Transcription job name
+            on_done: Completion callback receiving the result dict
+            expected_duration: Estimated audio duration in seconds
+        """
+        if self.meetings and self.transcription_service.should_split(s3_uri):
+            transcript = self.to_original_time(job_name, self.transcription_service.transcribe_split(s3_uri, job_name))
+            # 조각별 결과는 하나의 Transcribe 출력 파일이 없으므로 저장 실패 시 작업을 실패 처리
+            self.meetings.save_transcript(job_name, transcript, s3_uri=s3_uri)
+            logger.info(f"Stored {len(transcript)} stitched speaker segments for {job_name}")
+            on_done({'status': 'success', 'transcript_uri': f"{STORED_TRANSCRIPT_SCHEME}{job_name}"})
+            return
+
+        self.transcription_service.start_transcription(s3_uri, job_name, expected_duration, on_done=on_done)
+
+    def to_original_time(self, job_name: Optional[str], transcript: Transcript) -> Transcript:
+        """
+        Translate segment times of silence-trimmed audio back to the original recording.
+
+        Args:
+            job_name: Transcription job name
+            transcript: Transcript in preprocessed-audio time
+
+        Returns:
+            Transcript in original recording time (unchanged if no time map is stored)
+        """
+        time_map = self.meetings.get_time_map(job_name) if self.meetings and job_name else None
+        if not time_map:
+            return transcript
+        return transcript.map_times(original_time_mapper(time_map))
+
+    def get_transcript_uri(self, job_name: str) -> str:
+        """
+        Look up the transcript URI of a completed transcription job.
+
+        Args:
+            job_name: Transcription job name
+
+        Returns:
+            Transcript file URI
+        """
+        status = self.transcription_service.client.get_transcription_job(
+            TranscriptionJobName=job_name
+        )
+
+        if status['TranscriptionJob']['TranscriptionJobStatus'] != 'COMPLETED':
+            raise TranscriptionNotReadyError("Transcription not completed yet")
+
+        return status['TranscriptionJob']['Transcript']['TranscriptFileUri']
+
+    def load_transcript(
+        self,
+        job_name: Optional[str],
+        transcript_uri: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Transcript:
+        """
+        Return speaker segments, reading the meeting store before Transcribe output.
+
+        저장된 세그먼트가 없으면 트랜스크립트를 내려받아 파싱한 뒤 저장합니다.
+
+        Args:
+            job_name: Transcription job name (None skips the meeting store)
+            transcript_uri: Transcript file URI (looked up from the job if omitted)
+            metadata: Meeting metadata to store with the segments (filename, s3_uri, upload_date)
+
+        Returns:
+            Transcript of speaker segments
+        """
+        if self.meetings and job_name:
+            stored = self.meetings.get_segments(job_name)
+            if stored is not None:
+                logger.info(f"Loaded {len(stored)} stored speaker segments for {job_name}")
+                return stored
+
+        if transcript_uri and transcript_uri.startswith(STORED_TRANSCRIPT_SCHEME):
+            # 중복 업로드로 재사용한 경우 URI가 원래 작업의 회의를 가리킴
+            source_job_name = transcript_uri[len(STORED_TRANSCRIPT_SCHEME):]
+            stored = self.meetings.get_segments(source_job_name) if self.meetings else None
+            if stored is None:
+                raise Exception(f"Stored transcript not found: {transcript_uri}")
+            return stored
+
+        if transcript_uri is None:
+            transcript_uri = self.get_transcript_uri(job_name)
+
+        logger.info(f"Parsing transcript from: {transcript_uri}")
+        speaker_texts = self.transcription_service.parse_transcript_with_speakers(transcript_uri)
+        logger.info(f"Parsed {len(speaker_texts)} speaker segments")
+        speaker_texts = self.to_original_time(job_name, speaker_texts)
+
+        if self.meetings and job_name:
+            # 저장 실패는 다음 처리 때 다시 내려받으면 되므로 파이프라인을 중단하지 않음
+            try:
+                self.meetings.save_transcript(
+                    job_name, speaker_texts, transcript_uri=transcript_uri, **(metadata or {})
+                )
+            except Exception as e:
+                logger.warning(f"Failed to store transcript for {job_name}: {str(e)}")
+
+        return speaker_texts
+
+    def analyze(
+        self,
+        transcript_uri: Optional[str],
+        upload_date: str,
+        job_name: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Tuple[str, List[Dict]]:
+        """
+        Parse the transcript and extract summary and action items.
+
+        Args:
+            transcript_uri: Transcript file URI (None when job_name is given)
+            upload_date: Base date for relative due dates (YYYY-MM-DD)
+            job_name: Transcription job name used as the meeting store key
+            metadata: Meeting metadata stored with the transcript
+
+        Returns:
+            Tuple of (summary, action_items)
+        """
+        return asyncio.run(self.aanalyze(transcript_uri, upload_date, job_name, metadata))
+
+    async def aanalyze(
+        self,
+        transcript_uri: Optional[str],
+        upload_date: str,
+        job_name: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Tuple[str, List[Dict]]:
+        """
+        Async variant of analyze; summary and extraction run concurrently.
+
+        Args:
+            transcript_uri: Transcript file URI (None when job_name is given)
+            upload_date: Base date for relative due dates (YYYY-MM-DD)
+            job_name: Transcription job name used as the meeting store key
+            metadata: Meeting metadata stored with the transcript
+
+        Returns:
+            Tuple of (summary, action_items)
+        """
+        # 화자별 텍스트 (저장된 결과가 있으면 로컬에서 읽음)
+        speaker_texts = await asyncio.to_thread(self.load_transcript, job_name, transcript_uri, metadata)
+
+        # 회의록 요약 및 액션 아이템 추출 (동시 실행)
+        logger.info(f"Generating summary and action items with base date: {upload_date}")
+        summary, raw_items = await self.llm_service.analyze_meeting(speaker_texts, upload_date)
+
+        action_items = [ActionItem(**item).dict() for item in raw_items]
+        logger.info(f"Extracted {len(action_items)} action items")
+
+        if self.meetings and job_name:
+            try:
+                await asyncio.to_thread(
+                    self.meetings.save_analysis,
+                    job_name,
+                    summary,
+                    action_items,
+                    self.llm_service.PROMPT_VERSION
+                )
+            except Exception as e:
+                logger.warning(f"Failed to store analysis for {job_name}: {str(e)}")
+
+        return summary, action_items
+
+    def push_to_notion(
+        self,
+        action_items: List[Dict],
+        done_results: Optional[List[Dict]] = None,
+        on_batch: Optional[Callable[[List[Dict]], None]] = None
+    ) -> Dict:
+        """
+        Create Notion pages for action items.
+
+        on_batch를 주면 settings.notion_max_concurrency개씩 나누어 생성하고 묶음이 끝날 때마다
+        지금까지의 결과로 on_batch를 호출합니다. 작업 워커는 이 결과를 바로 저장하므로
+        재시작해도 이미 만든 페이지를 다시 만들지 않습니다 (done_results만큼 앞 항목은 건너뜀).
+
+        Args:
+            action_items: List of action item dicts
+            done_results: Results of items already created by an interrupted run
+            on_batch: Called with all results so far after each batch
+
+        Returns:
+            Dict with status, message and per-item results
+        """
+        results = list(done_results or [])
+        batch_size = max(1, settings.notion_max_concurrency) if on_batch else max(1, len(action_items))
+        for start in range(len(results), len(action_items), batch_size):
+            results.extend(self.notion_service.create_multiple_tasks(action_items[start:start + batch_size]))
+            if on_batch:
+                on_batch(results)
+
+        success_count = sum(1 for r in results if r['result']['status'] == 'success')
+        logger.info(f"Successfully created {success_count}/{len(results)} tasks in Notion")
+
+        return {
+            "status": "success",
+            "message": f"Successfully created {success_count}/{len(results)} tasks in Notion",
+            "results": results
+        }
+
+    @timed_stage("db_save")
+    def save_internal(
+        self,
+        db: Session,
+        job_name: str,
+        action_items: List[Dict],
+        before_commit: Optional[Callable[[List[Dict]], None]] = None
+    ) -> List[Dict]:
+        """
+        Save action items as tasks in the internal database.
+
+        Args:
+            db: Database session
+            job_name: Source meeting job name
+            action_items: List of action item dicts
+            before_commit: Called with the saved task summaries inside the insert transaction
+
+        Returns:
+            List of saved task summaries
+        """
+        saved_tasks = bulk_create_tasks(db, action_items, job_name, before_commit)
+        logger.info(f"Saved {len(saved_tasks)} tasks to internal DB")
+
+        if self.events:
+            for saved, item in zip(saved_tasks, action_items):
+                self.events.publish("task.created", {
+                    **saved,
+                    "due_date": item.get('due_date'),
+                    "confidence": item.get('confidence'),
+                    "job_name": job_name
+                })
+
+        return saved_tasks
@@ -0,0 +1,298 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ('COMPLETED', 'FAILED')
+
+
+class _TrackedJob:
+    """Polling state of a single outstanding transcription job."""
+
+    __slots__ = ('job_name', 'interval', 'next_check', 'hint', 'result', 'done', 'callbacks')
+
+    def __init__(self, job_name: str, interval: float, next_check: float):
+        self.job_name = job_name
+        self.interval = interval
+        self.next_check = next_check
+        self.hint = None  # 이벤트로 전달받은 상태 (있으면 목록 조회 없이 바로 확인)
+        self.result = None
+        self.done = threading.Event()
+        self.callbacks: List[Callable[[Dict], None]] = []
+
+
+class TranscriptionPoller:
+    """
+    Shared poller for all outstanding Amazon Transcribe jobs.
+
+    작업마다 개별 폴링 루프를 돌리는 대신 하나의 백그라운드 스레드가
+    list_transcription_jobs로 진행 중인 작업 목록을 한 번에 조회합니다.
+    목록에서 빠진 작업만 get_transcription_job으로 결과를 확인하므로
+    동시에 처리 중인 회의 수와 관계없이 API 호출 수가 거의 일정합니다.
+
+    폴링 간격은 예상 오디오 길이에 비례해 시작하고 지수적으로 늘어납니다.
+    notify()로 완료 이벤트(EventBridge 등)를 전달하면 폴링 없이 바로 완료 처리합니다.
+    track(on_done=...)으로 완료 콜백을 등록하면 대기하는 스레드 없이 결과를 받을 수 있으므로
+    동시에 기다리는 작업 수가 스레드 수에 묶이지 않습니다.
+    """
+
+    # 첫 확인 시점 = 오디오 길이 * FIRST_CHECK_RATIO (Transcribe는 보통 실시간보다 빠름)
+    FIRST_CHECK_RATIO = 0.25
+    # 기본 폴링 간격 = 오디오 길이 * INTERVAL_RATIO
+    INTERVAL_RATIO = 0.02
+    BACKOFF_FACTOR = 1.5
+
+    def __init__(
+        self,
+        client,
+        job_name_prefix: str = "transcription_",
+        min_interval: float = 5.0,
+        max_interval: float = 60.0,
+        events_enabled: bool = False,
+        event_fallback_interval: float = 300.0
+    ):
+        self.client = client
+        self.job_name_prefix = job_name_prefix
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.events_enabled = events_enabled
+        self.event_fallback_interval = event_fallback_interval
+
+        self._jobs: Dict[str, _TrackedJob] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def track(
+        self,
+        job_name: str,
+        expected_duration: Optional[float] = None,
+        check_now: bool = False,
+        on_done: Optional[Callable[[Dict], None]] = None
+    ) -> None:
+        """
+        Start tracking a transcription job.
+
+        on_done은 폴러 스레드에서 호출되므로 오래 걸리는 처리는 다른 스레드로 넘겨야 합니다.
+
+        Args:
+            job_name: Transcription job name
+            expected_duration: Estimated audio duration in seconds
+            check_now: Check status on the next poll (e.g. resumed jobs)
+            on_done: Called with the result dict (same as wait()) when the job finishes
+        """
+        self._add(job_name, expected_duration, check_now, on_done)
+
+    def _add(
+        self,
+        job_name: str,
+        expected_duration: Optional[float],
+        check_now: bool,
+        on_done: Optional[Callable[[Dict], None]] = None
+    ) -> _TrackedJob:
+        """Register a job and return its polling state."""
+        now = time.monotonic()
+
+        if expected_duration:
+            interval = self._clamp(expected_duration * self.INTERVAL_RATIO)
+            first_delay = max(self.min_interval, expected_duration * self.FIRST_CHECK_RATIO)
+        else:
+            interval = self.min_interval
+            first_delay = self.min_interval
+
+        # 이벤트 모드에서는 폴링은 이벤트 유실 대비용 안전장치로만 사용
+        if self.events_enabled:
+            interval = self.event_fallback_interval
+            first_delay = self.event_fallback_interval
+
+        if check_now:
+            first_delay = 0.0
+
+        with self._condition:
+            job = self._jobs.get(job_name)
+            if job is None:
+                job = self._jobs[job_name] = _TrackedJob(job_name, interval, now + first_delay)
+            if on_done is not None:
+                job.callbacks.append(on_done)
+            self._ensure_thread()
+            self._condition.notify()
+        return job
+
+    def wait(self, job_name: str, timeout: Optional[float] = None) -> Dict:
+        """
+        Block until a tracked job finishes.
+
+        Args:
+            job_name: Transcription job name
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            Dict containing transcription status and transcript URI
+        """
+        with self._condition:
+            job = self._jobs.get(job_name)
+        if job is None:
+            job = self._add(job_name, None, check_now=True)
+
+        if not job.done.wait(timeout):
+            return {
+                'status': 'error',
+                'error': f'Timed out waiting for transcription job {job_name}'
+            }
+        return job.result
+
+    def notify(self, job_name: str, status: str) -> bool:
+        """
+        Handle a job state change event instead of waiting for the next poll.
+
+        Args:
+            job_name: Transcription job name
+            status: TranscriptionJobStatus reported by the event
+
+        Returns:
+            True if the job is tracked by this poller
+        """
+        with self._condition:
+            job = self._jobs.get(job_name)
+            if job is None:
+                return False
+            if status in FINISHED_STATUSES:
+                job.hint = status
+                job.next_check = 0.0
+                self._condition.notify()
+        return True
+
+    def stop(self) -> None:
+        """Stop the polling thread and release all waiters."""
+        with self._condition:
+            self._stopped = True
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+            self._condition.notify()
+
+        for job in jobs:
+            self._finish(job, {
+                'status': 'error',
+                'error': 'Transcription poller stopped'
+            })
+
+    def _ensure_thread(self) -> None:
+        """Start the polling thread on first use (caller holds the lock)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run,
+                name="transcribe-poller",
+                daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Polling loop: wake up when the earliest job is due."""
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    now = time.monotonic()
+                    due = [job for job in self._jobs.values() if job.next_check <= now]
+                    if due:
+                        break
+                    next_check = min((job.next_check for job in self._jobs.values()), default=None)
+                    self._condition.wait(None if next_check is None else next_check - now)
+                if self._stopped:
+                    return
+
+            try:
+                self._poll(due)
+            except Exception as e:
+                logger.warning(f"Transcription poll failed, backing off: {str(e)}")
+                with self._condition:
+                    for job in due:
+                        self._reschedule(job)
+
+    def _poll(self, due) -> None:
+        """Check all due jobs with one batched listing."""
+        hinted = [job for job in due if job.hint]
+        unhinted = [job for job in due if not job.hint]
+
+        in_progress = self._list_in_progress() if unhinted else set()
+
+        for job in hinted + unhinted:
+            if job.job_name in in_progress:
+                with self._condition:
+                    self._reschedule(job)
+                continue
+
+            # 진행 중 목록에 없으면 완료되었을 가능성이 높으므로 개별 확인
+            result = self._fetch_result(job.job_name)
+            with self._condition:
+                if result is None:
+                    job.hint = None
+                    self._reschedule(job)
+                    continue
+                self._jobs.pop(job.job_name, None)
+            self._finish(job, result)
+
+    @staticmethod
+    def _finish(job: _TrackedJob, result: Dict) -> None:
+        """Release waiters and run completion callbacks (called without the lock)."""
+        job.result = result
+        job.done.set()
+        for callback in job.callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"Transcription callback for {job.job_name} failed: {str(e)}", exc_info=True)
+
+    def _list_in_progress(self) -> Set[str]:
+        """List names of queued and in-progress jobs."""
+        names = set()
+        for status in ('QUEUED', 'IN_PROGRESS'):
+            kwargs = {
+                'Status': status,
+                'JobNameContains': self.job_name_prefix,
+                'MaxResults': 100
+            }
+            while True:
+                response = self.client.list_transcription_jobs(**kwargs)
+                for summary in response.get('TranscriptionJobSummaries', []):
+                    names.add(summary['TranscriptionJobName'])
+                if not response.get('NextToken'):
+                    break
+                kwargs['NextToken'] = response['NextToken']
+        return names
+
+    def _fetch_result(self, job_name: str) -> Optional[Dict]:
+        """
+        Fetch the final result of a job.
+
+        Returns:
+            Result dict, or None if the job is still running
+        """
+        status = self.client.get_transcription_job(TranscriptionJobName=job_name)
+        job_status = status['TranscriptionJob']['TranscriptionJobStatus']
+
+        if job_status == 'COMPLETED':
+            logger.info(f"Transcription completed: {job_name}")
+            return {
+                'status': 'success',
+                'transcript_uri': status['TranscriptionJob']['Transcript']['TranscriptFileUri'],
+                'job_name': job_name
+            }
+        if job_status == 'FAILED':
+            logger.error(f"Transcription job failed: {job_name}")
+            return {
+                'status': 'failed',
+                'error': status['TranscriptionJob'].get('FailureReason', 'Transcription job failed')
+            }
+        return None
+
+    def _reschedule(self, job: _TrackedJob) -> None:
+        """Schedule the next check with exponential backoff (caller holds the lock)."""
+        job.next_check = time.monotonic() + job.interval
+        if not self.events_enabled:
+            job.interval = self._clamp(job.interval * self.BACKOFF_FACTOR)
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), self.max_interval)
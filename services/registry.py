@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyService:
+    """
+    Proxy that builds a registry service on first attribute access.
+
+    모듈 수준에서 서비스 변수를 그대로 사용할 수 있게 하면서
+    실제 boto3 클라이언트 생성과 LangChain import는 처음 사용할 때까지 미룹니다.
+    """
+
+    __slots__ = ('_registry', '_name')
+
+    def __init__(self, registry: "ServiceRegistry", name: str):
+        self._registry = registry
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._registry.get(self._name), attr)
+
+    def __repr__(self) -> str:
+        return f"<LazyService {self._name}>"
+
+
+class ServiceRegistry:
+    """
+    Lazily constructed, shared service instances.
+
+    서비스별 생성 함수는 처음 요청될 때 한 번만 실행되며 (스레드 안전),
+    warm_up()은 여러 서비스를 스레드에서 동시에 생성하고 소요 시간을 기록합니다.
+    생성 함수가 다른 서비스를 get()으로 요청할 수 있으므로 (예: LLM -> Bedrock)
+    서비스마다 별도 잠금을 사용합니다.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[["ServiceRegistry"], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self.timings: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[["ServiceRegistry"], Any]) -> None:
+        """
+        Register a service factory.
+
+        Args:
+            name: Service name
+            factory: Callable receiving the registry and returning the instance
+        """
+        self._factories[name] = factory
+        self._locks[name] = threading.Lock()
+
+    def lazy(self, name: str) -> LazyService:
+        """Return a proxy that builds the service on first use."""
+        if name not in self._factories:
+            raise KeyError(f"Unknown service: {name}")
+        return LazyService(self, name)
+
+    def get(self, name: str) -> Any:
+        """Return the service instance, building it on first use."""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._locks[name]:
+            instance = self._instances.get(name)
+            if instance is None:
+                started = time.perf_counter()
+                instance = self._factories[name](self)
+                self.timings[name] = round(time.perf_counter() - started, 3)
+                self._instances[name] = instance
+                logger.info(f"Initialized {name} service in {self.timings[name]:.3f}s")
+        return instance
+
+    def is_built(self, name: str) -> bool:
+        """Whether the service has been constructed."""
+        return name in self._instances
+
+    async def warm_up(self, names: Optional[Iterable[str]] = None) -> float:
+        """
+        Build services concurrently in worker threads.
+
+        Args:
+            names: Services to build (default: all registered)
+
+        Returns:
+            Elapsed seconds
+        """
+        started = time.perf_counter()
+        names = list(names or self._factories)
+
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.get, name) for name in names),
+            return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            # 실패한 서비스는 첫 사용 시 다시 생성을 시도
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to warm up {name} service: {str(result)}")
+
+        return round(time.perf_counter() - started, 3)
+
+
+def _build_transcription(registry: ServiceRegistry):
+    from services.stt import TranscriptionService
+    # 긴 녹음 분할 시에만 S3 클라이언트가 필요하므로 지연 참조로 전달
+    return TranscriptionService(s3_service=registry.lazy("s3"))
+
+
+def _build_bedrock(registry: ServiceRegistry):
+    from services.bedrock import BedrockService
+    return BedrockService()
+
+
+def _build_s3(registry: ServiceRegistry):
+    from services.s3 import S3Service
+    return S3Service()
+
+
+def _build_llm(registry: ServiceRegistry):
+    from services.llm import LLMService
+    # LLM 서비스는 Bedrock 클라이언트를 새로 만들지 않고 공유
+    return LLMService(bedrock_service=registry.get("bedrock"))
+
+
+def _build_notion(registry: ServiceRegistry):
+    from services.notion import NotionService
+    return NotionService()
+
+
+def create_service_registry() -> ServiceRegistry:
+    """
+    Create the registry of application services.
+
+    각 생성 함수 안에서 import 하므로 LangChain 등 무거운 모듈도 처음 사용할 때 로드됩니다.
+
+    Returns:
+        Registry with transcription, bedrock, s3, llm and notion services
+    """
+    registry = ServiceRegistry()
+    registry.register("transcription", _build_transcription)
+    registry.register("bedrock", _build_bedrock)
+    registry.register("s3", _build_s3)
+    registry.register("llm", _build_llm)
+    registry.register("notion", _build_notion)
+    return registry
@@ -1,23 +1,30 @@
+import asyncio
 import boto3
 from pathlib import Path
+from typing import Dict, List, Tuple
 from config import settings
+from services.metrics import timed_stage
 
 
 class S3Service:
     """Service for handling S3 file uploads."""
-    
+
+    # S3 멀티파트 업로드의 최소 파트 크기는 5MB (마지막 파트 제외)
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
     def __init__(self):
-        self.client = boto3.client('s3', **settings.get_aws_client_kwargs())
+        # boto3 기본 세션은 스레드 안전하지 않으므로 서비스별 세션에서 클라이언트 생성
+        self.client = boto3.session.Session().client('s3', **settings.get_aws_client_kwargs())
         self.bucket_name = settings.s3_bucket_name
-    
+
     def upload_file(self, file_path: str, object_name: str) -> str:
         """
         Upload file to S3 bucket.
-        
+
         Args:
             file_path: Local file path
             object_name: S3 object name
-            
+
         Returns:
             S3 URI of uploaded file
         """
@@ -26,3 +33,204 @@ class S3Service:
             return f"s3://{self.bucket_name}/{object_name}"
         except Exception as e:
             raise Exception(f"Failed to upload to S3: {str(e)}")
+
+    def download_file(self, s3_uri: str, file_path: str) -> str:
+        """
+        Download an S3 object to a local file.
+
+        Args:
+            s3_uri: S3 URI of the object (s3://bucket/key)
+            file_path: Local destination path
+
+        Returns:
+            Local file path
+        """
+        bucket, key = self._parse_uri(s3_uri)
+        try:
+            self.client.download_file(bucket, key, file_path)
+            return file_path
+        except Exception as e:
+            raise Exception(f"Failed to download from S3: {str(e)}")
+
+    def read_head(self, s3_uri: str, length: int) -> bytes:
+        """
+        Read the first bytes of an S3 object with a ranged GET.
+
+        Args:
+            s3_uri: S3 URI of the object (s3://bucket/key)
+            length: Maximum number of bytes to read
+
+        Returns:
+            Up to length bytes from the start of the object
+        """
+        bucket, key = self._parse_uri(s3_uri)
+        try:
+            response = self.client.get_object(Bucket=bucket, Key=key, Range=f"bytes=0-{length - 1}")
+            return response['Body'].read()
+        except Exception as e:
+            raise Exception(f"Failed to read from S3: {str(e)}")
+
+    def delete_object(self, object_name: str) -> None:
+        """
+        Delete an object from the S3 bucket.
+
+        Args:
+            object_name: S3 object name
+        """
+        try:
+            self.client.delete_object(Bucket=self.bucket_name, Key=object_name)
+        except Exception as e:
+            raise Exception(f"Failed to delete from S3: {str(e)}")
+
+    @timed_stage("s3_upload")
+    async def upload_stream(self, file, object_name: str, chunk_size: int = None) -> str:
+        """
+        Stream a file-like object to S3 using a multipart upload.
+
+        파일 전체를 메모리에 올리지 않고 chunk_size 단위로 읽어서
+        각 청크를 바로 멀티파트 업로드의 파트로 전송합니다.
+        업로드당 최대 메모리 사용량은 chunk_size 정도로 유지됩니다.
+        UploadFile은 Starlette가 이미 SpooledTemporaryFile(1MB 초과분은 디스크)에 받아 둔
+        것이므로 로컬 임시 파일이 없어지는 것은 아니며, 그 파일을 다시 복사하거나 통째로
+        읽지 않고 S3로 보내는 것이 목적입니다.
+
+        Args:
+            file: Object with an async read(size) method (e.g. FastAPI UploadFile)
+            object_name: S3 object name
+            chunk_size: Part size in bytes (minimum 5MB)
+
+        Returns:
+            S3 URI of uploaded file
+        """
+        chunk_size = max(chunk_size or settings.upload_chunk_size, self.MIN_PART_SIZE)
+
+        first_chunk = await self._read_chunk(file, chunk_size)
+
+        # 한 파트보다 작은 파일은 멀티파트 없이 한 번에 업로드
+        if len(first_chunk) < chunk_size:
+            try:
+                await asyncio.to_thread(
+                    self.client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=object_name,
+                    Body=first_chunk
+                )
+                return f"s3://{self.bucket_name}/{object_name}"
+            except Exception as e:
+                raise Exception(f"Failed to upload to S3: {str(e)}")
+
+        upload_id = await asyncio.to_thread(self.start_multipart_upload, object_name)
+        parts = []
+
+        try:
+            chunk = first_chunk
+            while chunk:
+                part = await asyncio.to_thread(
+                    self.upload_part, object_name, upload_id, len(parts) + 1, chunk
+                )
+                parts.append(part)
+                chunk = await self._read_chunk(file, chunk_size)
+
+            return await asyncio.to_thread(
+                self.complete_multipart_upload, object_name, upload_id, parts
+            )
+        except Exception:
+            await asyncio.to_thread(self.abort_multipart_upload, object_name, upload_id)
+            raise
+
+    def start_multipart_upload(self, object_name: str) -> str:
+        """
+        Start a multipart upload.
+
+        Args:
+            object_name: S3 object name
+
+        Returns:
+            Upload ID of the multipart upload
+        """
+        try:
+            response = self.client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=object_name
+            )
+            return response['UploadId']
+        except Exception as e:
+            raise Exception(f"Failed to start multipart upload: {str(e)}")
+
+    def upload_part(self, object_name: str, upload_id: str, part_number: int, data: bytes) -> Dict:
+        """
+        Upload a single part of a multipart upload.
+
+        Args:
+            object_name: S3 object name
+            upload_id: Upload ID returned by start_multipart_upload
+            part_number: 1-based part number
+            data: Part payload
+
+        Returns:
+            Dict with PartNumber and ETag for completing the upload
+        """
+        try:
+            response = self.client.upload_part(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=data
+            )
+            return {'PartNumber': part_number, 'ETag': response['ETag']}
+        except Exception as e:
+            raise Exception(f"Failed to upload part {part_number} to S3: {str(e)}")
+
+    def complete_multipart_upload(self, object_name: str, upload_id: str, parts: List[Dict]) -> str:
+        """
+        Complete a multipart upload.
+
+        Args:
+            object_name: S3 object name
+            upload_id: Upload ID returned by start_multipart_upload
+            parts: List of dicts returned by upload_part
+
+        Returns:
+            S3 URI of uploaded file
+        """
+        try:
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+            return f"s3://{self.bucket_name}/{object_name}"
+        except Exception as e:
+            raise Exception(f"Failed to complete multipart upload: {str(e)}")
+
+    def abort_multipart_upload(self, object_name: str, upload_id: str) -> None:
+        """Abort a multipart upload so S3 discards the uploaded parts."""
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                UploadId=upload_id
+            )
+        except Exception:
+            pass
+
+    @staticmethod
+    def _parse_uri(s3_uri: str) -> Tuple[str, str]:
+        """Split an s3://bucket/key URI into (bucket, key)."""
+        if not s3_uri.startswith("s3://") or "/" not in s3_uri[5:]:
+            raise Exception(f"Invalid S3 URI: {s3_uri}")
+        bucket, key = s3_uri[5:].split("/", 1)
+        return bucket, key
+
+    @staticmethod
+    async def _read_chunk(file, chunk_size: int) -> bytes:
+        """Read up to chunk_size bytes, looping over short reads."""
+        buffer = bytearray()
+        while len(buffer) < chunk_size:
+            data = await file.read(chunk_size - len(buffer))
+            if not data:
+                break
+            buffer.extend(data)
+        return bytes(buffer)
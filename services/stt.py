@@ -1,9 +1,23 @@
 import boto3
-import time
+import io
+import os
+import queue
 import requests
+import tempfile
+from bisect import bisect_left, bisect_right
 import logging
-from typing import Dict, Optional, List
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, Optional, List
 from config import settings
+from services.audio import split_wav, wav_duration
+from services.metrics import timed_stage
+from services.poller import TranscriptionPoller
+from services.transcript import Transcript, stitch_transcripts
+
+try:
+    import ijson
+except ImportError:  # 스트리밍 파싱은 ijson이 설치된 경우에만 사용
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
@@ -11,10 +25,26 @@ logger = logging.getLogger(__name__)
 class TranscriptionService:
     """Service for handling audio transcription using Amazon Transcribe."""
     
-    def __init__(self):
-        self.client = boto3.client(**settings.get_aws_client_kwargs('transcribe'))
+    def __init__(self, s3_service=None):
+        # 긴 녹음 분할 변환 시 원본 다운로드와 조각 업로드에 사용
+        self.s3_service = s3_service
+        # boto3 기본 세션은 스레드 안전하지 않으므로 서비스별 세션에서 클라이언트 생성
+        self.client = boto3.session.Session().client(**settings.get_aws_client_kwargs('transcribe'))
+        # 모든 진행 중인 작업을 하나의 폴러가 관리
+        self.poller = TranscriptionPoller(
+            self.client,
+            min_interval=settings.transcribe_poll_min_interval,
+            max_interval=settings.transcribe_poll_max_interval,
+            events_enabled=settings.transcribe_events_enabled,
+            event_fallback_interval=settings.transcribe_event_fallback_interval
+        )
     
-    def transcribe_audio(self, audio_file_path: str, job_name: str) -> Dict:
+    def transcribe_audio(
+        self,
+        audio_file_path: str,
+        job_name: str,
+        expected_duration: Optional[float] = None
+    ) -> Dict:
         """
         Transcribe audio file using Amazon Transcribe with Speaker Diarization.
         
@@ -29,15 +59,168 @@ class TranscriptionService:
         Args:
             audio_file_path: S3 URI of the audio file (s3://bucket/key)
             job_name: Unique job name for the transcription
+            expected_duration: Estimated audio duration in seconds (for polling backoff)
             
         Returns:
             Dict containing transcription status and transcript URI
         """
         try:
-            logger.info(f"Starting transcription job: {job_name}")
+            self.start_transcription(audio_file_path, job_name, expected_duration)
+            return self.wait_for_transcription(job_name)
             
+        except Exception as e:
+            logger.error(f"Error in transcribe_audio: {str(e)}", exc_info=True)
+            return {
+                'status': 'error',
+                'error': str(e)
+            }
+    
+    def start_transcription(
+        self,
+        audio_file_path: str,
+        job_name: str,
+        expected_duration: Optional[float] = None,
+        on_done: Optional[Callable[[Dict], None]] = None
+    ) -> None:
+        """
+        Start a transcription job and hand it to the shared poller without waiting.
+
+        on_done은 작업이 끝나면 폴러 스레드에서 transcribe_audio와 같은 결과 dict로 호출됩니다.
+
+        Args:
+            audio_file_path: S3 URI of the audio file (s3://bucket/key)
+            job_name: Unique job name for the transcription
+            expected_duration: Estimated audio duration in seconds (for polling backoff)
+            on_done: Completion callback receiving the result dict
+        """
+        started = self.start_transcription_job(audio_file_path, job_name)
+        # 재개된 작업은 이미 끝났을 수 있으므로 바로 확인
+        self.poller.track(job_name, expected_duration, check_now=not started, on_done=on_done)
+
+    def should_split(self, audio_file_path: str) -> bool:
+        """
+        Whether a recording should be transcribed as parallel pieces.
+
+        분할은 설정이 켜져 있고, S3 서비스가 있으며, 실제 길이가 기준 이상인 WAV 파일에만 적용합니다.
+        업로드 크기로 추정한 길이는 샘플레이트와 채널 수에 따라 크게 틀리므로, S3 객체 앞부분의
+        WAV 헤더만 읽어서 실제 길이를 확인합니다.
+
+        Args:
+            audio_file_path: S3 URI of the audio file
+
+        Returns:
+            True if transcribe_split should be used
+        """
+        if not (
+            settings.transcribe_split_enabled
+            and self.s3_service is not None
+            and audio_file_path.lower().endswith('.wav')
+        ):
+            return False
+
+        try:
+            header = self.s3_service.read_head(audio_file_path, settings.transcribe_split_header_bytes)
+            duration = wav_duration(io.BytesIO(header))
+        except Exception as e:
+            logger.warning(f"Cannot read WAV duration of {audio_file_path}, transcribing as one job: {str(e)}")
+            return False
+        return duration >= settings.transcribe_split_min_seconds
+
+    def transcribe_split(self, audio_file_path: str, job_name: str) -> Transcript:
+        """
+        Transcribe a long WAV recording as overlapping pieces in parallel.
+
+        원본을 내려받아 무음 지점에서 겹치는 조각으로 나누고, 조각마다 별도의
+        Transcribe 작업({job_name}_partNNN)을 최대 transcribe_split_max_workers개까지 동시에
+        실행합니다 (완료는 공유 폴러의 콜백으로 받음). 결과는 원본 기준 타임스탬프로 옮기고 겹친 구간으로 조각 간 화자 라벨을
+        맞춰서 하나로 합칩니다. 합친 뒤에는 조각 S3 객체와 조각 Transcribe 작업을 삭제합니다.
+        실패한 경우에는 남겨 두므로 같은 job_name으로 다시 호출하면 이미 있는 조각 작업을 재사용합니다.
+
+        Args:
+            audio_file_path: S3 URI of the WAV file (s3://bucket/key)
+            job_name: Base job name for the piece jobs
+
+        Returns:
+            Stitched Transcript of the whole recording
+        """
+        if self.s3_service is None:
+            raise Exception("Split transcription requires an S3 service")
+
+        with tempfile.TemporaryDirectory(prefix="transcribe-split-") as workdir:
+            source_path = self.s3_service.download_file(audio_file_path, os.path.join(workdir, "source.wav"))
+            pieces = split_wav(
+                source_path,
+                workdir,
+                settings.transcribe_split_piece_seconds,
+                settings.transcribe_split_overlap_seconds,
+                settings.transcribe_split_search_seconds
+            )
+            os.remove(source_path)
+            piece_jobs = [f"{job_name}_part{index:03d}" for index in range(len(pieces))]
+            logger.info(f"Split {job_name} into {len(pieces)} pieces")
+
+            # 조각 작업은 완료 콜백으로 결과를 받으므로 조각마다 대기 스레드를 두지 않음
+            finished = queue.Queue()  # (조각 번호, 결과 dict)
+            transcripts: List[Optional[Transcript]] = [None] * len(pieces)
+            max_running = max(1, settings.transcribe_split_max_workers)
+            next_index = running = 0
+
+            while next_index < len(pieces) or running:
+                while next_index < len(pieces) and running < max_running:
+                    piece, piece_job = pieces[next_index], piece_jobs[next_index]
+                    piece_uri = self.s3_service.upload_file(piece.path, f"audio/{piece_job}.wav")
+                    self.start_transcription(
+                        piece_uri,
+                        piece_job,
+                        piece.end - piece.start,
+                        on_done=lambda result, index=next_index: finished.put((index, result))
+                    )
+                    next_index += 1
+                    running += 1
+
+                index, result = finished.get()
+                running -= 1
+                if result['status'] != 'success':
+                    raise Exception(f"Transcription of {piece_jobs[index]} failed: {result.get('error')}")
+                transcripts[index] = self.parse_transcript_with_speakers(result['transcript_uri'])
+
+        transcript = stitch_transcripts([
+            (transcript, piece.start, piece.keep_start, piece.keep_end)
+            for transcript, piece in zip(transcripts, pieces)
+        ])
+        self._delete_pieces(piece_jobs)
+        return transcript
+
+    def _delete_pieces(self, piece_jobs: List[str]) -> None:
+        """Delete the S3 objects and Transcribe jobs of stitched pieces (failures are only logged)."""
+        for piece_job in piece_jobs:
+            try:
+                self.s3_service.delete_object(f"audio/{piece_job}.wav")
+            except Exception as e:
+                logger.warning(f"Failed to delete piece audio of {piece_job}: {str(e)}")
+            try:
+                self.client.delete_transcription_job(TranscriptionJobName=piece_job)
+            except Exception as e:
+                logger.warning(f"Failed to delete transcription job {piece_job}: {str(e)}")
+
+    def start_transcription_job(self, audio_file_path: str, job_name: str) -> bool:
+        """
+        Start an Amazon Transcribe job with speaker diarization.
+        
+        이미 같은 이름의 작업이 존재하면 (예: 서버 재시작 후 재개) 새로 시작하지 않습니다.
+        
+        Args:
+            audio_file_path: S3 URI of the audio file (s3://bucket/key)
+            job_name: Unique job name for the transcription
+            
+        Returns:
+            True if a new job was started, False if it already existed
+        """
+        logger.info(f"Starting transcription job: {job_name}")
+        
+        try:
             # Start transcription job with speaker diarization
-            response = self.client.start_transcription_job(
+            self.client.start_transcription_job(
                 TranscriptionJobName=job_name,
                 Media={'MediaFileUri': audio_file_path},
                 MediaFormat=self._get_media_format(audio_file_path),
@@ -48,41 +231,26 @@ class TranscriptionService:
                     'ChannelIdentification': False  # 단일 채널 오디오
                 }
             )
+            return True
+        except self.client.exceptions.ConflictException:
+            logger.info(f"Transcription job already exists, resuming: {job_name}")
+            return False
+    
+    @timed_stage("transcribe_wait")
+    def wait_for_transcription(self, job_name: str, timeout: Optional[float] = None) -> Dict:
+        """
+        Block until a transcription job finishes.
+        
+        상태 확인은 공유 폴러가 담당하며 작업이 끝나면 대기 중인 스레드를 깨웁니다.
+        
+        Args:
+            job_name: Transcription job name
+            timeout: Maximum seconds to wait (None waits forever)
             
-            # Wait for completion
-            while True:
-                status = self.client.get_transcription_job(
-                    TranscriptionJobName=job_name
-                )
-                job_status = status['TranscriptionJob']['TranscriptionJobStatus']
-                
-                if job_status in ['COMPLETED', 'FAILED']:
-                    break
-                    
-                logger.info(f"Transcription job {job_name} status: {job_status}")
-                time.sleep(5)
-            
-            if job_status == 'COMPLETED':
-                transcript_uri = status['TranscriptionJob']['Transcript']['TranscriptFileUri']
-                logger.info(f"Transcription completed: {job_name}")
-                return {
-                    'status': 'success',
-                    'transcript_uri': transcript_uri,
-                    'job_name': job_name
-                }
-            else:
-                logger.error(f"Transcription job failed: {job_name}")
-                return {
-                    'status': 'failed',
-                    'error': 'Transcription job failed'
-                }
-                
-        except Exception as e:
-            logger.error(f"Error in transcribe_audio: {str(e)}", exc_info=True)
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        Returns:
+            Dict containing transcription status and transcript URI
+        """
+        return self.poller.wait(job_name, timeout)
     
     def _get_media_format(self, file_path: str) -> str:
         """Extract media format from file path."""
@@ -95,7 +263,8 @@ class TranscriptionService:
         else:
             return 'mp3'
     
-    def parse_transcript_with_speakers(self, transcript_uri: str) -> List[Dict]:
+    @timed_stage("transcript_parse")
+    def parse_transcript_with_speakers(self, transcript_uri: str) -> Transcript:
         """
         Parse Amazon Transcribe output to extract speaker-labeled text.
         
@@ -108,11 +277,14 @@ class TranscriptionService:
         - start_time, end_time: 발화 시작/종료 시간
         - items: 해당 세그먼트의 단어들
         
+        세그먼트는 dict 리스트 대신 열 단위의 Transcript로 모아서 반환합니다.
+        
         Args:
             transcript_uri: URI of the transcript JSON file from Transcribe
             
         Returns:
-            List of dicts with speaker label, text, and timestamps
+            Transcript of speaker segments; iterating yields dicts with
+            speaker label, text, and timestamps
             Example: [
                 {
                     'speaker': 'spk_0',
@@ -124,62 +296,247 @@ class TranscriptionService:
             ]
         """
         try:
+            if ijson is not None:
+                return Transcript.from_segments(self.iter_transcript_segments(transcript_uri))
+            
             response = requests.get(transcript_uri)
-            transcript_data = response.json()
-            
-            results = transcript_data['results']
-            
-            # 화자 분리 정보 확인
-            if 'speaker_labels' not in results:
-                raise Exception("Speaker diarization data not found in transcript")
-            
-            speaker_labels = results['speaker_labels']
-            segments = speaker_labels.get('segments', [])
-            speakers = speaker_labels.get('speakers', 0)
-            
-            print(f"Detected {speakers} speakers in the audio")
-            
-            # 화자별 텍스트 추출
-            speaker_texts = []
-            for segment in segments:
-                speaker = segment['speaker_label']
-                start_time = float(segment['start_time'])
-                end_time = float(segment['end_time'])
-                
-                # 세그먼트 내 아이템들로부터 텍스트 구성
-                segment_items = segment.get('items', [])
-                
-                # 각 아이템의 content를 결합
-                words = []
-                for item in segment_items:
-                    # items 배열에서 해당 인덱스의 단어 찾기
-                    item_index = item.get('start_time')
-                    for result_item in results['items']:
-                        if (result_item.get('type') == 'pronunciation' and 
-                            result_item.get('start_time') == item_index):
-                            words.append(result_item['alternatives'][0]['content'])
-                            break
-                
-                # 대체 방법: start_time과 end_time 범위로 단어 추출
-                if not words:
-                    for result_item in results['items']:
-                        if result_item.get('type') == 'pronunciation':
-                            item_start = float(result_item.get('start_time', 0))
-                            item_end = float(result_item.get('end_time', 0))
-                            if start_time <= item_start <= end_time:
-                                words.append(result_item['alternatives'][0]['content'])
-                
-                text = ' '.join(words)
-                
-                if text.strip():
-                    speaker_texts.append({
-                        'speaker': speaker,
-                        'text': text.strip(),
-                        'start_time': start_time,
-                        'end_time': end_time
-                    })
-            
-            return speaker_texts
+            return Transcript.from_segments(self.parse_transcript_data(response.json()))
             
         except Exception as e:
             raise Exception(f"Failed to parse transcript with speakers: {str(e)}")
+    
+    def iter_transcript_segments(self, transcript_uri: str) -> Iterator[Dict]:
+        """
+        Stream speaker segments from a Transcribe output file.
+        
+        응답 전체를 메모리에 올리거나 JSON 객체 트리를 만들지 않고 ijson으로
+        results.speaker_labels.segments와 results.items를 순차적으로 읽으면서
+        완성된 세그먼트를 바로 yield합니다.
+        
+        Args:
+            transcript_uri: URI of the transcript JSON file from Transcribe
+            
+        Yields:
+            Dicts with speaker label, text, and timestamps
+        """
+        if ijson is None:
+            raise Exception("Streaming transcript parsing requires the ijson package")
+        
+        with requests.get(transcript_uri, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield from self.iter_transcript_events(ijson.parse(response.raw))
+    
+    @staticmethod
+    def iter_transcript_events(events: Iterable) -> Iterator[Dict]:
+        """
+        Build speaker segments from ijson parse events.
+        
+        Transcribe 출력에서는 보통 speaker_labels가 items보다 먼저 나옵니다.
+        - segments가 먼저 나오면: 세그먼트의 (화자, 시작, 종료)만 보관하고
+          items를 읽으면서 시간순 병합으로 세그먼트를 완성합니다.
+        - items가 먼저 나오면: 단어와 시작 시간만 압축해서 보관하고
+          세그먼트가 읽힐 때마다 범위 검색으로 바로 완성합니다.
+        
+        Args:
+            events: (prefix, event, value) tuples from ijson.parse
+            
+        Yields:
+            Dicts with speaker label, text, and timestamps
+        """
+        segment_prefix = 'results.speaker_labels.segments.item'
+        item_prefix = 'results.items.item'
+        
+        def build(speaker, start_time, end_time, segment_words):
+            text = ' '.join(segment_words).strip()
+            if text:
+                return {
+                    'speaker': speaker,
+                    'text': text,
+                    'start_time': start_time,
+                    'end_time': end_time
+                }
+            return None
+        
+        pending_segments = []   # items보다 먼저 읽힌 세그먼트 (speaker, start, end)
+        next_segment = 0
+        current_words = []      # pending_segments[next_segment]에 속한 단어
+        last_assigned = False   # 직전 단어가 현재 세그먼트에 들어갔는지 (구두점 처리용)
+        
+        words = []              # segments보다 먼저 읽힌 단어 (구두점 포함)
+        word_starts = array('d')
+        items_done = False
+        has_speaker_labels = False
+        
+        segment = None
+        item = None
+        
+        for prefix, event, value in events:
+            if prefix == segment_prefix:
+                if event == 'start_map':
+                    segment = {}
+                elif event == 'end_map':
+                    has_speaker_labels = True
+                    speaker = segment['speaker_label']
+                    start_time = float(segment['start_time'])
+                    end_time = float(segment['end_time'])
+                    segment = None
+                    
+                    if items_done:
+                        lo = bisect_left(word_starts, start_time)
+                        hi = bisect_right(word_starts, end_time)
+                        result = build(speaker, start_time, end_time, words[lo:hi])
+                        if result:
+                            yield result
+                    else:
+                        pending_segments.append((speaker, start_time, end_time))
+                continue
+            
+            if segment is not None:
+                # 세그먼트 내부 items 배열은 results.items와 중복이므로 무시
+                if prefix in (segment_prefix + '.speaker_label',
+                              segment_prefix + '.start_time',
+                              segment_prefix + '.end_time'):
+                    segment[prefix.rsplit('.', 1)[1]] = value
+                continue
+            
+            if prefix == 'results.speaker_labels':
+                has_speaker_labels = True
+                continue
+            
+            if prefix == item_prefix:
+                if event == 'start_map':
+                    item = {}
+                elif event == 'end_map':
+                    item_type = item.get('type')
+                    content = item.get('content', '')
+                    
+                    if item_type == 'punctuation':
+                        if pending_segments:
+                            if last_assigned and current_words:
+                                current_words[-1] += content
+                        elif words:
+                            words[-1] += content
+                    elif item_type == 'pronunciation':
+                        item_start = float(item.get('start_time') or 0)
+                        
+                        if pending_segments:
+                            # 시간순 병합: 단어가 현재 세그먼트를 지나면 세그먼트 완성
+                            while (next_segment < len(pending_segments) and
+                                   item_start > pending_segments[next_segment][2]):
+                                result = build(*pending_segments[next_segment], current_words)
+                                if result:
+                                    yield result
+                                pending_segments[next_segment] = None
+                                next_segment += 1
+                                current_words = []
+                            
+                            last_assigned = (next_segment < len(pending_segments) and
+                                             item_start >= pending_segments[next_segment][1])
+                            if last_assigned:
+                                current_words.append(content)
+                        else:
+                            words.append(content)
+                            word_starts.append(item_start)
+                    item = None
+                continue
+            
+            if item is not None:
+                if prefix in (item_prefix + '.type', item_prefix + '.start_time'):
+                    item[prefix.rsplit('.', 1)[1]] = value
+                elif prefix == item_prefix + '.alternatives.item.content' and 'content' not in item:
+                    item['content'] = value
+                continue
+            
+            if prefix == 'results.items' and event == 'end_array':
+                items_done = True
+        
+        if not has_speaker_labels:
+            raise Exception("Speaker diarization data not found in transcript")
+        
+        # items 이후 남은 세그먼트 완성
+        while next_segment < len(pending_segments):
+            result = build(*pending_segments[next_segment], current_words)
+            if result:
+                yield result
+            next_segment += 1
+            current_words = []
+    
+    @staticmethod
+    def parse_transcript_data(transcript_data: Dict) -> List[Dict]:
+        """
+        Build speaker-labeled segments from a Transcribe output document.
+        
+        results.items를 한 번만 순회하며 start_time -> 단어 위치 인덱스를 만들고,
+        각 세그먼트는 인덱스 조회로 단어를 찾습니다. 구두점 아이템은 직전 단어에
+        붙입니다. 전체 처리 시간은 트랜스크립트 크기에 선형으로 비례합니다.
+        
+        Args:
+            transcript_data: Parsed Transcribe output JSON
+            
+        Returns:
+            List of dicts with speaker label, text, and timestamps
+        """
+        results = transcript_data['results']
+        
+        # 화자 분리 정보 확인
+        if 'speaker_labels' not in results:
+            raise Exception("Speaker diarization data not found in transcript")
+        
+        speaker_labels = results['speaker_labels']
+        segments = speaker_labels.get('segments', [])
+        speakers = speaker_labels.get('speakers', 0)
+        
+        logger.info(f"Detected {speakers} speakers in the audio")
+        
+        # 단어 인덱스 구성 (items는 시간순으로 정렬되어 있음)
+        words = []        # 구두점이 붙은 단어
+        word_starts = []  # 단어 시작 시간 (범위 검색용)
+        word_index = {}   # start_time 문자열 -> words 위치
+        for result_item in results['items']:
+            content = result_item['alternatives'][0]['content']
+            item_type = result_item.get('type')
+            
+            if item_type == 'punctuation':
+                if words:
+                    words[-1] += content
+                continue
+            if item_type != 'pronunciation':
+                continue
+            
+            item_start = result_item.get('start_time')
+            word_index.setdefault(item_start, len(words))
+            words.append(content)
+            word_starts.append(float(item_start or 0))
+        
+        # 화자별 텍스트 추출
+        speaker_texts = []
+        for segment in segments:
+            speaker = segment['speaker_label']
+            start_time = float(segment['start_time'])
+            end_time = float(segment['end_time'])
+            
+            # 세그먼트 아이템의 start_time으로 단어 찾기
+            segment_words = [
+                words[word_index[item.get('start_time')]]
+                for item in segment.get('items', [])
+                if item.get('start_time') in word_index
+            ]
+            
+            # 대체 방법: start_time과 end_time 범위로 단어 추출
+            if not segment_words:
+                lo = bisect_left(word_starts, start_time)
+                hi = bisect_right(word_starts, end_time)
+                segment_words = words[lo:hi]
+            
+            text = ' '.join(segment_words)
+            
+            if text.strip():
+                speaker_texts.append({
+                    'speaker': speaker,
+                    'text': text.strip(),
+                    'start_time': start_time,
+                    'end_time': end_time
+                })
+        
+        return speaker_texts
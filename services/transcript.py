@@ -0,0 +1,379 @@
+import json
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# 직렬화 형식 식별자 (압축 해제 후 맨 앞 4바이트)
+_MAGIC = b"TRS1"
+
+
+class Transcript:
+    """
+    Compact, column-oriented sequence of speaker segments.
+
+    세그먼트마다 dict를 만드는 대신 화자는 작은 정수 id(array 'H'), 시작/종료 시간은
+    float 배열(array 'd'), 텍스트는 하나의 문자열과 오프셋 배열로 보관합니다.
+    반복하면 기존과 같은 {'speaker', 'text', 'start_time', 'end_time'} dict를 돌려주므로
+    list[dict]를 받던 코드는 그대로 동작합니다. 세그먼트는 시간순이라고 가정합니다.
+    """
+
+    __slots__ = ('speakers', '_speaker_ids', '_starts', '_ends', '_text', '_offsets')
+
+    def __init__(
+        self,
+        speakers: Optional[List[str]] = None,
+        speaker_ids: Optional[array] = None,
+        starts: Optional[array] = None,
+        ends: Optional[array] = None,
+        text: str = "",
+        offsets: Optional[array] = None
+    ):
+        self.speakers = speakers if speakers is not None else []
+        self._speaker_ids = speaker_ids if speaker_ids is not None else array('H')
+        self._starts = starts if starts is not None else array('d')
+        self._ends = ends if ends is not None else array('d')
+        self._text = text
+        # i번째 세그먼트 텍스트는 _text[_offsets[i]:_offsets[i + 1]]
+        self._offsets = offsets if offsets is not None else array('I', [0])
+
+    @classmethod
+    def from_segments(cls, segments: Union["Transcript", Iterable[Dict]]) -> "Transcript":
+        """
+        Build a transcript from speaker segment dicts (list or generator).
+
+        Args:
+            segments: Dicts with speaker, text, start_time and end_time
+
+        Returns:
+            Transcript
+        """
+        if isinstance(segments, Transcript):
+            return segments
+
+        speakers: List[str] = []
+        speaker_index: Dict[str, int] = {}
+        speaker_ids = array('H')
+        starts = array('d')
+        ends = array('d')
+        offsets = array('I', [0])
+        parts: List[str] = []
+        position = 0
+
+        for segment in segments:
+            speaker = segment['speaker']
+            speaker_id = speaker_index.get(speaker)
+            if speaker_id is None:
+                speaker_id = speaker_index[speaker] = len(speakers)
+                speakers.append(speaker)
+            speaker_ids.append(speaker_id)
+            starts.append(segment['start_time'])
+            ends.append(segment['end_time'])
+            parts.append(segment['text'])
+            position += len(segment['text'])
+            offsets.append(position)
+
+        return cls(speakers, speaker_ids, starts, ends, "".join(parts), offsets)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self._starts)):
+            yield self._segment(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self._take(range(start, stop, step))
+            return self._range(start, stop)
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Transcript index out of range")
+        return self._segment(index)
+
+    def __repr__(self) -> str:
+        return f"<Transcript {len(self)} segments, {len(self.speakers)} speakers, {self.duration:.1f}s>"
+
+    @property
+    def duration(self) -> float:
+        """End time of the last segment in seconds."""
+        return max(self._ends) if self._ends else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the column buffers."""
+        return (sum(column.itemsize * len(column) for column in
+                    (self._speaker_ids, self._starts, self._ends, self._offsets)) +
+                sys.getsizeof(self._text))
+
+    def speaker(self, index: int) -> str:
+        """Speaker label of a segment."""
+        return self.speakers[self._speaker_ids[index]]
+
+    def text(self, index: int) -> str:
+        """Text of a segment."""
+        return self._text[self._offsets[index]:self._offsets[index + 1]]
+
+    def speaker_labels(self) -> Iterator[str]:
+        """Speaker label of each segment in order."""
+        speakers = self.speakers
+        return (speakers[speaker_id] for speaker_id in self._speaker_ids)
+
+    def text_lengths(self) -> Iterator[int]:
+        """Character length of each segment text in order."""
+        offsets = self._offsets
+        return (offsets[i + 1] - offsets[i] for i in range(len(self._starts)))
+
+    def between(self, start_time: float, end_time: float) -> "Transcript":
+        """
+        Segments overlapping the time range [start_time, end_time].
+
+        Args:
+            start_time: Range start in seconds
+            end_time: Range end in seconds
+
+        Returns:
+            Transcript slice
+        """
+        hi = bisect_right(self._starts, end_time)
+        lo = bisect_left(self._starts, start_time, 0, hi)
+        # 범위 시작 전에 시작했지만 범위까지 이어지는 세그먼트 포함
+        while lo > 0 and self._ends[lo - 1] >= start_time:
+            lo -= 1
+        return self._range(lo, hi)
+
+    def by_speaker(self, speaker: str) -> "Transcript":
+        """
+        Segments of one speaker.
+
+        Args:
+            speaker: Speaker label (e.g. "spk_0")
+
+        Returns:
+            Transcript containing only that speaker's segments
+        """
+        if speaker not in self.speakers:
+            return Transcript(list(self.speakers))
+        speaker_id = self.speakers.index(speaker)
+        return self._take([i for i, value in enumerate(self._speaker_ids) if value == speaker_id])
+
+    def map_times(self, mapper: Callable[[float, bool], float]) -> "Transcript":
+        """
+        Transcript with start and end times translated by mapper.
+
+        Args:
+            mapper: Callable (seconds, is_end) -> seconds (e.g. audio.original_time_mapper)
+
+        Returns:
+            Transcript sharing speakers and text with new time columns
+        """
+        return Transcript(
+            self.speakers,
+            self._speaker_ids,
+            array('d', (mapper(value, False) for value in self._starts)),
+            array('d', (mapper(value, True) for value in self._ends)),
+            self._text,
+            self._offsets
+        )
+
+    def format_lines(self, template: str = "{speaker}: {text}") -> str:
+        """
+        Join segments into one prompt text, one line per segment.
+
+        Args:
+            template: Line format with {speaker} and {text} fields
+
+        Returns:
+            Formatted text
+        """
+        speakers, text, offsets = self.speakers, self._text, self._offsets
+        return "\n".join(
+            template.format(speaker=speakers[speaker_id], text=text[offsets[i]:offsets[i + 1]])
+            for i, speaker_id in enumerate(self._speaker_ids)
+        )
+
+    def to_list(self) -> List[Dict]:
+        """Segments as a list of dicts."""
+        return list(self)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to compressed bytes (column buffers stored as little-endian).
+
+        Returns:
+            zlib-compressed bytes readable by from_bytes
+        """
+        encoded_text = self._text.encode("utf-8")
+        header = json.dumps({
+            "speakers": self.speakers,
+            "count": len(self),
+            "text_bytes": len(encoded_text)
+        }, ensure_ascii=False).encode("utf-8")
+
+        columns = [self._speaker_ids, self._starts, self._ends, self._offsets]
+        if sys.byteorder == "big":
+            columns = [array(column.typecode, column) for column in columns]
+            for column in columns:
+                column.byteswap()
+
+        return zlib.compress(b"".join([
+            _MAGIC,
+            struct.pack("<I", len(header)),
+            header,
+            *(column.tobytes() for column in columns),
+            encoded_text
+        ]))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Transcript":
+        """
+        Deserialize bytes written by to_bytes.
+
+        압축된 열 단위 JSON({"speakers", "speaker", "start", "end", "text"})으로
+        저장된 이전 형식도 읽습니다.
+
+        Args:
+            data: Serialized transcript
+
+        Returns:
+            Transcript
+        """
+        payload = zlib.decompress(data)
+
+        if not payload.startswith(_MAGIC):
+            columns = json.loads(payload)
+            speakers = columns["speakers"]
+            return cls.from_segments(
+                {'speaker': speakers[speaker], 'text': text, 'start_time': start, 'end_time': end}
+                for speaker, start, end, text in zip(
+                    columns["speaker"], columns["start"], columns["end"], columns["text"]
+                )
+            )
+
+        position = len(_MAGIC)
+        (header_size,) = struct.unpack_from("<I", payload, position)
+        position += 4
+        header = json.loads(payload[position:position + header_size])
+        position += header_size
+
+        count = header["count"]
+        columns = []
+        for typecode, length in (('H', count), ('d', count), ('d', count), ('I', count + 1)):
+            column = array(typecode)
+            size = column.itemsize * length
+            column.frombytes(payload[position:position + size])
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns.append(column)
+            position += size
+
+        text = payload[position:position + header["text_bytes"]].decode("utf-8")
+        speaker_ids, starts, ends, offsets = columns
+        return cls(header["speakers"], speaker_ids, starts, ends, text, offsets)
+
+    def _segment(self, index: int) -> Dict:
+        """Build the dict view of one segment."""
+        return {
+            'speaker': self.speakers[self._speaker_ids[index]],
+            'text': self._text[self._offsets[index]:self._offsets[index + 1]],
+            'start_time': self._starts[index],
+            'end_time': self._ends[index]
+        }
+
+    def _range(self, lo: int, hi: int) -> "Transcript":
+        """Contiguous slice; text is one substring with rebased offsets."""
+        hi = max(lo, hi)
+        base = self._offsets[lo]
+        return Transcript(
+            self.speakers,
+            self._speaker_ids[lo:hi],
+            self._starts[lo:hi],
+            self._ends[lo:hi],
+            self._text[base:self._offsets[hi]],
+            array('I', (offset - base for offset in self._offsets[lo:hi + 1]))
+        )
+
+    def _take(self, indices: Sequence[int]) -> "Transcript":
+        """Transcript of the selected segment indices."""
+        offsets = array('I', [0])
+        parts = []
+        position = 0
+        for i in indices:
+            part = self._text[self._offsets[i]:self._offsets[i + 1]]
+            parts.append(part)
+            position += len(part)
+            offsets.append(position)
+        return Transcript(
+            self.speakers,
+            array('H', (self._speaker_ids[i] for i in indices)),
+            array('d', (self._starts[i] for i in indices)),
+            array('d', (self._ends[i] for i in indices)),
+            "".join(parts),
+            offsets
+        )
+
+
+def stitch_transcripts(parts: Sequence[Tuple["Transcript", float, float, float]]) -> Transcript:
+    """
+    Join transcripts of overlapping audio pieces into one transcript.
+
+    각 조각은 독립적으로 화자 분리되므로 같은 사람이 조각마다 다른 라벨을 가질 수 있습니다.
+    앞 조각과 겹치는 구간에서 동시에 말한 시간이 가장 긴 라벨끼리 짝지어 라벨을 맞추고,
+    짝이 없는 라벨은 새 화자로 추가합니다. 각 조각에서는 시작 시각이
+    [keep_start, keep_end) 안에 있는 세그먼트만 사용합니다.
+
+    Args:
+        parts: (transcript in piece-local time, piece start offset, keep_start, keep_end) in time order
+
+    Returns:
+        Transcript in original recording time with reconciled speaker labels
+    """
+    speakers: List[str] = []
+    previous: List[Tuple[str, float, float]] = []  # 앞 조각의 (전역 라벨, 시작, 종료)
+    stitched: List[Dict] = []
+
+    for index, (transcript, offset, keep_start, keep_end) in enumerate(parts):
+        segments = [
+            (segment['speaker'], segment['start_time'] + offset, segment['end_time'] + offset, segment['text'])
+            for segment in transcript
+        ]
+
+        # 겹친 구간에서 (이번 조각 라벨, 앞 조각 전역 라벨)별로 함께 말한 시간 합산
+        scores: Dict[Tuple[str, str], float] = {}
+        for label, start, end, _ in segments:
+            for global_label, previous_start, previous_end in previous:
+                overlap = min(end, previous_end) - max(start, previous_start)
+                if overlap > 0:
+                    scores[(label, global_label)] = scores.get((label, global_label), 0.0) + overlap
+
+        mapping: Dict[str, str] = {}
+        for (label, global_label), _ in sorted(scores.items(), key=lambda item: -item[1]):
+            if label not in mapping and global_label not in mapping.values():
+                mapping[label] = global_label
+
+        for label, _, _, _ in segments:
+            if label not in mapping:
+                # 첫 조각은 원래 라벨을 유지하고, 이후 새 화자는 사용되지 않은 다음 번호를 받음
+                new_label = label if index == 0 else None
+                number = len(speakers)
+                while new_label is None or new_label in speakers:
+                    new_label = f"spk_{number}"
+                    number += 1
+                mapping[label] = new_label
+            if mapping[label] not in speakers:
+                speakers.append(mapping[label])
+
+        previous = [(mapping[label], start, end) for label, start, end, _ in segments]
+        stitched.extend(
+            {'speaker': mapping[label], 'text': text, 'start_time': round(start, 3), 'end_time': round(end, 3)}
+            for label, start, end, text in segments
+            if keep_start <= start < keep_end
+        )
+
+    return Transcript.from_segments(stitched)
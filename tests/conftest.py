@@ -0,0 +1,13 @@
+import os
+import tempfile
+
+# config.Settings 필수 값 (테스트는 AWS/Notion에 접속하지 않음)
+for name, value in {
+    "S3_BUCKET_NAME": "test-bucket",
+    "NOTION_API_KEY": "test",
+    "NOTION_DATABASE_ID": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+# 설정된 데이터베이스를 건드리지 않도록 항상 임시 SQLite 파일 사용
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='action-test-')}/test.db"
@@ -0,0 +1,46 @@
+import pytest
+
+from database import _async_url, _sync_url
+
+
+@pytest.mark.parametrize("url, sync_driver, async_driver", [
+    ("postgresql://action:pw@localhost/action", "postgresql+psycopg", "postgresql+psycopg"),
+    ("postgresql+psycopg://action:pw@localhost/action", "postgresql+psycopg", "postgresql+psycopg"),
+    ("postgresql+asyncpg://action:pw@localhost/action", "postgresql+psycopg", "postgresql+asyncpg"),
+    ("sqlite:///./action.db", "sqlite", "sqlite+aiosqlite"),
+    ("sqlite+aiosqlite:///./action.db", "sqlite", "sqlite+aiosqlite"),
+])
+def test_database_urls_use_installed_drivers(url, sync_driver, async_driver):
+    assert _sync_url(url).drivername == sync_driver
+    assert _async_url(url).drivername == async_driver
+
+
+def test_since_older_than_pruned_tombstones_requires_reset():
+    from datetime import datetime, timedelta
+
+    from database import (
+        SessionLocal, TaskTombstone, add_task_tombstones, init_db,
+        next_board_version, task_changes_since
+    )
+
+    init_db()
+    db = SessionLocal()
+    try:
+        # 보관 기간이 지난 tombstone 하나를 만든 뒤 새 삭제가 정리하도록 함
+        old_version = next_board_version(db)
+        db.add(TaskTombstone(task_id=1, version=old_version, deleted_at=datetime.utcnow() - timedelta(days=365)))
+        db.commit()
+        since = old_version - 1
+
+        assert task_changes_since(db, since) == ([], [1], False)
+
+        new_version = next_board_version(db)
+        add_task_tombstones(db, [2], new_version)
+        db.commit()
+
+        assert task_changes_since(db, since) == ([], [], True)
+        assert task_changes_since(db, datetime.utcnow() - timedelta(days=400)) == ([], [], True)
+        assert task_changes_since(db, old_version) == ([], [2], False)
+        assert db.query(TaskTombstone.task_id).all() == [(2,)]
+    finally:
+        db.close()
@@ -0,0 +1,159 @@
+import threading
+import time
+
+import pytest
+
+from database import Job, JobStatus, SessionLocal, Task, init_db
+from services.jobs import JobManager
+
+
+class CallbackPipeline:
+    """Pipeline whose transcriptions finish only when the test calls their callbacks."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.lock = threading.Lock()
+
+    def start_transcription(self, s3_uri, job_name, on_done, expected_duration=None):
+        with self.lock:
+            self.callbacks[job_name] = on_done
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def manager():
+    init_db()
+    pipeline = CallbackPipeline()
+    manager = JobManager(pipeline, max_workers=1, session_factory=SessionLocal)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+def test_transcribing_jobs_do_not_hold_workers(manager):
+    job_ids = [manager.create_job(job_name=f"transcription_wait{index}", s3_uri="s3://b/a.mp3") for index in range(3)]
+    for job_id in job_ids:
+        manager.submit(job_id)
+
+    # 워커가 하나뿐이어도 세 작업 모두 Transcribe 작업을 시작함
+    wait_until(lambda: len(manager.pipeline.callbacks) == 3)
+    assert {manager.get_job(job_id)["stage"] for job_id in job_ids} == {"transcribing"}
+
+    for index, job_id in enumerate(job_ids):
+        job_name = f"transcription_wait{index}"
+        if index == 2:
+            manager.pipeline.callbacks[job_name]({'status': 'failed', 'error': 'bad audio'})
+        else:
+            manager.pipeline.callbacks[job_name]({'status': 'success', 'transcript_uri': f"https://t/{job_name}.json"})
+
+    wait_until(lambda: all(manager.get_job(job_id)["status"] in ("completed", "failed") for job_id in job_ids))
+    jobs = [manager.get_job(job_id) for job_id in job_ids]
+    assert [job["status"] for job in jobs] == ["completed", "completed", "failed"]
+    assert jobs[0]["result"]["transcript_uri"] == "https://t/transcription_wait0.json"
+    assert jobs[2]["error"] == "bad audio"
+
+
+class Interrupted(Exception):
+    """Simulates the process dying in the middle of a stage."""
+
+
+class FakeNotion:
+    """Creates pages in memory and dies once after fail_after pages."""
+
+    def __init__(self, fail_after=None):
+        self.pages = []
+        self.fail_after = fail_after
+
+    def create_multiple_tasks(self, action_items):
+        if self.fail_after is not None and len(self.pages) >= self.fail_after:
+            self.fail_after = None
+            raise Interrupted()
+        self.pages.extend(item['task'] for item in action_items)
+        return [
+            {'task': item['task'], 'assignee': item['assignee'], 'result': {'status': 'success'}}
+            for item in action_items
+        ]
+
+
+def run_until_interrupted(pipeline, job_id):
+    """Run a job on a manager that treats the Interrupted error as a shutdown."""
+    manager = JobManager(pipeline, max_workers=1, session_factory=SessionLocal)
+    manager._stopping = True  # 실패 처리 없이 작업을 RUNNING 상태로 남김 (프로세스 종료와 같음)
+    manager._run(job_id)
+    manager.shutdown(wait=True)
+
+
+def action_items(count):
+    return [{'assignee': 'kim', 'task': f"task {index}", 'due_date': None, 'confidence': 0.9} for index in range(count)]
+
+
+def test_resumed_notion_push_skips_created_pages(monkeypatch):
+    from config import settings
+    from services.pipeline import MeetingPipeline
+
+    init_db()
+    monkeypatch.setattr(settings, 'notion_max_concurrency', 2)
+    notion = FakeNotion(fail_after=4)
+    pipeline = MeetingPipeline(None, None, notion)
+    manager = JobManager(pipeline, max_workers=1, session_factory=SessionLocal)
+    job_id = manager.create_job(
+        job_name="transcription_notion", s3_uri="s3://b/a.mp3", destination="notion",
+        transcript_uri="https://t/a.json", summary="s", action_items=action_items(5)
+    )
+
+    run_until_interrupted(pipeline, job_id)
+    assert manager.get_job(job_id)["status"] == "running"
+
+    manager._run(job_id)
+    job = manager.get_job(job_id)
+    assert job["status"] == "completed"
+    assert notion.pages == [f"task {index}" for index in range(5)]
+    assert len(job["result"]["notion_result"]["results"]) == 5
+
+    # 완료 기록 전에 종료된 것처럼 상태만 되돌려도 페이지를 다시 만들지 않음
+    db = SessionLocal()
+    db.query(Job).filter(Job.id == job_id).update({"status": JobStatus.RUNNING})
+    db.commit()
+    db.close()
+    manager._run(job_id)
+    assert len(notion.pages) == 5
+    manager.shutdown(wait=True)
+
+
+def test_resumed_internal_save_does_not_duplicate_tasks():
+    from services.pipeline import MeetingPipeline
+
+    class CrashAfterSave(MeetingPipeline):
+        crashed = False
+
+        def save_internal(self, db, job_name, action_items, before_commit=None):
+            saved = super().save_internal(db, job_name, action_items, before_commit)
+            if not self.crashed:
+                self.crashed = True
+                raise Interrupted()
+            return saved
+
+    init_db()
+    pipeline = CrashAfterSave(None, None, None)
+    manager = JobManager(pipeline, max_workers=1, session_factory=SessionLocal)
+    job_id = manager.create_job(
+        job_name="transcription_internal", s3_uri="s3://b/a.mp3", destination="internal",
+        transcript_uri="https://t/a.json", summary="s", action_items=action_items(3)
+    )
+
+    run_until_interrupted(pipeline, job_id)
+    manager._run(job_id)
+
+    job = manager.get_job(job_id)
+    assert job["status"] == "completed"
+    assert len(job["result"]["saved_tasks"]) == 3
+    db = SessionLocal()
+    assert db.query(Task).filter(Task.job_name == "transcription_internal").count() == 3
+    db.close()
+    manager.shutdown(wait=True)
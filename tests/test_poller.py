@@ -0,0 +1,55 @@
+import threading
+
+from services.poller import TranscriptionPoller
+
+
+class FakeTranscribeClient:
+    """Reports every job as completed and nothing as in progress."""
+
+    def __init__(self):
+        self.list_calls = 0
+
+    def list_transcription_jobs(self, **kwargs):
+        self.list_calls += 1
+        return {'TranscriptionJobSummaries': []}
+
+    def get_transcription_job(self, TranscriptionJobName):
+        return {'TranscriptionJob': {
+            'TranscriptionJobStatus': 'COMPLETED',
+            'Transcript': {'TranscriptFileUri': f"https://example.com/{TranscriptionJobName}.json"}
+        }}
+
+
+def test_track_calls_on_done_without_a_waiting_thread():
+    poller = TranscriptionPoller(FakeTranscribeClient(), min_interval=0.01)
+    results = {}
+    done = threading.Event()
+
+    def on_done(job_name):
+        def callback(result):
+            results[job_name] = result
+            if len(results) == 20:
+                done.set()
+        return callback
+
+    for index in range(20):
+        job_name = f"transcription_{index}"
+        poller.track(job_name, check_now=True, on_done=on_done(job_name))
+
+    assert done.wait(5)
+    assert results["transcription_3"] == {
+        'status': 'success',
+        'transcript_uri': "https://example.com/transcription_3.json",
+        'job_name': "transcription_3"
+    }
+    poller.stop()
+
+
+def test_stop_reports_an_error_to_pending_callbacks():
+    poller = TranscriptionPoller(FakeTranscribeClient(), min_interval=60)
+    results = []
+    poller.track("transcription_pending", expected_duration=600, on_done=results.append)
+
+    poller.stop()
+
+    assert results == [{'status': 'error', 'error': 'Transcription poller stopped'}]
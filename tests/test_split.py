@@ -0,0 +1,168 @@
+import shutil
+import threading
+import wave
+from array import array
+
+import pytest
+
+from config import settings
+from services.audio import split_wav, wav_duration
+from services.stt import TranscriptionService
+from services.transcript import Transcript, stitch_transcripts
+
+
+def segment(speaker, start, end, text=""):
+    return {'speaker': speaker, 'text': text or f"{speaker}@{start}", 'start_time': start, 'end_time': end}
+
+
+def write_wav(path, seconds, rate=16000, channels=1, silences=()):
+    """Write a 16-bit tone with the given (start, end) second ranges silent."""
+    samples = array('h')
+    for index in range(int(seconds * rate)):
+        silent = any(start <= index / rate < end for start, end in silences)
+        samples.extend([0 if silent else (3000 if index % 20 < 10 else -3000)] * channels)
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return path
+
+
+def test_stitch_maps_piece_labels_by_overlap():
+    first = Transcript.from_segments([segment('spk_0', 0.0, 50.0), segment('spk_1', 50.0, 105.0)])
+    # 두 번째 조각은 라벨이 뒤바뀐 채로 화자 분리됨: 겹친 구간의 spk_1이 앞 조각의 spk_1
+    second = Transcript.from_segments([segment('spk_1', 0.0, 15.0), segment('spk_0', 15.0, 100.0)])
+
+    stitched = stitch_transcripts([(first, 0.0, 0.0, 100.0), (second, 90.0, 100.0, 190.0)])
+
+    assert [(s['speaker'], s['start_time'], s['end_time']) for s in stitched] == [
+        ('spk_0', 0.0, 50.0),
+        ('spk_1', 50.0, 105.0),
+        ('spk_2', 105.0, 190.0),
+    ]
+
+
+def test_stitch_keeps_overlap_segments_once():
+    first = Transcript.from_segments([segment('spk_0', 0.0, 8.0), segment('spk_1', 9.0, 11.0, "overlap")])
+    second = Transcript.from_segments([segment('spk_0', 0.0, 2.0, "overlap"), segment('spk_0', 3.0, 9.0)])
+
+    stitched = stitch_transcripts([(first, 0.0, 0.0, 10.0), (second, 9.0, 10.0, 18.0)])
+
+    assert [s['text'] for s in stitched].count("overlap") == 1
+    # 겹친 구간에서 함께 말한 라벨끼리 매칭되어 두 번째 조각의 spk_0은 spk_1이 됨
+    assert [(s['speaker'], s['start_time']) for s in stitched] == [('spk_0', 0.0), ('spk_1', 9.0), ('spk_1', 12.0)]
+
+
+def test_split_wav_cuts_at_silence_with_overlap(tmp_path):
+    source = write_wav(str(tmp_path / "source.wav"), 30, silences=[(11.0, 11.5), (22.0, 22.5)])
+
+    pieces = split_wav(source, str(tmp_path), piece_seconds=10, overlap_seconds=2, search_seconds=3)
+
+    assert len(pieces) == 3
+    assert pieces[0].keep_start == 0.0 and pieces[-1].keep_end == pytest.approx(30.0)
+    for before, after in zip(pieces, pieces[1:]):
+        assert before.keep_end == after.keep_start
+        assert before.end - after.start == pytest.approx(2.0, abs=0.01)
+    assert 11.0 <= pieces[1].keep_start <= 11.5
+    assert 22.0 <= pieces[2].keep_start <= 22.5
+    for piece in pieces:
+        assert wav_duration(piece.path) == pytest.approx(piece.end - piece.start, abs=0.01)
+
+
+def test_split_wav_keeps_short_file_whole(tmp_path):
+    source = write_wav(str(tmp_path / "source.wav"), 12)
+
+    pieces = split_wav(source, str(tmp_path), piece_seconds=10, overlap_seconds=2, search_seconds=3)
+
+    assert [(piece.start, piece.keep_start) for piece in pieces] == [(0.0, 0.0)]
+    assert pieces[0].end == pieces[0].keep_end == pytest.approx(12.0)
+
+
+class FakeS3:
+    def __init__(self, source_path):
+        self.source_path = source_path
+        self.uploaded = []
+        self.deleted = []
+
+    def read_head(self, s3_uri, length):
+        with open(self.source_path, 'rb') as file:
+            return file.read(length)
+
+    def download_file(self, s3_uri, file_path):
+        shutil.copyfile(self.source_path, file_path)
+        return file_path
+
+    def upload_file(self, file_path, object_name):
+        self.uploaded.append(object_name)
+        return f"s3://test-bucket/{object_name}"
+
+    def delete_object(self, object_name):
+        self.deleted.append(object_name)
+
+
+class FakeTranscribeClient:
+    def __init__(self):
+        self.deleted_jobs = []
+
+    def delete_transcription_job(self, TranscriptionJobName):
+        self.deleted_jobs.append(TranscriptionJobName)
+
+
+class PieceTranscriptionService(TranscriptionService):
+    """Finishes each piece job as one segment shortly after it starts and records the peak of running jobs."""
+
+    def __init__(self, s3_service):
+        self.s3_service = s3_service
+        self.client = FakeTranscribeClient()
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def start_transcription(self, audio_file_path, job_name, expected_duration=None, on_done=None):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+        def finish():
+            with self.lock:
+                self.running -= 1
+            on_done({'status': 'success', 'transcript_uri': job_name})
+
+        threading.Timer(0.05, finish).start()
+
+    def parse_transcript_with_speakers(self, transcript_uri):
+        return Transcript.from_segments([segment('spk_0', 1.0, 2.0, transcript_uri)])
+
+
+@pytest.fixture
+def split_settings(monkeypatch):
+    monkeypatch.setattr(settings, 'transcribe_split_enabled', True)
+    monkeypatch.setattr(settings, 'transcribe_split_min_seconds', 20.0)
+    monkeypatch.setattr(settings, 'transcribe_split_piece_seconds', 5.0)
+    monkeypatch.setattr(settings, 'transcribe_split_overlap_seconds', 1.0)
+    monkeypatch.setattr(settings, 'transcribe_split_search_seconds', 1.0)
+    monkeypatch.setattr(settings, 'transcribe_split_max_workers', 2)
+
+
+def test_should_split_reads_duration_from_wav_header(tmp_path, split_settings):
+    # 8kHz 모노 25초는 크기로 추정하면 (44.1kHz 스테레오 기준) 3초 미만
+    long_path = write_wav(str(tmp_path / "long.wav"), 25, rate=8000)
+    short_path = write_wav(str(tmp_path / "short.wav"), 15, rate=8000)
+
+    assert PieceTranscriptionService(FakeS3(long_path)).should_split("s3://test-bucket/audio/long.wav")
+    assert not PieceTranscriptionService(FakeS3(short_path)).should_split("s3://test-bucket/audio/short.wav")
+    assert not PieceTranscriptionService(FakeS3(long_path)).should_split("s3://test-bucket/audio/long.mp3")
+
+
+def test_transcribe_split_caps_workers_and_deletes_pieces(tmp_path, split_settings):
+    s3 = FakeS3(write_wav(str(tmp_path / "source.wav"), 30, rate=8000))
+    service = PieceTranscriptionService(s3)
+
+    transcript = service.transcribe_split("s3://test-bucket/audio/job.wav", "job")
+
+    piece_jobs = [f"job_part{index:03d}" for index in range(6)]
+    assert [s['text'] for s in transcript] == piece_jobs
+    assert service.peak == 2
+    assert sorted(s3.deleted) == sorted(s3.uploaded) == [f"audio/{job}.wav" for job in piece_jobs]
+    assert sorted(service.client.deleted_jobs) == piece_jobs